@@ -56,6 +56,9 @@ def build_exe():
         "--hidden-import", "pygame",
         "--hidden-import", "cv2",
         "--hidden-import", "serial",
+        # main.py가 지연 로딩하는 상태 모듈 (정적 분석에 보이지 않음)
+        "--hidden-import", "ui.game_state",
+        "--hidden-import", "ui.admin_state",
         "--collect-all", "pygame",
         "--collect-all", "cv2",
     ]
@@ -2,11 +2,33 @@
 BASE_W, BASE_H = 1000, 700   # 논리 캔버스 기준
 MIN_W, MIN_H   = 800,  560   # 너무 작게 줄였을 때 하한(선택)
 
+# 화면 출력 방식: "dirty"(바뀐 영역만 display.update) / "flip"(매 프레임 전체 flip)
+PRESENT_MODE = "dirty"
+# 창 크기 조절이 멈춘 뒤 레이아웃/폰트를 다시 만들기까지 대기 시간(ms)
+RESIZE_DEBOUNCE_MS = 200
+
+# 로그 (사용자 데이터 디렉토리/logs/dduddu.log, 크기 기준 회전)
+LOG_LEVEL = "INFO"
+LOG_SAMPLES = False         # 센서 샘플/키 입력마다 DEBUG 로그 (관리자 페이지에서 L로 전환)
+LOG_CONSOLE = True          # 콘솔에도 출력 (백그라운드 스레드에서 씀)
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUPS = 3
+
+# 시작 타임라인(구간별 ms)을 콘솔에 출력 (--startup-profile 인자 또는 DDUDDU_STARTUP_PROFILE=1로도 켤 수 있음)
+STARTUP_PROFILE = False
+
 # 파일 경로 (사용자 데이터 디렉토리 사용)
-from core.settings import get_user_data_dir
-_user_data_dir = get_user_data_dir()
-DATA_FILE = str(_user_data_dir / "leaderboard.json")
-SESSION_FILE = str(_user_data_dir / "session.json")
+# DATA_FILE / SESSION_FILE / LEADERBOARD_DB_FILE은 처음 읽을 때 계산 (import 시점에 디렉토리 작업을 하지 않도록, 아래 __getattr__)
+_USER_FILES = {
+    "DATA_FILE": "leaderboard.json",
+    "SESSION_FILE": "session.json",
+    "LEADERBOARD_DB_FILE": "leaderboard.db",
+}
+
+# 리더보드 저장소: "sqlite"(인덱스 top-k 조회, 처음 실행 시 leaderboard.json을 한 번 가져옴) / "json"(스냅샷 + 추가 전용 저널)
+LEADERBOARD_BACKEND = "sqlite"   # DB 파일은 LEADERBOARD_DB_FILE (사용자 데이터 디렉토리)
+LEADERBOARD_COMPACT_EVERY = 100  # json: 저널이 이 줄 수에 도달하면 스냅샷으로 압축
+LEADERBOARD_WRITE_QUEUE = 64     # 백그라운드 저장 대기열 크기 (가득 차면 호출한 쪽에서 바로 저장)
 
 # 컬러 팔레트
 BG   = (16, 18, 24)
@@ -27,9 +49,32 @@ TXT = 30
 # --- Serial / 초음파 ---
 SERIAL_DEFAULT_PORT = None      # None이면 자동탐색 시도 (예: "/dev/tty.usbmodem1101")
 SERIAL_BAUD = 9600              # 테스트 코드와 일치하도록 9600으로 변경
+SERIAL_BINARY = False           # True면 연결 후 "format:binary" 핸드셰이크로 바이너리 프레임 모드 사용
+CLOCK_SYNC_PING_S = 0.5         # 장치 시계 동기화 ping 간격 (0이면 동기화 끔)
+SERIAL_NO_RESET = True          # 포트를 열 때 DTR을 올리지 않음 (아두이노 자동 리셋/부팅 대기 없음)
+                                # USB 변환 칩 보드(Uno/Nano/Mega, CH340/FTDI/CP210x)에만 적용 - Leonardo/Micro 같은
+                                # 네이티브 USB 보드는 DTR이 있어야 데이터를 보내므로 VID/PID로 구분해 DTR을 올려서 엶
+SERIAL_WATCH_S = 1.0            # 포트 목록 확인 간격 (분리/재연결 감지)
+SERIAL_RECONNECT_MIN_S = 0.5    # 끊긴 뒤 첫 자동 재연결 대기 (실패할 때마다 두 배)
+SERIAL_RECONNECT_MAX_S = 10.0   # 자동 재연결 대기 상한
+SERIAL_STALE_S = 3.0            # ping을 보내는데 이 시간 동안 아무것도 안 오면 끊긴 것으로 봄 (0이면 끔)
 NEAR_THRESHOLD_CM = 5
 NEAR_COOLDOWN_S = 0.6
 
 ARM_ZONE_CM = 28.0     # SPEED 모드: 이 거리 이하로 들어오면 무장(스타트)
 ATTEMPT_GAP_S = 0.7    # 시도 종료 간격(센서 업데이트 끊긴 시간)
 
+# --- 장치 탐색 (저장된 카메라/포트가 안 열릴 때 core/discovery.py) ---
+DISCOVERY_WORKERS = 4               # 동시에 시험할 후보 수
+DISCOVERY_CAMERA_TIMEOUT_S = 3.0    # 카메라 (인덱스, 백엔드) 하나를 열고 첫 프레임까지 기다리는 최대 시간
+DISCOVERY_SERIAL_TIMEOUT_S = 1.5    # 시리얼 후보 하나를 열고 pong을 기다리는 최대 시간
+
+
+def __getattr__(name):
+    # 사용자 데이터 파일 경로는 처음 접근할 때 한 번만 계산해 모듈 속성으로 고정
+    if name in _USER_FILES:
+        from core.settings import get_user_data_dir
+        value = str(get_user_data_dir() / _USER_FILES[name])
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'config' has no attribute {name!r}")
@@ -0,0 +1,160 @@
+# core/camera.py
+# 웹캠 공용 유틸
+# - CameraSource: 전용 스레드에서 캡처하고 가장 최근 프레임만 보관
+# - FramePresenter: 카메라 프레임(BGR ndarray)을 pygame Surface로 변환
+import threading
+import time
+import pygame
+
+from . import clock
+
+try:
+    import cv2 as cv
+    import numpy as np
+except Exception:
+    cv = None
+    np = None
+
+
+class CameraSource:
+    """
+    VideoCapture를 전용 스레드에서 계속 읽어 가장 최근 프레임 하나만 공개합니다.
+    - 렌더/게임 루프는 latest()로 슬롯만 확인하므로 드라이버를 기다리지 않음
+    - 오래된 프레임은 쌓이지 않고 덮어써짐 (드라이버 버퍼도 1장으로 요청)
+    - 버퍼 3개를 돌려 쓰므로 latest()로 받은 프레임은 다음 latest() 호출 전까지 유효
+    """
+
+    FAIL_LIMIT = 30  # 연속 읽기 실패가 이만큼 쌓이면 오류로 표시
+
+    def __init__(self, cap):
+        self.cap = cap
+        self.error = ""
+        self._lock = threading.Lock()
+        self._bufs = [None, None, None]
+        self._published = -1   # 최신 프레임이 들어 있는 버퍼 인덱스
+        self._in_use = -1      # 마지막으로 latest()가 넘겨준 버퍼 인덱스
+        self._ts = 0.0         # 최신 프레임 캡처 시각 (clock.now)
+        self._seq = 0          # 최신 프레임 번호 (새 프레임마다 +1)
+        self._ok = False
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        if self._running:
+            return
+        with self._lock:
+            self._ok = False  # 다시 시작할 때 멈추기 전 프레임을 최신으로 내주지 않도록
+        try:
+            self.cap.set(cv.CAP_PROP_BUFFERSIZE, 1)
+        except Exception:
+            pass
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="camera-capture", daemon=True)
+        self._thread.start()
+
+    def stop(self, release: bool = True):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if release and self.cap is not None:
+            try:
+                self.cap.release()
+            except Exception:
+                pass
+            self.cap = None
+
+    def latest(self):
+        """(frame, 캡처 시각, 프레임 번호) 반환 - 마지막 읽기가 실패했으면 frame은 None"""
+        with self._lock:
+            if not self._ok or self._published < 0:
+                return None, self._ts, self._seq
+            self._in_use = self._published
+            return self._bufs[self._published], self._ts, self._seq
+
+    def _run(self):
+        fails = 0
+        while self._running:
+            with self._lock:
+                # 공개 중이거나 소비자가 들고 있는 버퍼는 피해서 씀
+                idx = next(i for i in range(3) if i != self._published and i != self._in_use)
+            try:
+                ok, frame = self.cap.read(self._bufs[idx])
+            except Exception as e:
+                ok, frame = False, None
+                self.error = f"카메라 읽기 오류: {e}"
+            ts = clock.now()
+
+            if ok and frame is not None:
+                fails = 0
+                with self._lock:
+                    self._bufs[idx] = frame
+                    self._published = idx
+                    self._ts = ts
+                    self._seq += 1
+                    self._ok = True
+                self.error = ""
+            else:
+                fails += 1
+                with self._lock:
+                    self._ok = False
+                if fails >= self.FAIL_LIMIT:
+                    self.error = self.error or "웹캠 프레임을 읽지 못했습니다."
+                time.sleep(0.01)
+
+
+class FramePresenter:
+    """
+    카메라 프레임을 패널 크기의 pygame Surface로 변환합니다.
+    - 색 변환 전에 먼저 패널 크기로 줄이고, 좌우 반전도 같은 cv.remap 한 번에 처리
+    - 중간 버퍼와 결과 Surface는 크기/반전 설정이 바뀔 때만 새로 만들고 매 프레임 재사용
+    - 반환되는 Surface는 내부 버퍼를 공유하므로 다음 present() 호출 전까지만 유효
+    """
+
+    def __init__(self):
+        self._key = None
+        self._map1 = None
+        self._map2 = None
+        self._bgr = None
+        self._rgb = None
+        self._frame_id = None
+        self.surface: pygame.Surface = None
+
+    def _prepare(self, src_size, dst_size, mirror: bool):
+        key = (src_size, dst_size, mirror)
+        if key == self._key:
+            return
+        fw, fh = src_size
+        tw, th = dst_size
+
+        # 목표 픽셀 중심 -> 원본 좌표 (cv.resize의 INTER_LINEAR와 같은 매핑)
+        xs = (np.arange(tw, dtype=np.float32) + 0.5) * (fw / tw) - 0.5
+        ys = (np.arange(th, dtype=np.float32) + 0.5) * (fh / th) - 0.5
+        if mirror:
+            xs = (fw - 1) - xs
+        map_x, map_y = np.meshgrid(xs, ys)
+        # 고정소수점 맵이 float 맵보다 remap이 빠름
+        self._map1, self._map2 = cv.convertMaps(map_x, map_y, cv.CV_16SC2)
+
+        self._bgr = np.empty((th, tw, 3), np.uint8)
+        self._rgb = np.empty((th, tw, 3), np.uint8)
+        # frombuffer는 복사하지 않고 버퍼를 공유 -> _rgb에 쓰면 Surface에 바로 반영
+        self.surface = pygame.image.frombuffer(self._rgb, (tw, th), "RGB")
+        self._key = key
+
+    def present(self, frame, size, mirror: bool = False, frame_id=None) -> pygame.Surface:
+        """
+        frame을 size(w, h)로 리사이즈(+반전)해서 재사용 Surface로 반환
+        frame_id(CameraSource 프레임 번호)가 직전과 같으면 변환을 건너뜀
+        """
+        fh, fw = frame.shape[:2]
+        tw, th = max(1, int(size[0])), max(1, int(size[1]))
+        key = ((fw, fh), (tw, th), mirror)
+        if frame_id is not None and frame_id == self._frame_id and key == self._key:
+            return self.surface
+        self._prepare((fw, fh), (tw, th), mirror)
+        self._frame_id = frame_id
+
+        cv.remap(frame, self._map1, self._map2, cv.INTER_LINEAR, dst=self._bgr)
+        cv.cvtColor(self._bgr, cv.COLOR_BGR2RGB, dst=self._rgb)
+        return self.surface
@@ -0,0 +1,324 @@
+# core/camera_manager.py
+# 프로세스 공용 웹캠 관리자
+# - 장치는 처음 필요할 때 한 번만 열고 앱이 끝날 때까지 유지 (Title→Game→Result 반복 때 다시 탐색하지 않음)
+# - GameState/AdminState는 acquire()로 같은 CameraSource를 받고, 나갈 때 detach()
+#   사용하는 상태가 없으면 캡처 스레드만 멈추고 장치는 열린 채로 둠 (다음 판에 바로 프레임)
+# - 앱 종료 시 shutdown()으로 해제 (main.py, atexit)
+# - 마지막으로 성공한 (인덱스, 백엔드, 해상도/FPS/포맷)을 설정에 저장해 다음 실행 때 그것부터 시도 (빠른 경로)
+#   실패할 때만 백엔드/인덱스 전체 탐색, 시도별 소요 시간은 probes와 probe_stats에 기록 (성공한 결과만 설정 파일에 저장)
+# - 빠른 경로와 전체 탐색 모두 core/discovery.py가 백그라운드에서 (시도마다 제한 시간) - acquire()는 기다리지 않고 None
+import atexit
+import os
+import threading
+from typing import Optional, Tuple
+
+from . import clock
+from .camera import CameraSource
+from .discovery import probe_cameras, release_cameras
+from .log import get_logger
+from .settings import get_camera_index, get_camera_profile, record_probe, set_camera_index, set_camera_profile
+
+try:
+    import cv2 as cv
+except Exception:
+    cv = None
+
+log = get_logger("camera")
+
+
+def default_backends() -> list:
+    """플랫폼별 VideoCapture 백엔드 시도 순서"""
+    if cv is None:
+        return []
+    if os.name == 'nt':  # Windows
+        return [cv.CAP_DSHOW, cv.CAP_MSMF, cv.CAP_ANY]
+    return [cv.CAP_AVFOUNDATION, cv.CAP_V4L2, cv.CAP_ANY]
+
+
+def backend_name(backend) -> str:
+    """백엔드 번호 -> "DSHOW" 같은 이름 (모르면 번호 그대로)"""
+    try:
+        return cv.videoio_registry.getBackendName(backend)
+    except Exception:
+        return str(backend)
+
+
+def fallback_indices() -> list:
+    """저장된 인덱스로 열리지 않을 때 차례로 시도할 인덱스"""
+    return [1, 2, 3, 0] if os.name == 'nt' else [1, 2, 0]
+
+
+def not_found_message() -> str:
+    error_msg = "웹캠을 찾을 수 없습니다."
+    if os.name == 'nt':
+        error_msg += "\n\nWindows 웹캠 문제 해결 방법:"
+        error_msg += "\n1. 웹캠이 다른 프로그램에서 사용 중인지 확인"
+        error_msg += "\n2. 웹캠 드라이버 업데이트"
+        error_msg += "\n3. Windows 설정 > 개인정보 > 카메라 권한 확인"
+        error_msg += "\n4. 웹캠을 물리적으로 연결/재연결"
+        error_msg += "\n5. webcam_test.py 스크립트로 진단 실행"
+    else:
+        error_msg += "\n\nmacOS/Linux 웹캠 문제 해결 방법:"
+        error_msg += "\n1. 웹캠 권한 확인"
+        error_msg += "\n2. 다른 프로그램에서 웹캠 사용 중인지 확인"
+        error_msg += "\n3. webcam_test.py 스크립트로 진단 실행"
+    return error_msg
+
+
+class CameraManager:
+    """
+    열린 장치 하나(cap)와 그 캡처 스레드(source)를 보관
+    - acquire(index=None): 이미 열려 있으면 그대로, 아니면 index(없으면 저장된 값)부터 열기
+    - acquire(index=n): 다른 인덱스가 열려 있으면 닫고 n을 엶 (관리자 화면의 인덱스 전환)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.cap = None
+        self.source: Optional[CameraSource] = None
+        self.index: Optional[int] = None
+        self.backend = None
+        self.size: Optional[Tuple[int, int]] = None   # 실제 해상도
+        self.fps: float = 0.0
+        self.error = ""
+        self.opens = 0       # 실제로 장치를 연 횟수 (진단용)
+        self.open_ms = 0.0   # 마지막 열기에 걸린 시간
+        self._mode = None    # 마지막으로 적용한 (해상도, FPS) 요청
+        self._fourcc: Optional[str] = None   # 열 때 요청할 포맷 (저장된 설정)
+        self.fourcc: Optional[str] = None    # 실제 포맷
+        self.open_path = ""  # "fast"(저장된 설정으로 바로) / "scan"(탐색)
+        self.probes: list = []  # 마지막 열기의 시도 목록 (인덱스, 백엔드, ms, 성공)
+        self.last_scan: list = []  # 마지막 탐색 결과 (CameraProbe, 순위 순, 장치는 닫힌 상태로 기록)
+        self._users = 0
+        self._search = None  # 진행 중인 탐색 (Future, 인덱스 목록, scan, 시작 시각, 저장된 (인덱스, 백엔드))
+
+    @property
+    def is_open(self) -> bool:
+        return self.cap is not None
+
+    @property
+    def searching(self) -> bool:
+        """백그라운드 탐색 중"""
+        return self._search is not None and not self._search[0].done()
+
+    @property
+    def search_done(self) -> bool:
+        """탐색이 끝나 acquire()로 받을 결과가 있음"""
+        return self._search is not None and self._search[0].done()
+
+    # ---- 사용 ----
+    def acquire(self, index: Optional[int] = None, prefer_size=None, fps: Optional[int] = None,
+                scan: bool = True, reopen: bool = False) -> Optional[CameraSource]:
+        """
+        공용 캡처 소스 반환 (실패 시 None, 이유는 error)
+        열린 장치가 없으면 백그라운드로 열기(저장된 설정 -> 탐색)를 시작하고 None - search_done이 되면 다시 호출
+        scan=True면 지정 인덱스가 안 열릴 때 다른 인덱스도 시도
+        """
+        with self._lock:
+            if self.cap is not None and not reopen and (index is None or index == self.index):
+                self._apply_mode(prefer_size, fps)
+            elif self._search is not None and not reopen and (index is None or index == self._search[1][0]):
+                # 탐색 중 - 끝났으면 결과를 받고, 아니면 다음 호출에서 다시 확인
+                if not self._search[0].done() or not self._adopt(prefer_size, fps):
+                    return None
+            else:
+                self._drop_search()
+                self._close()
+                if index is None:
+                    index = get_camera_profile().get("index", get_camera_index())
+                self._open(index, scan)
+                return None
+            self._users += 1
+            self.source.start()  # 멈춰 있었으면 다시 캡처 시작 (장치는 열린 상태)
+            return self.source
+
+    def scan(self):
+        """전체 탐색 (관리자 화면의 S) - 저장된 설정부터 시도하지 않고 후보 인덱스 x 백엔드를 모두 시험
+        열린 장치는 닫음 - 결과는 search_done이 되면 acquire()로 받고, 시도별 결과는 last_scan"""
+        with self._lock:
+            self._drop_search()
+            self._close()
+            self.last_scan = []
+            if cv is None:
+                self.error = "opencv-python이 설치되지 않았습니다"
+                return
+            index = get_camera_profile().get("index", get_camera_index())
+            indices = [index] + [i for i in fallback_indices() if i != index]
+            log.info(f"카메라 전체 탐색: 인덱스 {indices}")
+            self.probes = []
+            self._search = (probe_cameras(indices, default_backends(), complete=True), indices, True, clock.now(), None)
+            self.error = "카메라 찾는 중..."
+
+    def detach(self):
+        """상태가 카메라를 더 쓰지 않음 - 마지막 사용자면 캡처 스레드만 멈춤 (장치는 유지)"""
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users == 0 and self.source is not None:
+                self.source.stop(release=False)
+
+    def close(self):
+        """장치 해제 (관리자 화면의 연결 해제)"""
+        with self._lock:
+            self._drop_search()
+            self._close()
+
+    def shutdown(self):
+        with self._lock:
+            self._users = 0
+            self._drop_search()
+            self._close()
+
+    # ---- 내부 ----
+    def _close(self):
+        if self.source is not None:
+            self.source.stop()  # 스레드 종료 + cap.release()
+        elif self.cap is not None:
+            try:
+                self.cap.release()
+            except Exception:
+                pass
+        self.source = None
+        self.cap = None
+        self.index = None
+        self.backend = None
+        self.size = None
+        self._users = 0
+
+    def _open(self, index: int, scan: bool):
+        """백그라운드로 열기 시작 - 저장된 (인덱스, 백엔드)를 먼저 시험하고, 안 되면 전체 탐색 (결과는 다음 acquire()에서 받음)"""
+        if cv is None:
+            self.error = "opencv-python이 설치되지 않았습니다"
+            return
+        t0 = clock.now()
+        self.probes = []
+        backends = default_backends()
+        profile = get_camera_profile()
+
+        # 빠른 경로: 지난번에 성공한 (인덱스, 백엔드) - 탐색과 같은 제한 시간으로 맨 먼저, 혼자 시도
+        first = None
+        if profile.get("index") == index and profile.get("backend") in backends:
+            first = (index, profile["backend"])
+            log.info(f"저장된 카메라 설정으로 연결 시도: 인덱스 {index}, 백엔드 {profile['backend']}")
+        elif os.name == 'nt':
+            log.info("Windows 환경에서 웹캠 탐색...")
+        else:
+            log.info("macOS/Linux 환경에서 웹캠 탐색...")
+        indices = [index] + ([i for i in fallback_indices() if i != index] if scan else [])
+        self._search = (probe_cameras(indices, backends, first=first), indices, scan, t0, first)
+        self.error = "카메라 찾는 중..."
+
+    def _adopt(self, prefer_size, fps) -> bool:
+        """끝난 탐색 결과에서 가장 좋은 장치를 사용 (나머지는 닫음)"""
+        future, indices, scan, t0, first = self._search
+        self._search = None
+        results = future.result()
+        self.last_scan = [p._replace(cap=None) for p in results]
+        self.probes += [(p.index, p.backend, round(p.ms, 1), p.ok) for p in results]
+        best = next((p for p in results if p.ok), None)
+        release_cameras(results, keep=best.cap if best else None)
+        if best is None:
+            self.open_ms = (clock.now() - t0) * 1000.0
+            record_probe("camera", {"ok": False, "path": "scan", "ms": round(self.open_ms, 1), "tries": len(self.probes)})
+            self.error = not_found_message() if scan else f"카메라 인덱스 {indices[0]}에 연결할 수 없습니다"
+            log.error("모든 카메라 인덱스와 백엔드 시도 실패" if scan else self.error)
+            if scan:
+                log.error("webcam_test.py 스크립트를 실행하여 웹캠 상태를 진단하세요.")
+            return False
+        self.backend = best.backend
+        if (best.index, best.backend) == first:
+            self._setup(best.cap, best.index, "fast", get_camera_profile().get("fourcc"), prefer_size, fps, t0)
+        else:
+            log.info("저장된 카메라 설정 실패 - 탐색으로 찾은 장치 사용" if first else "탐색으로 찾은 장치 사용")
+            self._setup(best.cap, best.index, "scan", None, prefer_size, fps, t0)
+        return True
+
+    def _drop_search(self):
+        """진행 중이거나 받지 않은 탐색 결과 버림 (연 장치는 탐색이 끝나는 대로 닫음)"""
+        if self._search is not None:
+            self._search[0].add_done_callback(lambda f: release_cameras(f.result()))
+            self._search = None
+
+    def _setup(self, cap, index: int, path: str, fourcc: Optional[str], prefer_size, fps, t0: float):
+        self.cap = cap
+        self.index = index
+        self._mode = None
+        self.size = None
+        # 같은 장치면 지난번에 협상된 포맷(fourcc)부터 요청 - 해상도/FPS 협상이 한 번에 끝남
+        self._fourcc = fourcc
+        self._apply_mode(prefer_size, fps)
+        try:
+            cv.utils.logging.setLogLevel(cv.utils.logging.LOG_LEVEL_ERROR)
+        except Exception:
+            pass
+        self.source = CameraSource(cap)
+        self.error = ""
+        self.opens += 1
+        self.open_path = path
+        self.open_ms = (clock.now() - t0) * 1000.0
+        self._save_profile()
+        record_probe("camera", {"ok": True, "path": path, "ms": round(self.open_ms, 1), "tries": len(self.probes)})
+        log.info(f"웹캠 초기화 완료: 인덱스 {index}, 백엔드 {self.backend}, 포맷 {self.fourcc}, "
+                 f"해상도 {self.size[0]}x{self.size[1]}, FPS {self.fps} "
+                 f"({'저장된 설정' if path == 'fast' else '탐색'}, 시도 {len(self.probes)}회, {self.open_ms:.0f}ms)")
+
+    def _save_profile(self):
+        set_camera_index(self.index)  # 인덱스만 보는 곳(관리자 화면 등)도 실제로 연 인덱스를 쓰도록
+        set_camera_profile({
+            "index": self.index,
+            "backend": self.backend,
+            "width": self.size[0],
+            "height": self.size[1],
+            "fps": self.fps,
+            "fourcc": self.fourcc,
+        })
+
+    def _apply_mode(self, prefer_size, fps):
+        """해상도/FPS 요청 - 요청이 없거나 이미 같은 요청을 적용했으면 건너뜀 (장치 재설정은 느림)"""
+        mode = (tuple(prefer_size) if prefer_size else None, fps)
+        if self.size is not None and (mode == self._mode or mode == (None, None)):
+            return
+        cap = self.cap
+        if mode != (None, None):
+            log.info(f"카메라 해상도 설정: {prefer_size}, FPS: {fps}")
+            self._mode = mode
+        if self._fourcc:
+            cap.set(cv.CAP_PROP_FOURCC, cv.VideoWriter_fourcc(*self._fourcc))
+        # Windows에서는 FPS를 먼저, macOS/Linux는 해상도를 먼저 설정
+        if os.name == 'nt' and fps:
+            cap.set(cv.CAP_PROP_FPS, fps)
+        if prefer_size:
+            cap.set(cv.CAP_PROP_FRAME_WIDTH, prefer_size[0])
+            cap.set(cv.CAP_PROP_FRAME_HEIGHT, prefer_size[1])
+        if os.name != 'nt' and fps:
+            cap.set(cv.CAP_PROP_FPS, fps)
+        self.size = (int(cap.get(cv.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv.CAP_PROP_FRAME_HEIGHT)))
+        self.fps = cap.get(cv.CAP_PROP_FPS)
+        self.fourcc = _fourcc_str(cap.get(cv.CAP_PROP_FOURCC))
+
+
+def _fourcc_str(value) -> Optional[str]:
+    """CAP_PROP_FOURCC 값(float) -> "MJPG" 같은 4글자 (알 수 없으면 None)"""
+    try:
+        code = int(value)
+    except (TypeError, ValueError):
+        return None
+    text = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+    return text if code and text.isprintable() and text.strip() else None
+
+
+_manager: Optional[CameraManager] = None
+
+
+def get_camera_manager() -> CameraManager:
+    """프로세스 공용 카메라 관리자 (처음 호출 시 생성)"""
+    global _manager
+    if _manager is None:
+        _manager = CameraManager()
+        atexit.register(_manager.shutdown)
+    return _manager
+
+
+def shutdown():
+    """앱 종료 시 장치 해제 (만든 적 없으면 아무것도 안 함)"""
+    if _manager is not None:
+        _manager.shutdown()
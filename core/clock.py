@@ -0,0 +1,72 @@
+# core/clock.py
+# 게임 공용 시간 기준
+# - now(): 단조 증가 고해상도 시각(초, time.perf_counter) - 경과 시간/판정/타임아웃은 모두 이것으로
+#   벽시계(time.time)는 NTP 동기화로 튀거나 해상도가 낮을 수 있어 기록 측정에 쓰지 않음
+# - wall(): 벽시계(epoch 초) - 화면 표시와 기록 타임스탬프에만 사용
+# - 테스트 훅: use_manual()로 수동 시계로 바꾸고 advance()로 직접 진행 (판정 로직 재현/벤치마크용)
+import time
+from typing import Optional
+
+_now = time.perf_counter
+_wall = time.time
+
+
+def now() -> float:
+    """단조 시각 (초) - 두 값의 차이만 의미가 있음"""
+    return _now()
+
+
+def wall() -> float:
+    """벽시계 시각 (epoch 초) - 표시/기록용"""
+    return _wall()
+
+
+def wall_str(fmt: str = "%H:%M:%S") -> str:
+    """벽시계 시각을 문자열로 (로그/화면 표시용)"""
+    return time.strftime(fmt, time.localtime(_wall()))
+
+
+class ManualClock:
+    """advance()로만 진행하는 시계 (now()는 start부터, wall()은 생성 시점 벽시계부터)"""
+
+    def __init__(self, start: float = 0.0, wall_start: Optional[float] = None):
+        self.t = start
+        self._start = start
+        self._wall_start = time.time() if wall_start is None else wall_start
+
+    def now(self) -> float:
+        return self.t
+
+    def wall(self) -> float:
+        return self._wall_start + (self.t - self._start)
+
+    def advance(self, dt: float) -> float:
+        self.t += dt
+        return self.t
+
+
+_manual: Optional[ManualClock] = None
+
+
+def use_manual(start: float = 0.0, wall_start: Optional[float] = None) -> ManualClock:
+    """모든 now()/wall() 호출을 수동 시계로 바꿈"""
+    global _now, _wall, _manual
+    _manual = ManualClock(start, wall_start)
+    _now = _manual.now
+    _wall = _manual.wall
+    return _manual
+
+
+def use_real():
+    """실제 시계로 되돌림"""
+    global _now, _wall, _manual
+    _manual = None
+    _now = time.perf_counter
+    _wall = time.time
+
+
+def advance(dt: float) -> float:
+    """수동 시계를 dt초 진행 (수동 모드가 아니면 RuntimeError)"""
+    if _manual is None:
+        raise RuntimeError("clock.use_manual()을 먼저 호출하세요")
+    return _manual.advance(dt)
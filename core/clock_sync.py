@@ -0,0 +1,118 @@
+# core/clock_sync.py
+# 아두이노 millis() 시계 <-> 호스트 clock.now() 시계 동기화
+# - "ping" 왕복마다 (보낸 시각, 받은 시각, 장치 millis) 표본을 모음
+# - 왕복 시간(RTT)이 짧은 표본일수록 정확하므로 짧은 것들만 골라 오프셋/드리프트를 직선으로 맞춤
+# - 오차 추정 = 가장 짧은 RTT의 절반 + 직선 맞춤 잔차
+import threading
+from collections import deque
+from typing import Optional
+
+MS_WRAP = 1 << 32  # millis()는 uint32 - 약 49.7일마다 0으로 돌아감
+
+
+class ClockSync:
+    """
+    장치 시각(device_ms)을 호스트 시각(clock.now() 초)으로 바꿉니다.
+    host = ref_host + rate * (device_s - ref_dev)
+    - 표본이 MIN_SAMPLES 미만이면 ready가 False (호출 측은 도착 시각을 그대로 사용)
+    - 장치 시각이 크게 뒤로 가면 장치 재시작으로 보고 표본을 버림
+    """
+
+    WINDOW = 40          # 보관하는 최근 왕복 표본 수
+    MIN_SAMPLES = 3      # 추정을 시작하는 최소 표본 수
+    MIN_SPAN_S = 5.0     # 드리프트를 맞추려면 표본이 이 시간 이상 퍼져 있어야 함
+    MAX_DRIFT = 1e-3     # 드리프트 상한 (1000ppm, 세라믹 공진자도 충분히 포함)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=self.WINDOW)  # (device_s, host_mid, half_rtt)
+        self._last_raw_ms: Optional[int] = None
+        self._wraps = 0
+        self.ref_dev = 0.0
+        self.ref_host = 0.0
+        self.rate = 1.0
+        self.error_s: Optional[float] = None   # 추정 오차 (초)
+        self.min_rtt_s: Optional[float] = None
+        self.ready = False
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._last_raw_ms = None
+            self._wraps = 0
+            self.rate = 1.0
+            self.error_s = None
+            self.min_rtt_s = None
+            self.ready = False
+
+    @property
+    def drift_ppm(self) -> float:
+        return (self.rate - 1.0) * 1e6
+
+    def _unwrap(self, device_ms: int) -> float:
+        """millis() 넘침을 풀어 연속된 초 단위로 변환"""
+        last = self._last_raw_ms
+        if last is not None and device_ms < last:
+            if last - device_ms > MS_WRAP // 2:
+                self._wraps += 1
+            elif last - device_ms > 1000:
+                # 넘침이 아니라 크게 뒤로 감 -> 장치 재시작
+                self._samples.clear()
+                self._wraps = 0
+                self.ready = False
+        self._last_raw_ms = device_ms
+        return (device_ms + self._wraps * MS_WRAP) / 1000.0
+
+    def add_round_trip(self, t_send: float, t_recv: float, device_ms: int) -> bool:
+        """
+        왕복 표본 추가 (t_send/t_recv는 호스트 clock.now(), 전송 시간은 호출 측에서 보정)
+        장치가 응답 시각을 찍은 순간은 [t_send, t_recv] 사이라고 보고 중간값을 사용
+        """
+        rtt = t_recv - t_send
+        if rtt < 0:
+            return False
+        with self._lock:
+            device_s = self._unwrap(int(device_ms))
+            self._samples.append((device_s, (t_send + t_recv) / 2.0, rtt / 2.0))
+            self._refit()
+        return True
+
+    def _refit(self):
+        samples = list(self._samples)
+        if len(samples) < self.MIN_SAMPLES:
+            return
+        # RTT가 짧은 쪽 절반만 사용 (OS 지연/루프 지연이 섞인 표본 제외)
+        best = sorted(samples, key=lambda s: s[2])[:max(self.MIN_SAMPLES, len(samples) // 2)]
+        min_half = best[0][2]
+
+        n = len(best)
+        mean_dev = sum(s[0] for s in best) / n
+        mean_host = sum(s[1] for s in best) / n
+        var_dev = sum((s[0] - mean_dev) ** 2 for s in best)
+        rate = 1.0
+        if n >= 2 and var_dev > 0 and (max(s[0] for s in best) - min(s[0] for s in best)) >= self.MIN_SPAN_S:
+            cov = sum((s[0] - mean_dev) * (s[1] - mean_host) for s in best)
+            rate = min(1.0 + self.MAX_DRIFT, max(1.0 - self.MAX_DRIFT, cov / var_dev))
+
+        resid = [s[1] - (mean_host + rate * (s[0] - mean_dev)) for s in best]
+        rms = (sum(r * r for r in resid) / n) ** 0.5
+
+        self.ref_dev = mean_dev
+        self.ref_host = mean_host
+        self.rate = rate
+        self.min_rtt_s = min_half * 2.0
+        self.error_s = min_half + rms
+        self.ready = True
+
+    def to_host(self, device_ms: int) -> Optional[float]:
+        """장치 millis()를 호스트 clock.now() 시각으로 (준비 전이면 None)"""
+        with self._lock:
+            if not self.ready:
+                return None
+            wraps = self._wraps
+            last = self._last_raw_ms
+            # 마지막 표본 직전의 넘침 구간에서 온 값이면 한 바퀴 덜 셈
+            if last is not None and device_ms > last and device_ms - last > MS_WRAP // 2:
+                wraps -= 1
+            device_s = (device_ms + wraps * MS_WRAP) / 1000.0
+            return self.ref_host + self.rate * (device_s - self.ref_dev)
@@ -0,0 +1,375 @@
+# core/discovery.py
+# 장치 병렬 탐색 (카메라 인덱스/백엔드 조합, 시리얼 포트 후보)
+# - 저장된 장치(빠른 경로)도 같은 방식으로 먼저 시험 - 안 되면 후보를 작은 스레드 풀에서 동시에 시험
+# - 시도마다 제한 시간: 죽은 인덱스에서 VideoCapture가 몇 초씩 멈춰도(DSHOW/MSMF) 시간이 되면 "시간 초과"로 처리
+#   (파이썬 스레드는 강제로 멈출 수 없으므로 그 시도는 버리고, 나중에 끝나면 연 장치를 스스로 닫음)
+# - 시리얼 후보는 "ping"을 보내 "pong"이 오는지로 우리 펌웨어인지 확인
+# - 결과는 concurrent.futures.Future로 반환 - UI 스레드는 기다리지 않고 done()만 확인
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+import config as cfg
+from . import clock
+from .log import get_logger
+from .protocol import BinaryFrameDecoder, SensorSample, StatusMessage, parse_line
+from .serial_reader import LineFramer, read_available
+
+try:
+    from serial import Serial
+    from serial.tools import list_ports
+except Exception:
+    Serial = None
+    list_ports = None
+
+TIMEOUT = "시간 초과"
+SKIPPED = "건너뜀 (같은 장치 시간 초과)"
+
+
+class CameraProbe(NamedTuple):
+    index: int
+    backend: int
+    ok: bool                 # 장치가 열림
+    frame: bool = False      # 프레임까지 읽힘
+    ms: float = 0.0
+    cap: object = None       # 연 장치 (호출한 쪽이 쓰거나 release_cameras로 닫음)
+    error: str = ""
+
+
+class SerialProbe(NamedTuple):
+    port: str
+    ok: bool                 # 포트가 열림
+    pong: bool = False       # ping에 응답 (우리 펌웨어)
+    data: bool = False       # 센서 샘플이 들어옴
+    ms: float = 0.0          # 열기 + 확인에 걸린 시간
+    rtt_ms: Optional[float] = None
+    vid: Optional[int] = None
+    pid: Optional[int] = None
+    serial_number: Optional[str] = None
+    error: str = ""
+
+    @property
+    def verified(self) -> bool:
+        """우리 펌웨어로 확인됨 (pong 또는 센서 샘플) - 열리기만 하는 COM1 같은 포트는 제외"""
+        return self.pong or self.data
+
+
+class _Job:
+    __slots__ = ("args", "group", "deadline", "done", "abandoned", "result", "lock")
+
+    def __init__(self, args, group):
+        self.args = args
+        self.group = group
+        self.deadline = 0.0
+        self.done = False
+        self.abandoned = False
+        self.result = None
+        self.lock = threading.Lock()
+
+
+def _run(jobs: List[_Job], probe: Callable, on_timeout: Callable, on_abandoned: Callable,
+         timeout: float, workers: int, rank: Callable, name: str,
+         enough: Optional[Callable] = None) -> Future:
+    """
+    jobs를 최대 workers개씩 동시에 실행 (같은 group은 한 번에 하나 - 같은 장치를 두 백엔드가 동시에 열지 않음)
+    시도마다 timeout이 지나면 on_timeout(args) 결과로 대신하고, 늦게 끝난 결과는 on_abandoned로 넘겨 정리
+    시간 초과가 난 group의 남은 시도는 건너뜀 (멈춘 장치는 다른 백엔드로도 보통 멈춤)
+    enough(best, 남은 jobs)가 True면 나머지를 기다리지 않고 끝냄 (남은 시도가 best보다 순위가 높을 수 없을 때)
+    """
+    log = get_logger(name)
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+    finished: "queue.Queue[_Job]" = queue.Queue()
+    t_start = clock.now()
+
+    def worker(job: _Job):
+        try:
+            result = probe(*job.args)
+        except Exception as e:
+            result = on_timeout(*job.args)._replace(error=str(e))
+        with job.lock:
+            job.done = True
+            late = job.abandoned
+            job.result = result
+        if late:
+            on_abandoned(result)
+        else:
+            finished.put(job)
+
+    def coordinator():
+        pending = list(jobs)
+        running: List[_Job] = []
+        results = []
+        while pending or running:
+            if enough is not None and results:
+                best = min(results, key=rank)
+                if enough(best, [job.args for job in pending + running]):
+                    break
+            busy = {job.group for job in running}
+            for job in list(pending):
+                if len(running) >= workers:
+                    break
+                if job.group in busy:
+                    continue
+                pending.remove(job)
+                job.deadline = clock.now() + timeout
+                running.append(job)
+                busy.add(job.group)
+                threading.Thread(target=worker, args=(job,), name=f"{name}-probe", daemon=True).start()
+
+            wait = max(0.0, min(job.deadline for job in running) - clock.now())
+            try:
+                job = finished.get(timeout=wait)
+                running.remove(job)
+                results.append(job.result)
+            except queue.Empty:
+                pass
+            now = clock.now()
+            for job in list(running):
+                if now < job.deadline:
+                    continue
+                with job.lock:
+                    if job.done:
+                        continue  # 방금 끝남 - finished 큐에서 받음
+                    job.abandoned = True
+                running.remove(job)
+                results.append(on_timeout(*job.args))
+                log.warning(f"탐색 시간 초과: {job.args[0]} ({timeout:.1f}s)")
+                for other in [j for j in pending if j.group == job.group]:
+                    pending.remove(other)
+                    results.append(on_timeout(*other.args)._replace(error=SKIPPED))
+        # 일찍 끝낸 경우 아직 도는 시도는 버림 (끝나는 대로 on_abandoned가 정리)
+        for job in running:
+            with job.lock:
+                late = job.done
+                job.abandoned = not late
+            if late:
+                on_abandoned(job.result)
+        results.sort(key=rank)
+        log.info(f"탐색 완료: 후보 {len(jobs)}개, {(clock.now() - t_start) * 1000.0:.0f}ms")
+        future.set_result(results)
+
+    threading.Thread(target=coordinator, name=f"{name}-discovery", daemon=True).start()
+    return future
+
+
+# ---------- 카메라 ----------
+def _cv():
+    """OpenCV는 카메라 탐색 때만 import (시리얼 탐색만 쓰는 sensor_hub가 cv2를 끌어오지 않도록)"""
+    try:
+        import cv2
+        return cv2
+    except Exception:
+        return None
+
+
+def _probe_camera(index: int, backend: int) -> CameraProbe:
+    t0 = clock.now()
+    cap = _cv().VideoCapture(index, backend)
+    if not (cap and cap.isOpened()):
+        if cap:
+            cap.release()
+        return CameraProbe(index, backend, False, ms=(clock.now() - t0) * 1000.0, error="열 수 없음")
+    ok, _ = cap.read()  # 열리기만 하고 프레임이 안 나오는 가상/사용 중 장치 구분
+    return CameraProbe(index, backend, True, bool(ok), (clock.now() - t0) * 1000.0, cap)
+
+
+def release_cameras(probes: Iterable[CameraProbe], keep=None):
+    """탐색으로 연 장치 중 keep(쓰기로 한 cap)을 빼고 모두 닫음"""
+    for p in probes:
+        if p.cap is not None and p.cap is not keep:
+            try:
+                p.cap.release()
+            except Exception:
+                pass
+
+
+def probe_cameras(indices: Iterable[int], backends: Iterable[int],
+                  timeout: Optional[float] = None, workers: Optional[int] = None,
+                  first: Optional[Tuple[int, int]] = None, complete: bool = False) -> Future:
+    """
+    (인덱스, 백엔드) 조합을 동시에 시험 -> Future[List[CameraProbe]]
+    순위: 프레임까지 읽힘 > 열림 > first > indices/backends에 준 순서 (먼저 준 것이 우선)
+    first(저장된 인덱스/백엔드)를 주면 그것만 먼저 시험하고, 열리면 다른 조합은 시도하지 않음
+    complete=True면 쓸 장치를 찾아도 모든 조합을 끝까지 시험 (관리자 화면의 진단용 목록)
+    """
+    if _cv() is None:
+        future: Future = Future()
+        future.set_result([])
+        return future
+    timeout_s = timeout or cfg.DISCOVERY_CAMERA_TIMEOUT_S
+    indices, backends = list(dict.fromkeys(indices)), list(backends)
+    pairs = list(itertools.product(indices, backends))
+    if first is not None:
+        first = tuple(first)
+        pairs = [first] + [pair for pair in pairs if pair != first]
+    order = {pair: n for n, pair in enumerate(pairs)}
+
+    def rank(p: CameraProbe):
+        return (not p.frame, not p.ok, order[(p.index, p.backend)])
+
+    def run(pairs) -> Future:
+        return _run(
+            [_Job(pair, group=pair[0]) for pair in pairs], _probe_camera,
+            on_timeout=lambda index, backend: CameraProbe(index, backend, False, ms=timeout_s * 1000.0, error=TIMEOUT),
+            on_abandoned=lambda p: release_cameras([p]),
+            timeout=timeout_s,
+            workers=workers or cfg.DISCOVERY_WORKERS,
+            rank=rank,
+            name="camera",
+            # 프레임이 나온 장치보다 앞 순서의 시도가 모두 끝났으면 충분
+            enough=None if complete else (
+                lambda best, rest: best.frame and all(order[args] > order[(best.index, best.backend)] for args in rest)),
+        )
+
+    if first is None:
+        return run(pairs)
+
+    # 저장된 조합을 혼자 먼저 (다른 장치를 동시에 열지 않음) - 안 열릴 때만 나머지 탐색
+    future = Future()
+    future.set_running_or_notify_cancel()
+
+    def after_first(f: Future):
+        head = f.result()
+        if head and head[0].ok:
+            future.set_result(head)
+            return
+        rest = pairs[1:]
+        if head and head[0].error == TIMEOUT:
+            # 멈춘 장치는 다른 백엔드로도 보통 멈춤 - 같은 인덱스는 건너뜀
+            skipped = [pair for pair in rest if pair[0] == first[0]]
+            head += [CameraProbe(index, backend, False, error=SKIPPED) for index, backend in skipped]
+            rest = [pair for pair in rest if pair[0] != first[0]]
+        if not rest:
+            future.set_result(sorted(head, key=rank))
+            return
+        run(rest).add_done_callback(lambda r: future.set_result(sorted(head + r.result(), key=rank)))
+
+    run([first]).add_done_callback(after_first)
+    return future
+
+
+# ---------- 시리얼 ----------
+def serial_candidates() -> List[str]:
+    """ping으로 확인할 포트 - 이름이 아두이노 같은 포트 + USB 장치(VID가 있는 포트)"""
+    from .sensor_hub import candidate_ports
+    ports = candidate_ports()
+    if list_ports is not None:
+        for info in list_ports.comports():
+            if info.vid is not None and info.device not in ports:
+                ports.append(info.device)
+    return ports
+
+
+# DTR을 내린 채 열기(자동 리셋 막기)는 DTR로 리셋되는 보드 - USB-시리얼 변환 칩을 쓰는 보드(Uno/Nano/Mega)에만
+# 네이티브 USB 보드(ATmega32u4: Leonardo/Micro 등)는 DTR이 올라가야 데이터를 보내므로 그대로 엶
+_BRIDGE_VIDS = {0x0403, 0x1A86, 0x10C4, 0x067B}  # FTDI, WCH(CH340), Silicon Labs(CP210x), Prolific
+_BRIDGE_IDS = {                                  # 아두이노 정품의 16U2 변환 칩 (Uno, Mega 2560)
+    (0x2341, 0x0001), (0x2341, 0x0043), (0x2341, 0x0243), (0x2A03, 0x0043),
+    (0x2341, 0x0010), (0x2341, 0x0042), (0x2341, 0x0242), (0x2A03, 0x0042),
+}
+
+
+def holds_reset(vid: Optional[int], pid: Optional[int]) -> bool:
+    """DTR/RTS를 내린 채 열어도 되는 포트인지 (USB가 아닌 포트는 True)"""
+    if vid is None:
+        return True
+    return vid in _BRIDGE_VIDS or (vid, pid) in _BRIDGE_IDS
+
+
+def port_info(port: str) -> dict:
+    if list_ports is None:
+        return {}
+    try:
+        for info in list_ports.comports():
+            if info.device == port:
+                return {"vid": info.vid, "pid": info.pid, "serial_number": info.serial_number}
+    except Exception:
+        pass
+    return {}
+
+
+def _probe_serial(port: str, baud: int, wait: float, no_reset: bool) -> SerialProbe:
+    t0 = clock.now()
+    info = port_info(port)
+    ser = Serial()
+    ser.port = port
+    ser.baudrate = baud
+    ser.timeout = 0
+    ser.write_timeout = wait
+    if no_reset and holds_reset(info.get("vid"), info.get("pid")):
+        ser.dtr = False
+        ser.rts = False
+    try:
+        ser.open()
+    except Exception as e:
+        return SerialProbe(port, False, ms=(clock.now() - t0) * 1000.0, error=str(e), **info)
+    pong = data = False
+    rtt_ms = None
+    try:
+        ser.reset_input_buffer()
+        framer, binary = LineFramer(), BinaryFrameDecoder()
+        sent = 0.0
+        deadline = t0 + wait
+        while not pong and clock.now() < deadline:
+            if clock.now() - sent >= 0.25:
+                # 부팅 중이면 첫 ping을 놓칠 수 있어 주기적으로 다시 보냄
+                ser.write(b"ping\n")
+                sent = clock.now()
+            chunk = read_available(ser)
+            if not chunk:
+                time.sleep(0.01)
+                continue
+            ts = clock.now()
+            items = [parse_line(line, ts) for line in framer.feed(chunk)] + binary.feed(chunk, ts)
+            for item in items:
+                if isinstance(item, StatusMessage) and item.status == "pong":
+                    pong = True
+                    rtt_ms = (ts - sent) * 1000.0
+                elif isinstance(item, SensorSample):
+                    data = True
+    except Exception as e:
+        return SerialProbe(port, True, pong, data, (clock.now() - t0) * 1000.0, rtt_ms, error=str(e), **info)
+    finally:
+        try:
+            ser.close()
+        except Exception:
+            pass
+    return SerialProbe(port, True, pong, data, (clock.now() - t0) * 1000.0, rtt_ms, **info)
+
+
+def probe_serial(ports: Iterable[str], baud: int, prefer: Optional[dict] = None,
+                 timeout: Optional[float] = None, workers: Optional[int] = None,
+                 no_reset: bool = True) -> Future:
+    """
+    시리얼 후보를 동시에 열어 ping/pong 확인 -> Future[List[SerialProbe]]
+    순위: pong > 샘플 수신 > 열림 > prefer(저장된 VID/PID)와 같은 장치 > ports 순서
+    확인이 끝나면 포트는 닫음 (연결은 SensorHub가 다시 엶 - DTR을 내린 채라 리셋 없음)
+    """
+    ports = list(dict.fromkeys(ports))
+    if Serial is None or not ports:
+        future: Future = Future()
+        future.set_result([])
+        return future
+    timeout_s = timeout or cfg.DISCOVERY_SERIAL_TIMEOUT_S
+    prefer = prefer or {}
+    order = {port: n for n, port in enumerate(ports)}
+
+    def same_device(p: SerialProbe) -> bool:
+        return prefer.get("vid") is not None and (p.vid, p.pid) == (prefer.get("vid"), prefer.get("pid"))
+
+    jobs = [_Job((port, baud, timeout_s * 0.8, no_reset), group=port) for port in ports]
+    return _run(
+        jobs, _probe_serial,
+        on_timeout=lambda port, *_: SerialProbe(port, False, ms=timeout_s * 1000.0, error=TIMEOUT),
+        on_abandoned=lambda p: None,  # 포트는 시도 안에서 닫음
+        timeout=timeout_s,
+        workers=workers or cfg.DISCOVERY_WORKERS,
+        rank=lambda p: (not p.pong, not p.data, not p.ok, not same_device(p), order[p.port]),
+        name="serial",
+        # pong이 온 포트가 저장된 장치(또는 저장된 장치 없음)면 다른 후보는 기다리지 않음
+        enough=lambda best, rest: best.pong and (same_device(best) or prefer.get("vid") is None),
+    )
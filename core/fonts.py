@@ -1,8 +1,12 @@
 # core/fonts.py
 import pygame, os, math
+from collections import OrderedDict
 from .path_utils import get_asset_path, safe_font_load
 
 class FontPack:
+    # 텍스트 Surface 캐시 최대 개수 (한글 글리프 렌더링이 비싸서 같은 문자열은 재사용)
+    TEXT_CACHE_SIZE = 512
+
     def __init__(self, regular, medium, semibold, bold):
         self.regular = regular
         self.medium = medium
@@ -11,10 +15,46 @@ class FontPack:
         # 용도별 프리셋(필요분)
         self.h1 = bold; self.h2 = semibold; self.h3 = medium; self.txt = regular
 
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+    def render(self, role: str, text: str, color, antialias: bool = True) -> pygame.Surface:
+        """
+        role 폰트(h1/h2/h3/txt/regular/...)로 텍스트를 렌더링 (LRU 캐시)
+        반환된 Surface는 공유되므로 blit만 하고 수정하지 말 것
+        """
+        key = (role, text, tuple(color), antialias)
+        surf = self._text_cache.get(key)
+        if surf is not None:
+            self._text_cache.move_to_end(key)
+            return surf
+
+        surf = getattr(self, role).render(text, antialias, color)
+        self._text_cache[key] = surf
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return surf
+
+    def clear_cache(self):
+        self._text_cache.clear()
+
+_current_pack = None
+
+# (경로, 픽셀 크기) -> pygame.font.Font
+# 리사이즈마다 TTF를 다시 열지 않도록 모든 FontPack이 인스턴스를 공유
+# (크기가 12~120으로 클램프되므로 항목 수는 경로당 최대 ~110개)
+_font_pool: dict = {}
+
 def _load(path, size): 
-    return safe_font_load(path, max(10, int(round(size))))
+    px = max(10, int(round(size)))
+    key = (path, px)
+    font = _font_pool.get(key)
+    if font is None:
+        font = safe_font_load(path, px)
+        _font_pool[key] = font
+    return font
 
 def make_fonts(scale: float, cfg):
+    global _current_pack
     # Windows와 macOS/Linux 모두에서 작동하는 경로 사용
     base = get_asset_path("fonts")
     # 새로운 폰트로 변경
@@ -22,10 +62,20 @@ def make_fonts(scale: float, cfg):
     
     # 스케일 적용 (상/하한 클램프)
     clamp = lambda s: max(12, min(120, s*scale))
-    
-    return FontPack(
+
+    fonts = (
         _load(yoon_font, clamp(cfg.TXT)),
         _load(yoon_font, clamp(cfg.H3)),
         _load(yoon_font, clamp(cfg.H2)),
         _load(yoon_font, clamp(cfg.H1)),
     )
+
+    # 크기가 그대로면 기존 팩(과 텍스트 캐시)을 그대로 사용
+    if _current_pack is not None:
+        if (_current_pack.regular, _current_pack.medium, _current_pack.semibold, _current_pack.bold) == fonts:
+            return _current_pack
+        # 이전 크기로 렌더링된 텍스트는 더 이상 쓰지 않음
+        _current_pack.clear_cache()
+    
+    _current_pack = FontPack(*fonts)
+    return _current_pack
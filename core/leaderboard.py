@@ -1,93 +1,118 @@
 # core/leaderboard.py
-import json, os, time
+# 리더보드 공용 API - 실제 저장은 config.LEADERBOARD_BACKEND에 따라 core/leaderboard_store.py의 백엔드가 담당
+# 조회는 프로세스 공용 메모리 캐시(core/leaderboard_cache.py)에서 처리 - 저장 파일이 바뀌지 않았으면 디스크를 읽지 않음
+# 게임 중 기록 저장은 submit_score() - 디스크 쓰기는 백그라운드 스레드(core/leaderboard_writer.py), 종료 시 flush()
+import json, os
 from typing import List, Dict, Optional
-from config import DATA_FILE, SESSION_FILE
+import config as cfg
+from . import clock
+from .leaderboard_cache import CLOSE, FAST, LeaderboardCache
+from .leaderboard_store import JsonStore, SqliteStore, migrate_json
+from .leaderboard_writer import LeaderboardWriter
+from .log import get_logger
+
+log = get_logger("leaderboard")
+
+SAMPLE_SCORES = [
+    {"name":"네오","best_fast_ms":520,"best_close_cm":0.0,"best_score":1800},
+    {"name":"레이","best_fast_ms":600,"best_close_cm":0.8,"best_score":1720},
+    {"name":"아라","best_fast_ms":710,"best_close_cm":1.2,"best_score":1650},
+    {"name":"보","best_fast_ms":540,"best_close_cm":2.5,"best_score":1600},
+    {"name":"민","best_fast_ms":880,"best_close_cm":0.6,"best_score":1500},
+    {"name":"켄","best_fast_ms":760,"best_close_cm":1.0,"best_score":1480},
+]
+
+_store = None
+_cache: Optional[LeaderboardCache] = None
+_writer: Optional[LeaderboardWriter] = None
+
+def get_store():
+    """설정된 백엔드 저장소 (프로세스당 하나, 처음 호출 시 생성)"""
+    global _store
+    if _store is None:
+        backend = getattr(cfg, "LEADERBOARD_BACKEND", "json")
+        if backend == "sqlite":
+            _store = SqliteStore(cfg.LEADERBOARD_DB_FILE)
+            migrate_json(cfg.DATA_FILE, _store, seed=SAMPLE_SCORES)  # 처음 한 번만 실제로 가져옴
+        else:
+            ensure_sample_data()
+            _store = JsonStore(cfg.DATA_FILE, compact_every=getattr(cfg, "LEADERBOARD_COMPACT_EVERY", None))
+    return _store
+
+def get_cache() -> LeaderboardCache:
+    """저장소 위의 메모리 캐시 (프로세스당 하나)"""
+    global _cache
+    if _cache is None:
+        _cache = LeaderboardCache(get_store())
+    return _cache
+
+def get_writer() -> LeaderboardWriter:
+    """백그라운드 저장 스레드 (프로세스당 하나, 첫 저장 때 시작)"""
+    global _writer
+    if _writer is None:
+        _writer = LeaderboardWriter(get_cache(), maxsize=getattr(cfg, "LEADERBOARD_WRITE_QUEUE", None))
+    return _writer
+
+def flush(timeout: Optional[float] = 5.0) -> bool:
+    """대기 중인 기록 저장을 모두 마침 (앱 종료 시)"""
+    if _writer is None:
+        return True
+    return _writer.flush(timeout)
 
 def ensure_sample_data():
-    if os.path.exists(DATA_FILE):
+    if os.path.exists(cfg.DATA_FILE):
         return
-    sample = [
-        {"name":"네오","best_fast_ms":520,"best_close_cm":0.0,"best_score":1800},
-        {"name":"레이","best_fast_ms":600,"best_close_cm":0.8,"best_score":1720},
-        {"name":"아라","best_fast_ms":710,"best_close_cm":1.2,"best_score":1650},
-        {"name":"보","best_fast_ms":540,"best_close_cm":2.5,"best_score":1600},
-        {"name":"민","best_fast_ms":880,"best_close_cm":0.6,"best_score":1500},
-        {"name":"켄","best_fast_ms":760,"best_close_cm":1.0,"best_score":1480},
-    ]
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(sample, f, ensure_ascii=False, indent=2)
+    with open(cfg.DATA_FILE, "w", encoding="utf-8") as f:
+        json.dump(SAMPLE_SCORES, f, ensure_ascii=False, indent=2)
 
 def load_scores() -> List[Dict]:
-    ensure_sample_data()
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_cache().all()
 
 def save_current_player(name: str):
-    with open(SESSION_FILE, "w", encoding="utf-8") as f:
-        json.dump({"player_name": name, "ts": time.time()}, f, ensure_ascii=False, indent=2)
+    with open(cfg.SESSION_FILE, "w", encoding="utf-8") as f:
+        json.dump({"player_name": name, "ts": clock.wall()}, f, ensure_ascii=False, indent=2)
 
-def get_fast_board(data, topk=5):
-    rows = [d for d in data if d.get("best_fast_ms") is not None]
-    rows.sort(key=lambda x: x["best_fast_ms"])
-    return rows[:topk]
+def top_fast(topk=5) -> List[Dict]:
+    """SPEED 상위 topk (캐시의 정렬 목록에서 바로)"""
+    return get_cache().top(FAST, topk)
 
-def get_close_board(data, topk=5):
-    rows = [d for d in data if d.get("best_close_cm") is not None]
-    rows.sort(key=lambda x: x["best_close_cm"])
-    return rows[:topk]
+def top_close(topk=5) -> List[Dict]:
+    """CLOSEST 상위 topk"""
+    return get_cache().top(CLOSE, topk)
+
+def replace_scores(rows: List[Dict]):
+    """전체 기록 교체 (관리자 편집/삭제)"""
+    flush()  # 대기 중인 저장이 교체 뒤에 덮어쓰지 않도록
+    get_store().replace_all(rows)
+    get_cache().invalidate()
 
 def reset_leaderboard():
     """리더보드를 빈 배열로 초기화"""
-    sample = []
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(sample, f, ensure_ascii=False, indent=2)
-    print("[LEADERBOARD] 리더보드가 초기화되었습니다")
+    flush()
+    get_store().replace_all([])
+    get_cache().invalidate()
+    log.info("리더보드가 초기화되었습니다")
+
+def _log_new_records(player_record: Dict, name: str, best_fast_ms: Optional[int], best_close_cm: Optional[float]):
+    """이번 값이 그대로 최고 기록이 되었으면 로그"""
+    if best_fast_ms is not None and player_record.get("best_fast_ms") == best_fast_ms:
+        log.info(f"새로운 SPEED 기록! {name}: {best_fast_ms / 1000.0:.2f}초")
+    if best_close_cm is not None and player_record.get("best_close_cm") == best_close_cm:
+        log.info(f"새로운 CLOSEST 기록! {name}: {best_close_cm}cm")
 
 def save_score(name: str, best_fast_ms: Optional[int] = None, best_close_cm: Optional[float] = None):
-    """새로운 기록을 리더보드에 저장"""
-    # 기존 데이터 로드
-    data = load_scores()
-    
-    # 현재 플레이어의 기존 기록 찾기
-    player_record = None
-    for record in data:
-        if record.get("name") == name:
-            player_record = record
-            break
-    
-    # 새로운 기록 생성 또는 업데이트
-    if player_record is None:
-        # 새로운 플레이어
-        player_record = {
-            "name": name,
-            "best_fast_ms": best_fast_ms,
-            "best_close_cm": best_close_cm,
-            "best_score": 0  # 기본값
-        }
-        data.append(player_record)
-    else:
-        # 기존 플레이어 기록 업데이트
-        if best_fast_ms is not None:
-            if player_record.get("best_fast_ms") is None or best_fast_ms < player_record["best_fast_ms"]:
-                player_record["best_fast_ms"] = best_fast_ms
-                fast_sec = best_fast_ms / 1000.0
-                print(f"[LEADERBOARD] 새로운 SPEED 기록! {name}: {fast_sec:.2f}초")
-        
-        if best_close_cm is not None:
-            if player_record.get("best_close_cm") is None or best_close_cm < player_record["best_close_cm"]:
-                player_record["best_close_cm"] = best_close_cm
-                print(f"[LEADERBOARD] 새로운 CLOSEST 기록! {name}: {best_close_cm}cm")
-    
-    # 점수 계산 (SPEED 모드 기준)
-    if player_record.get("best_fast_ms") is not None:
-        # SPEED 모드 점수: 2000ms 기준으로 계산 (빠를수록 높은 점수)
-        base_score = 2000
-        time_score = max(0, base_score - player_record["best_fast_ms"])
-        player_record["best_score"] = time_score
-    
-    # 데이터 저장
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    
-    print(f"[LEADERBOARD] 기록 저장 완료: {name}")
+    """새로운 기록을 리더보드에 저장 (기존보다 좋은 기록만 반영)"""
+    # 저장소에 upsert한 뒤 바뀐 레코드 하나만 캐시 정렬 목록에 다시 끼움
+    player_record = get_cache().save(name, best_fast_ms, best_close_cm)
+
+    _log_new_records(player_record, name, best_fast_ms, best_close_cm)
+
+    log.info(f"기록 저장 완료: {name}")
+    return player_record
+
+def submit_score(name: str, best_fast_ms: Optional[int] = None, best_close_cm: Optional[float] = None) -> Dict:
+    """save_score의 비동기 버전 - 합친 레코드는 바로 반환/조회 가능, 디스크 쓰기는 백그라운드에서"""
+    player_record = get_writer().submit(name, best_fast_ms, best_close_cm)
+
+    _log_new_records(player_record, name, best_fast_ms, best_close_cm)
     return player_record
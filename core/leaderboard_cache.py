@@ -0,0 +1,137 @@
+# core/leaderboard_cache.py
+# 프로세스 공용 리더보드 메모리 캐시
+# - 저장소를 한 번만 읽어 name -> 레코드 dict와 SPEED/CLOSEST 정렬 목록을 보관
+# - 기록 저장 시에는 바뀐 레코드 하나만 정렬 목록에서 빼고 다시 끼움 (전체 재정렬 없음)
+# - 저장 파일의 (mtime, 크기)가 바뀌었을 때만 다시 읽음 (다른 프로세스의 관리자 편집 등)
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from .leaderboard_store import merge_best
+
+FAST = "best_fast_ms"
+CLOSE = "best_close_cm"
+
+
+class LeaderboardCache:
+    """
+    정렬 목록은 (기록값, 삽입 순번, 이름) 튜플 - 같은 기록이면 먼저 들어온 쪽이 앞 (기존 stable sort와 동일)
+    조회 결과는 복사본이라 호출 측이 고쳐도 캐시는 그대로
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.RLock()
+        self._records: Dict[str, Dict] = {}
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self._sorted: Dict[str, List[Tuple]] = {FAST: [], CLOSE: []}
+        self._sig = None
+        self.reloads = 0  # 디스크에서 다시 읽은 횟수 (진단용)
+
+    # ---- 적재 ----
+    def _ensure(self):
+        sig = self.store.signature()
+        if sig != self._sig:
+            self._rebuild(self.store.load_all())
+            self._sig = sig
+            self.reloads += 1
+
+    def _rebuild(self, rows: List[Dict]):
+        self._records.clear()
+        self._seq.clear()
+        self._next_seq = 0
+        for key in self._sorted:
+            self._sorted[key] = []
+        for r in rows:
+            name = r.get("name")
+            if name is None or name in self._records:
+                continue  # 이름이 겹치면 첫 레코드만 (저장소의 upsert 대상과 동일)
+            self._insert(dict(r))
+        # 삽입 순서대로 넣었으므로 한 번에 정렬 (insort 반복보다 빠름)
+        for key in self._sorted:
+            self._sorted[key].sort()
+
+    def _insert(self, record: Dict, keep_sorted: bool = False):
+        name = record["name"]
+        seq = self._seq.get(name)
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._seq[name] = seq
+        self._records[name] = record
+        for key, lst in self._sorted.items():
+            val = record.get(key)
+            if val is not None:
+                if keep_sorted:
+                    insort(lst, (val, seq, name))
+                else:
+                    lst.append((val, seq, name))
+
+    def _remove(self, name: str):
+        old = self._records.pop(name, None)
+        if old is None:
+            return
+        seq = self._seq[name]
+        for key, lst in self._sorted.items():
+            val = old.get(key)
+            if val is not None:
+                i = bisect_left(lst, (val, seq, name))
+                if i < len(lst) and lst[i][2] == name:
+                    del lst[i]
+
+    # ---- 조회 ----
+    def all(self) -> List[Dict]:
+        with self._lock:
+            self._ensure()
+            order = sorted(self._records, key=self._seq.__getitem__)
+            return [dict(self._records[n]) for n in order]
+
+    def get(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            self._ensure()
+            r = self._records.get(name)
+            return dict(r) if r else None
+
+    def top(self, key: str, k: int) -> List[Dict]:
+        with self._lock:
+            self._ensure()
+            return [dict(self._records[name]) for _, _, name in self._sorted[key][:k]]
+
+    # ---- 갱신 ----
+    def apply(self, record: Dict):
+        """저장소에 반영된 레코드 하나를 캐시에 반영 (해당 이름만 다시 끼움)"""
+        with self._lock:
+            if self._sig is None:
+                self._ensure()  # 아직 읽은 적이 없으면 그냥 전체 적재
+                return
+            self._remove(record["name"])
+            self._insert(dict(record), keep_sorted=True)
+            self._sig = self.store.signature()  # 자기 쓰기 때문에 다시 읽지 않도록
+
+    def save(self, name: str, best_fast_ms=None, best_close_cm=None) -> Dict:
+        """저장소에 upsert하고 결과 레코드만 캐시에 반영 (조회와 겹치지 않도록 한 락 안에서)"""
+        with self._lock:
+            self._ensure()  # 다른 프로세스가 바꾼 내용이 있으면 먼저 반영
+            record = self.store.upsert_best(name, best_fast_ms, best_close_cm)
+            self.apply(record)
+            return dict(record)
+
+    def preview(self, name: str, best_fast_ms=None, best_close_cm=None) -> Dict:
+        """저장소에 쓰기 전에 합친 결과를 캐시에만 먼저 반영 (백그라운드 저장 대기 중에도 조회에 보이도록)"""
+        with self._lock:
+            self._ensure()
+            record = merge_best(self._records.get(name), name, best_fast_ms, best_close_cm)
+            self._remove(name)
+            self._insert(record, keep_sorted=True)
+            return dict(record)
+
+    def sync(self):
+        """저장 파일이 바뀌었으면 지금 다시 읽음 (쓰기 직전에 호출해 다른 프로세스의 변경을 놓치지 않도록)"""
+        with self._lock:
+            self._ensure()
+
+    def invalidate(self):
+        """다음 조회 때 저장소에서 다시 읽음 (전체 교체 후)"""
+        with self._lock:
+            self._sig = None
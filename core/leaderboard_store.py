@@ -0,0 +1,364 @@
+# core/leaderboard_store.py
+# 리더보드 저장소 백엔드 (core/leaderboard.py가 config.LEADERBOARD_BACKEND로 선택)
+# - JsonStore: 기존 leaderboard.json (JSON 배열) 스냅샷 + 추가 전용 저널
+# - SqliteStore: 표준 라이브러리 sqlite3 - name 기본키, 기록 갱신은 UPSERT 한 문장으로 처리
+# top-k/순위 조회는 저장소가 아니라 메모리 캐시(core/leaderboard_cache.py)가 담당 - 저장소는 전체 읽기와 쓰기만
+# 두 백엔드 모두 같은 레코드 dict {"name", "best_fast_ms", "best_close_cm", "best_score"}를 주고받음
+# signature()는 저장 파일의 (mtime, 크기) - 다른 프로세스가 바꿨는지 캐시가 확인하는 데 사용
+import json
+import os
+import sqlite3
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+from .log import get_logger
+from .path_utils import atomic_write, fsync_data
+
+log = get_logger("leaderboard")
+
+SCORE_BASE_MS = 2000  # SPEED 점수 = max(0, 2000 - best_fast_ms) (빠를수록 높은 점수)
+
+
+def score_for(best_fast_ms: Optional[int]) -> int:
+    return max(0, SCORE_BASE_MS - best_fast_ms) if best_fast_ms is not None else 0
+
+
+def _better(new, old) -> bool:
+    return new is not None and (old is None or new < old)
+
+
+def merge_best(old: Optional[Dict], name: str, best_fast_ms: Optional[int] = None,
+               best_close_cm: Optional[float] = None) -> Dict:
+    """기존 레코드(없으면 None)에 새 기록을 합친 레코드 - 더 좋은 기록만 반영"""
+    if old is None:
+        record = {"name": name, "best_fast_ms": best_fast_ms, "best_close_cm": best_close_cm, "best_score": 0}
+    else:
+        record = dict(old)
+        if _better(best_fast_ms, record.get("best_fast_ms")):
+            record["best_fast_ms"] = best_fast_ms
+        if _better(best_close_cm, record.get("best_close_cm")):
+            record["best_close_cm"] = best_close_cm
+    if record.get("best_fast_ms") is not None:
+        record["best_score"] = score_for(record["best_fast_ms"])
+    return record
+
+
+def file_signature(*paths: str) -> tuple:
+    """파일들의 (mtime_ns, 크기) 묶음 - 없는 파일은 None"""
+    sig = []
+    for p in paths:
+        try:
+            st = os.stat(p)
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+class JsonStore:
+    """
+    leaderboard.json 스냅샷 + 추가 전용 저널(leaderboard.json.journal)
+    - 기록 저장은 저널 끝에 레코드 한 줄 추가 + fsync (리더보드 크기와 무관한 고정 비용)
+    - compact_every 줄마다 스냅샷을 임시 파일에 쓰고 os.replace로 원자적으로 교체한 뒤 저널을 새로 시작
+    - 시작 시 상태 = 스냅샷 + 저널 재생 (마지막 줄이 쓰다 만 줄이면 버림)
+    - 저널 첫 줄에 기준 스냅샷의 crc32를 기록 - 스냅샷 교체 직후 전원이 나가도 옛 저널을 다시 적용하지 않음
+    """
+
+    COMPACT_EVERY = 100
+
+    def __init__(self, path: str, compact_every: Optional[int] = None):
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.compact_every = compact_every or self.COMPACT_EVERY
+        self._lock = threading.RLock()
+        self._rows: Optional[List[Dict]] = None
+        self._index: Dict[str, int] = {}     # name -> _rows 위치
+        self._base_crc = 0
+        self._journal_ready = False          # 저널 헤더가 현재 스냅샷 기준인지
+        self._journal_lines = 0
+        self._journal_valid: Optional[int] = None  # 잘라내야 할 깨진 꼬리가 있으면 유효한 길이
+        self._sig = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def signature(self) -> tuple:
+        return file_signature(self.path, self.journal_path)
+
+    # ---- 적재 ----
+    def _load(self):
+        sig = self.signature()
+        if self._rows is not None and sig == self._sig:
+            return
+        try:
+            with open(self.path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            raw = b"[]"
+        self._base_crc = zlib.crc32(raw)
+        self._set_rows(json.loads(raw.decode("utf-8")) if raw.strip() else [])
+
+        self._journal_ready = False
+        self._journal_lines = 0
+        self._journal_valid = None
+        try:
+            with open(self.journal_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        end = data.find(b"\n")
+        if end > 0:
+            try:
+                header = json.loads(data[:end])
+            except ValueError:
+                header = {}
+            if header.get("base") == self._base_crc:
+                self._journal_ready = True
+                pos = end + 1
+                while pos < len(data):
+                    end = data.find(b"\n", pos)
+                    if end < 0:
+                        break  # 줄바꿈 전에 끊긴 마지막 줄
+                    try:
+                        record = json.loads(data[pos:end])
+                    except ValueError:
+                        break
+                    self._apply(record)
+                    self._journal_lines += 1
+                    pos = end + 1
+                if pos < len(data):
+                    # 다음 추가 전에 깨진 꼬리를 잘라냄 (그대로 두면 새 줄이 깨진 줄에 붙음)
+                    self._journal_valid = pos
+                    log.warning("저널 끝의 불완전한 기록 %d바이트 무시", len(data) - pos)
+            else:
+                log.info("이전 스냅샷 기준 저널 무시 (압축 직후 종료된 경우)")
+        self._sig = self.signature()
+
+    def _set_rows(self, rows: List[Dict]):
+        self._rows = []
+        self._index = {}
+        for r in rows:
+            self._rows.append(r)
+            name = r.get("name")
+            if name is not None and name not in self._index:
+                self._index[name] = len(self._rows) - 1
+
+    def _apply(self, record: Dict):
+        i = self._index.get(record["name"])
+        if i is None:
+            self._index[record["name"]] = len(self._rows)
+            self._rows.append(record)
+        else:
+            self._rows[i] = record
+
+    def load_all(self) -> List[Dict]:
+        with self._lock:
+            self._load()
+            return [dict(r) for r in self._rows]
+
+    # ---- 쓰기 ----
+    def _append(self, record: Dict):
+        if not self._journal_ready:
+            atomic_write(self.journal_path, self._journal_header())
+            self._journal_ready = True
+            self._journal_lines = 0
+            self._journal_valid = None
+        elif self._journal_valid is not None:
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(self._journal_valid)
+            self._journal_valid = None
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            fsync_data(f.fileno())
+        self._journal_lines += 1
+
+    def _journal_header(self) -> bytes:
+        return (json.dumps({"base": self._base_crc}) + "\n").encode("utf-8")
+
+    def compact(self):
+        """현재 상태를 새 스냅샷으로 쓰고 저널을 비움"""
+        with self._lock:
+            if self._rows is None:
+                self._load()
+            data = json.dumps(self._rows, ensure_ascii=False, indent=2).encode("utf-8")
+            atomic_write(self.path, data)
+            self._base_crc = zlib.crc32(data)
+            atomic_write(self.journal_path, self._journal_header())
+            self._journal_ready = True
+            self._journal_lines = 0
+            self._journal_valid = None
+            self._sig = self.signature()
+
+    def replace_all(self, rows: Iterable[Dict]):
+        with self._lock:
+            self._set_rows([dict(r) for r in rows])
+            self.compact()
+
+    def upsert_best(self, name: str, best_fast_ms: Optional[int] = None,
+                    best_close_cm: Optional[float] = None) -> Dict:
+        with self._lock:
+            self._load()
+            i = self._index.get(name)
+            record = merge_best(self._rows[i] if i is not None else None, name, best_fast_ms, best_close_cm)
+            self._append(record)
+            self._apply(record)
+            if self._journal_lines >= self.compact_every:
+                self.compact()
+            self._sig = self.signature()
+            return dict(record)
+
+    def close(self):
+        with self._lock:
+            if self._journal_lines:
+                self.compact()
+
+
+class SqliteStore:
+    """
+    sqlite3 파일 하나에 기록을 저장합니다.
+    - name이 기본키 (기록 갱신 시 이름으로 바로 찾음)
+    - upsert_best()는 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 더 좋은 기록만 반영
+    - 연결 하나를 락으로 보호해 여러 스레드에서 사용 가능
+    """
+
+    COLUMNS = "name, best_fast_ms, best_close_cm, best_score"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            c = self._conn
+            c.execute("PRAGMA journal_mode=WAL")
+            c.execute("PRAGMA synchronous=NORMAL")
+            c.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                " name TEXT PRIMARY KEY,"
+                " best_fast_ms INTEGER,"
+                " best_close_cm REAL,"
+                " best_score INTEGER NOT NULL DEFAULT 0)"
+            )
+            c.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def signature(self) -> tuple:
+        # WAL 모드에서는 커밋이 -wal 파일에 먼저 쌓이므로 함께 확인
+        return file_signature(self.path, self.path + "-wal")
+
+    # ---- 메타 ----
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO meta(key, value) VALUES(?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    # ---- 조회 ----
+    def _rows(self, sql: str, args=()) -> List[Dict]:
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(sql, args).fetchall()]
+
+    def load_all(self) -> List[Dict]:
+        return self._rows(f"SELECT {self.COLUMNS} FROM scores ORDER BY rowid")
+
+    # ---- 쓰기 ----
+    # 새 값이 있고 기존보다 작을 때만 교체, best_score는 최종 best_fast_ms로 다시 계산
+    _UPSERT = f"""
+        INSERT INTO scores(name, best_fast_ms, best_close_cm, best_score)
+        VALUES(:name, :fast, :close, CASE WHEN :fast IS NULL THEN 0 ELSE MAX(0, {SCORE_BASE_MS} - :fast) END)
+        ON CONFLICT(name) DO UPDATE SET
+            best_fast_ms = CASE WHEN excluded.best_fast_ms IS NOT NULL
+                                 AND (best_fast_ms IS NULL OR excluded.best_fast_ms < best_fast_ms)
+                                THEN excluded.best_fast_ms ELSE best_fast_ms END,
+            best_close_cm = CASE WHEN excluded.best_close_cm IS NOT NULL
+                                  AND (best_close_cm IS NULL OR excluded.best_close_cm < best_close_cm)
+                                 THEN excluded.best_close_cm ELSE best_close_cm END,
+            best_score = CASE WHEN COALESCE(MIN(excluded.best_fast_ms, best_fast_ms), excluded.best_fast_ms, best_fast_ms) IS NULL
+                              THEN best_score
+                              ELSE MAX(0, {SCORE_BASE_MS} - COALESCE(MIN(excluded.best_fast_ms, best_fast_ms), excluded.best_fast_ms, best_fast_ms))
+                         END
+    """
+
+    def upsert_best(self, name: str, best_fast_ms: Optional[int] = None,
+                    best_close_cm: Optional[float] = None) -> Dict:
+        with self._lock:
+            c = self._conn
+            c.execute(self._UPSERT, {"name": name, "fast": best_fast_ms, "close": best_close_cm})
+            row = c.execute(f"SELECT {self.COLUMNS} FROM scores WHERE name = ?", (name,)).fetchone()
+        return dict(row)
+
+    def replace_all(self, rows: Iterable[Dict]):
+        """전체 교체 (관리자 편집/초기화용) - 한 트랜잭션"""
+        rows = list(rows)
+        with self._lock:
+            c = self._conn
+            c.execute("BEGIN")
+            try:
+                c.execute("DELETE FROM scores")
+                c.executemany(
+                    "INSERT INTO scores(name, best_fast_ms, best_close_cm, best_score) VALUES(?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET best_fast_ms = excluded.best_fast_ms, "
+                    "best_close_cm = excluded.best_close_cm, best_score = excluded.best_score",
+                    [(r.get("name"), r.get("best_fast_ms"), r.get("best_close_cm"), r.get("best_score") or 0)
+                     for r in rows if r.get("name") is not None],
+                )
+                c.execute("COMMIT")
+            except Exception:
+                c.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def migrate_json(json_path: str, store: SqliteStore, seed: Optional[List[Dict]] = None) -> int:
+    """
+    leaderboard.json -> SQLite 한 번만 가져오기 (meta에 완료 표시, 원본 파일은 그대로 둠)
+    JSON이 없는 새 설치면 seed(샘플 데이터)를 넣음. 가져온 행 수 반환
+    """
+    if store.get_meta("migrated_from_json") is not None:
+        return 0
+
+    rows: List[Dict] = []
+    source = ""
+    if os.path.exists(json_path):
+        try:
+            loaded = JsonStore(json_path).load_all()  # 저널에만 있는 기록까지 포함
+            rows = [r for r in loaded if isinstance(r, dict) and r.get("name") is not None]
+            source = json_path
+        except Exception as e:
+            log.error(f"leaderboard.json 읽기 실패 - 가져오기 건너뜀: {e}")
+            return 0
+    elif seed:
+        rows = list(seed)
+        source = "(sample)"
+
+    # 같은 이름이 여러 번 있으면 더 좋은 기록만 남김 (best_score 등 기존 값은 그대로 보존)
+    merged: Dict[str, Dict] = {}
+    for r in rows:
+        cur = merged.get(r["name"])
+        if cur is None:
+            merged[r["name"]] = dict(r)
+            continue
+        if _better(r.get("best_fast_ms"), cur.get("best_fast_ms")):
+            cur["best_fast_ms"] = r["best_fast_ms"]
+            cur["best_score"] = score_for(r["best_fast_ms"])
+        if _better(r.get("best_close_cm"), cur.get("best_close_cm")):
+            cur["best_close_cm"] = r["best_close_cm"]
+    if store.load_all():
+        for r in merged.values():
+            store.upsert_best(r["name"], r.get("best_fast_ms"), r.get("best_close_cm"))
+    else:
+        store.replace_all(merged.values())
+    store.set_meta("migrated_from_json", source)
+    if rows:
+        log.info(f"리더보드 {len(rows)}건을 SQLite로 가져옴: {source}")
+    return len(rows)
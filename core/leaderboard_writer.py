@@ -0,0 +1,113 @@
+# core/leaderboard_writer.py
+# 리더보드 백그라운드 저장 스레드
+# - 게임 루프는 submit()으로 큐에 넣기만 함 - 합친 결과는 캐시에 바로 반영되어 결과/타이틀 화면에서 즉시 보임
+# - 실제 디스크 쓰기(JSON 저널 fsync / SQLite 커밋)는 이 스레드가 순서대로 처리
+# - 큐는 크기 제한 - 가득 차면 기록을 버리지 않고 호출한 스레드에서 직접 저장
+# - flush()는 큐가 빌 때까지 대기 (종료 시 main.py와 atexit에서 호출)
+import atexit
+import queue
+import threading
+from typing import Dict, Optional
+
+from . import clock
+from .leaderboard_cache import LeaderboardCache
+from .log import get_logger
+
+log = get_logger("leaderboard")
+
+_STOP = object()
+
+
+class LeaderboardWriter:
+    """
+    저장 요청 (name, best_fast_ms, best_close_cm)을 한 스레드에서 순서대로 cache.save
+    저장이 끝나면 cache.apply로 캐시의 서명도 갱신되므로 자기 쓰기 때문에 다시 읽지 않음
+    """
+
+    MAXSIZE = 64
+
+    def __init__(self, cache: LeaderboardCache, maxsize: Optional[int] = None):
+        self.cache = cache
+        self._q: "queue.Queue" = queue.Queue(maxsize=maxsize or self.MAXSIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.written = 0    # 저장 완료 수 (진단용)
+        self.failed = 0
+        self.overflow = 0   # 큐가 가득 차 호출 측에서 직접 저장한 수
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def submit(self, name: str, best_fast_ms=None, best_close_cm=None) -> Dict:
+        """저장 예약 - 합친 레코드를 바로 반환 (디스크를 기다리지 않음)"""
+        record = self.cache.preview(name, best_fast_ms, best_close_cm)
+        self.start()
+        try:
+            self._q.put_nowait((name, best_fast_ms, best_close_cm))
+        except queue.Full:
+            self.overflow += 1
+            log.warning("저장 대기열이 가득 차 바로 저장합니다: %s", name)
+            self._write(name, best_fast_ms, best_close_cm)
+        return record
+
+    def _write(self, name, best_fast_ms, best_close_cm):
+        try:
+            self.cache.save(name, best_fast_ms, best_close_cm)
+            self.written += 1
+        except Exception as e:
+            self.failed += 1
+            log.error(f"리더보드 저장 실패: {name}: {e}")
+
+    def _run(self):
+        while True:
+            item = self._q.get()
+            try:
+                if item is _STOP:
+                    return
+                if isinstance(item, threading.Event):
+                    item.set()  # flush 표시
+                    continue
+                t0 = clock.now()
+                self._write(*item)
+                log.debug("기록 저장 %.1fms: %s", (clock.now() - t0) * 1000.0, item[0])
+            finally:
+                self._q.task_done()
+
+    @property
+    def pending(self) -> int:
+        return self._q.unfinished_tasks
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """대기 중인 저장이 모두 끝날 때까지 대기 - 시간 안에 끝나면 True"""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return self.pending == 0
+        # 큐 끝에 표시를 넣고 스레드가 거기까지 처리하기를 기다림 (앞선 요청은 모두 끝난 상태)
+        done = threading.Event()
+        try:
+            self._q.put(done, timeout=timeout)
+        except queue.Full:
+            done = None
+        if done is None or not done.wait(timeout):
+            log.warning("저장되지 않은 기록 %d개가 남아 있습니다", self.pending)
+            return False
+        return True
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """남은 저장을 마치고 스레드 종료"""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self.flush(timeout)
+            try:
+                self._q.put(_STOP, timeout=timeout)
+            except queue.Full:
+                return
+            thread.join(timeout)
+            self._thread = None
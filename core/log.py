@@ -0,0 +1,94 @@
+# core/log.py
+# 서브시스템별 로거 (serial / camera / game / leaderboard / admin / settings)
+# - 게임 루프는 QueueHandler로 큐에 넣기만 하고, 파일/콘솔 출력은 QueueListener 스레드가 담당
+#   (느린 콘솔이나 리다이렉트된 stdout 때문에 프레임이 멈추지 않도록)
+# - 파일은 사용자 데이터 디렉토리의 logs/dduddu.log에 크기 기준으로 회전
+# - 샘플마다 찍는 로그는 DEBUG 레벨 - 기본은 꺼져 있고 set_sample_logging()으로 실행 중 전환
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+ROOT = "dduddu"
+SUBSYSTEMS = ("serial", "camera", "game", "leaderboard", "admin", "settings")
+
+LOG_FILE_NAME = "dduddu.log"
+FILE_FORMAT = "%(asctime)s.%(msecs)03d %(levelname)-5s [%(name)s] %(message)s"
+CONSOLE_FORMAT = "[%(name)s] %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_base_level = logging.INFO
+_sample_logging = False
+
+
+def get_logger(subsystem: str) -> logging.Logger:
+    """서브시스템 로거 (예: get_logger("serial") -> "dduddu.serial")"""
+    return logging.getLogger(f"{ROOT}.{subsystem}")
+
+
+def setup(level: str = "INFO", samples: bool = False, console: bool = True,
+          max_bytes: int = 1_000_000, backups: int = 3):
+    """앱 시작 시 한 번 호출 - 큐 핸들러와 백그라운드 출력 스레드 구성"""
+    global _listener, _base_level
+    if _listener is not None:
+        return
+    _base_level = getattr(logging, str(level).upper(), logging.INFO)
+
+    handlers = []
+    try:
+        from .settings import get_user_data_dir
+        log_dir = get_user_data_dir() / "logs"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / LOG_FILE_NAME, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+        file_handler.setFormatter(logging.Formatter(FILE_FORMAT, DATE_FORMAT))
+        handlers.append(file_handler)
+    except Exception as e:
+        print(f"[LOG] 로그 파일을 열 수 없습니다: {e}")
+
+    if console:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(console_handler)
+
+    q = queue.SimpleQueue()
+    root = logging.getLogger(ROOT)
+    root.handlers[:] = [logging.handlers.QueueHandler(q)]
+    root.setLevel(_base_level)
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(q, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown)
+
+    set_sample_logging(samples)
+
+
+def shutdown():
+    """큐에 남은 로그를 모두 쓰고 출력 스레드 종료"""
+    global _listener
+    if _listener is None:
+        return
+    try:
+        _listener.stop()
+    except Exception:
+        pass
+    _listener = None
+    for h in logging.getLogger(ROOT).handlers:
+        h.close()
+
+
+def set_sample_logging(enabled: bool):
+    """샘플마다 찍는 DEBUG 로그 켜기/끄기 (서브시스템 로거 레벨만 바꿈)"""
+    global _sample_logging
+    _sample_logging = bool(enabled)
+    for name in SUBSYSTEMS:
+        get_logger(name).setLevel(logging.DEBUG if _sample_logging else _base_level)
+
+
+def sample_logging_enabled() -> bool:
+    return _sample_logging
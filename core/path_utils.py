@@ -104,3 +104,30 @@ def debug_paths():
                 print(f"  읽기 오류: {e}")
     
     print("=== 경로 디버깅 완료 ===\n")
+
+def fsync_data(fd: int):
+    """파일 내용을 디스크에 반영 - 가능하면 fdatasync (메타데이터 갱신 생략)"""
+    if hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+def atomic_write(path: str, data: bytes):
+    """임시 파일에 쓰고 fsync 후 os.replace - 중간에 꺼져도 이전 파일이나 새 파일 중 하나만 남음"""
+    path = os.fspath(path)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    if os.name != "nt":
+        # 이름 변경 자체도 디스크에 남도록 디렉토리 fsync
+        try:
+            fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
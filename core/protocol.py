@@ -0,0 +1,202 @@
+# core/protocol.py
+# 초음파 센서 줄 프로토콜 파서 (GameState/AdminState 공용)
+# - 펌웨어가 실제로 보내는 형식은 미리 컴파일한 정규식으로 바로 처리 (json.loads/예외 없음)
+#   {"cm": 17} / {"near": true, "cm": 4, "ms": 12345} / {"distance": 25, "timestamp": 12345, "unit": "cm"}
+#   cm=25 / Distance: 25 cm / near=true
+# - 그 외 JSON은 일반 경로(json.loads)로 처리
+# 선택적인 바이너리 프레임 모드(BinaryFrameDecoder)는 "format:binary" 핸드셰이크로 전환
+import json
+import re
+import struct
+from typing import List, NamedTuple, Optional, Union
+
+
+class SensorSample(NamedTuple):
+    ts: float                         # 호스트 도착 시각 (clock.now)
+    cm: Optional[float]               # 거리 (없으면 None)
+    near: bool = False                # 근접 신호
+    device_ms: Optional[int] = None   # 장치 millis() (보내는 형식에서만)
+    seq: Optional[int] = None         # 장치 시퀀스 번호 (바이너리 모드)
+
+
+class StatusMessage(NamedTuple):
+    ts: float
+    status: str                       # "ready", "pong", "running", "updated", "error" ...
+    data: dict
+
+
+_NUM = r"(-?\d+(?:\.\d+)?)"
+
+_RE_CM = re.compile(r'\{\s*"cm"\s*:\s*' + _NUM + r'\s*\}')
+_RE_NEAR = re.compile(
+    r'\{\s*"near"\s*:\s*true\s*,\s*"(?:cm|distance)"\s*:\s*' + _NUM + r'\s*(?:,\s*"ms"\s*:\s*(\d+)\s*)?\}'
+)
+_RE_DISTANCE = re.compile(
+    r'\{\s*"distance"\s*:\s*' + _NUM + r'\s*(?:,\s*"timestamp"\s*:\s*(\d+)\s*)?(?:,\s*"unit"\s*:\s*"cm"\s*)?\}'
+)
+_RE_TEXT_CM = re.compile(r'cm=\s*' + _NUM)
+_RE_TEXT_DISTANCE = re.compile(r'Distance:\s*' + _NUM)
+
+
+def parse_line(line: str, ts: float) -> Optional[Union[SensorSample, StatusMessage]]:
+    """한 줄을 SensorSample/StatusMessage로 변환 (알 수 없는 형식은 None)"""
+    # --- 가장 흔한 {"cm": N}은 펌웨어 출력 그대로면 슬라이스만으로 처리 ---
+    if line.startswith('{"cm": ') and line.endswith("}"):
+        try:
+            return SensorSample(ts, float(line[7:-1]))
+        except ValueError:
+            pass
+
+    # --- 빠른 경로: 펌웨어가 보내는 고정 형식 (공백 차이 허용) ---
+    m = _RE_CM.fullmatch(line)
+    if m:
+        return SensorSample(ts, float(m.group(1)))
+
+    m = _RE_NEAR.fullmatch(line)
+    if m:
+        device_ms = int(m.group(2)) if m.group(2) else None
+        return SensorSample(ts, float(m.group(1)), True, device_ms)
+
+    m = _RE_DISTANCE.fullmatch(line)
+    if m:
+        device_ms = int(m.group(2)) if m.group(2) else None
+        return SensorSample(ts, float(m.group(1)), False, device_ms)
+
+    if line.startswith("cm="):
+        m = _RE_TEXT_CM.match(line)
+        return SensorSample(ts, float(m.group(1))) if m else None
+
+    if line.startswith("Distance:"):
+        m = _RE_TEXT_DISTANCE.match(line)
+        return SensorSample(ts, float(m.group(1))) if m else None
+
+    if line == "near=true":
+        return SensorSample(ts, None, True)
+
+    # --- 일반 경로: 그 밖의 JSON ---
+    if line.startswith("{"):
+        return _parse_json(line, ts)
+    return None
+
+
+def _parse_json(line: str, ts: float):
+    try:
+        obj = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(obj, dict):
+        return None
+
+    # 거리 키는 "distance"가 "cm"보다 우선 (기존 GameState 동작과 동일)
+    raw = obj.get("distance", obj.get("cm"))
+    cm = None
+    if raw is not None:
+        try:
+            cm = float(raw)
+        except (TypeError, ValueError):
+            cm = None
+
+    near = bool(obj.get("near"))
+    if cm is not None or near:
+        device_ms = obj.get("timestamp", obj.get("ms"))
+        return SensorSample(ts, cm, near, int(device_ms) if isinstance(device_ms, (int, float)) else None)
+
+    if "status" in obj:
+        return StatusMessage(ts, str(obj["status"]), obj)
+    return None
+
+
+# ---------- 바이너리 프레임 모드 ----------
+# 고정 11바이트, 리틀 엔디언
+#   [0]    sync 0xA5
+#   [1:3]  seq (uint16, 프레임마다 +1, 0xFFFF 다음은 0)
+#   [3:7]  device_ms (uint32, 장치 millis())
+#   [7:9]  distance_mm (uint16, 0xFFFF = 측정 실패)
+#   [9]    flags (bit0 = near, bit1 = ping 응답 - distance 없음)
+#   [10]   checksum ([1:10] 바이트 합 & 0xFF)
+BINARY_SYNC = 0xA5
+BINARY_FRAME = struct.Struct("<BHIHBB")
+BINARY_FRAME_SIZE = BINARY_FRAME.size
+BINARY_NO_DISTANCE = 0xFFFF
+FLAG_NEAR = 0x01
+FLAG_PONG = 0x02
+
+# 핸드셰이크: 호스트가 이 명령을 보내면 장치가 아래 응답(JSON 한 줄)을 보낸 뒤 바이너리로 전환
+BINARY_HANDSHAKE = b"format:binary\n"
+# 복귀: 포트를 닫기 전에 보냄 (SERIAL_NO_RESET이면 보드가 리셋되지 않아 다음 연결에도 바이너리로 남음)
+TEXT_HANDSHAKE = b"format:text\n"
+
+
+def is_binary_ack(msg) -> bool:
+    """바이너리 전환 응답 {"status": "updated", "format": "binary"} 인지"""
+    return (
+        isinstance(msg, StatusMessage)
+        and msg.status == "updated"
+        and msg.data.get("format") == "binary"
+    )
+
+
+def encode_binary_frame(seq: int, device_ms: int, cm: Optional[float], near: bool = False, flags: int = 0) -> bytes:
+    """펌웨어와 같은 형식으로 프레임 생성 (테스트/시뮬레이터용)"""
+    mm = BINARY_NO_DISTANCE if cm is None or cm < 0 else min(0xFFFE, int(round(cm * 10)))
+    if near:
+        flags |= FLAG_NEAR
+    body = struct.pack("<HIHB", seq & 0xFFFF, device_ms & 0xFFFFFFFF, mm, flags)
+    return bytes([BINARY_SYNC]) + body + bytes([sum(body) & 0xFF])
+
+
+class BinaryFrameDecoder:
+    """
+    바이트 스트림에서 바이너리 프레임을 꺼내 SensorSample로 변환합니다.
+    - sync 바이트로 프레임 경계를 찾고, 체크섬이 틀리면 한 바이트 밀어서 다시 동기화
+    - 시퀀스 번호 공백으로 유실된 샘플 수를 셈 (dropped)
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self.last_seq: Optional[int] = None
+        self.frames = 0     # 정상 프레임 수
+        self.dropped = 0    # 시퀀스 공백으로 추정한 유실 프레임 수
+        self.bad = 0        # 체크섬 오류 수
+
+    def feed(self, data: bytes, ts: float) -> List[Union[SensorSample, StatusMessage]]:
+        buf = self._buf
+        if data:
+            buf += data
+        out = []
+        size = BINARY_FRAME_SIZE
+        unpack_from = BINARY_FRAME.unpack_from
+        new_sample = tuple.__new__  # NamedTuple 생성자(키워드 처리)를 건너뛰는 빠른 생성
+        pos = 0
+        end = len(buf)
+        # 위치만 옮기며 읽고 버퍼 앞부분은 마지막에 한 번만 잘라냄
+        while True:
+            pos = buf.find(BINARY_SYNC, pos)
+            if pos < 0:
+                pos = end
+                break
+            if end - pos < size:
+                break
+
+            if (sum(buf[pos + 1:pos + size - 1]) & 0xFF) != buf[pos + size - 1]:
+                self.bad += 1
+                pos += 1  # 가짜 sync - 다음 sync 후보부터 다시
+                continue
+
+            _, seq, device_ms, mm, flags, _ = unpack_from(buf, pos)
+            pos += size
+
+            if self.last_seq is not None:
+                gap = (seq - self.last_seq - 1) & 0xFFFF
+                if gap < 0x8000:  # 그보다 크면 장치 재시작으로 보고 무시
+                    self.dropped += gap
+            self.last_seq = seq
+            self.frames += 1
+
+            if flags & FLAG_PONG:
+                out.append(StatusMessage(ts, "pong", {"status": "pong", "ms": device_ms, "seq": seq}))
+                continue
+            cm = None if mm == BINARY_NO_DISTANCE else mm / 10.0
+            out.append(new_sample(SensorSample, (ts, cm, bool(flags & FLAG_NEAR), device_ms, seq)))
+        del buf[:pos]
+        return out
@@ -0,0 +1,549 @@
+# core/sensor_hub.py
+# 프로세스 공용 센서(시리얼) 연결
+# - main.py가 첫 화면 뒤에 connect()로 백그라운드 스레드에서 포트를 열고, 앱이 끝날 때까지 유지
+#   (게임마다 포트를 다시 열지 않으므로 아두이노 재부팅/안정화 대기가 없음)
+# - 포트는 DTR을 내린 채로 엶 - 열 때 DTR이 올라가면 아두이노가 자동 리셋됨 (SERIAL_NO_RESET)
+# - main.py가 매 프레임 pump()로 읽기 스레드의 샘플을 꺼내 subscribe()한 상태(Game/Admin)에게 나눠 줌
+#   구독자가 없으면(타이틀/결과 화면) 버림 - 장치 시계 동기화(ping)는 계속 진행
+# - 마지막으로 연결한 장치(포트, VID/PID, 시리얼 번호, baud)를 설정에 저장해 다음에는 그 포트부터 바로 엶
+# - 감시 스레드(start_watch)가 포트 목록을 주기적으로 확인해 분리/응답 없음을 감지하고,
+#   끊기면 저장된 장치 정보로 자동 재연결 (실패할수록 간격을 늘림) - 상태 변화는 LinkEvent로 구독자에게 전달
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import config as cfg
+from . import clock
+from .clock_sync import ClockSync
+from .discovery import holds_reset, port_info, probe_serial, serial_candidates
+from .log import get_logger
+from .protocol import TEXT_HANDSHAKE, parse_line
+from .serial_reader import SerialReader
+from .settings import get_serial_port, get_serial_profile, record_probe, set_serial_port, set_serial_profile
+
+try:
+    from serial import Serial
+    from serial.tools import list_ports
+    import glob
+except Exception:
+    Serial = None
+    list_ports = None
+    glob = None
+
+log = get_logger("serial")
+
+# 연결 상태
+DISCONNECTED = "disconnected"
+CONNECTING = "connecting"
+CONNECTED = "connected"
+
+
+class LinkEvent(NamedTuple):
+    ts: float
+    kind: str                 # "connecting" / "connected" / "lost" / "unplugged" / "failed" / "retry" / "disconnected"
+    port: Optional[str]
+    message: str = ""
+    retry_in: Optional[float] = None   # 다음 자동 재연결까지 남은 초 (예약된 경우)
+
+
+# 화면 표시용 이름
+LINK_LABELS = {
+    "connecting": "연결 중",
+    "connected": "연결됨",
+    "lost": "연결 끊김",
+    "unplugged": "장치 분리",
+    "failed": "연결 실패",
+    "retry": "자동 재연결",
+    "disconnected": "연결 해제",
+}
+
+
+def candidate_ports() -> List[str]:
+    """아두이노일 가능성이 있는 시리얼 포트 목록"""
+    if list_ports is None:
+        return []
+
+    ports = []
+
+    # macOS에서 glob 패턴으로 USB 시리얼 포트 찾기
+    if glob is not None:
+        try:
+            ports.extend(glob.glob('/dev/tty.usbmodem*'))
+            ports.extend(glob.glob('/dev/tty.usbserial*'))
+        except Exception:
+            pass
+
+    # Windows/Linux에서 포트 찾기
+    for p in list_ports.comports():
+        name = p.device
+        if "usbmodem" in name or "usbserial" in name or name.startswith("COM"):
+            if name not in ports:
+                ports.append(name)
+
+    return sorted(set(ports))
+
+
+class SensorHub:
+    """
+    시리얼 포트 하나 + 읽기 스레드(SerialReader) + 장치 시계 동기화(ClockSync)를 보관
+    - connect()/disconnect()는 바로 반환 (열기는 백그라운드 스레드) - 상태는 state/error로 확인
+    - 구독 콜백은 pump()를 호출한 스레드(게임 루프)에서 샘플 도착 순서대로 불림
+    - connect() 뒤 disconnect() 전까지는 연결을 유지하려 함 - 끊기면 감시 스레드가 retry_min부터 두 배씩
+      (최대 retry_max) 간격으로 다시 연결, 저장된 장치가 다시 꽂히면 바로 시도
+    """
+
+    def __init__(self, baud: int = 9600, ping_interval: float = 0.5, binary: bool = False,
+                 no_reset: bool = True, retry_min: float = 0.5, retry_max: float = 10.0,
+                 stale_s: float = 3.0, watch_interval: float = 1.0):
+        self.baud = baud
+        self.ping_interval = ping_interval
+        self.binary = binary
+        self.no_reset = no_reset
+        self.retry_min = retry_min
+        self.retry_max = retry_max
+        self.stale_s = stale_s              # ping을 보내는데 이 시간 동안 아무것도 안 오면 끊긴 것으로 봄
+        self.watch_interval = watch_interval
+        self.clock_sync = ClockSync()
+        self.port: Optional[str] = None
+        self.ser = None
+        self.reader: Optional[SerialReader] = None
+        self.state = DISCONNECTED
+        self.error = ""
+        self.connect_ms = 0.0   # 마지막 연결에 걸린 시간 (진단용)
+        self.connect_path = ""  # "saved" / "by_id" / "scan" / "explicit"
+        self.probes: list = []  # 마지막 전체 탐색 결과 (SerialProbe, 순위 순)
+        self._lock = threading.RLock()
+        self._subs: List[Callable] = []
+        self._gen = 0           # connect/disconnect마다 +1 - 늦게 끝난 열기 결과는 버림
+        self._want = False      # connect() 후 disconnect() 전 - 끊기면 자동 재연결
+        self._backoff = 0.0     # 마지막 재연결 대기 시간 (연결 후 데이터가 오면 0)
+        self._attached_at = 0.0
+        self.retry_at: Optional[float] = None   # 다음 자동 재연결 시각
+        self._listed = False    # 연결한 포트가 포트 목록에 있었는지 (없던 포트는 분리 감지 생략)
+        self._ports: Dict[str, tuple] = {}      # 마지막으로 본 포트 목록 {장치: (vid, pid, 시리얼 번호)}
+        self._events: deque = deque()           # pump()가 구독자에게 넘길 LinkEvent
+        self._link_subs: List[Callable] = []
+        self.history: deque = deque(maxlen=8)   # 최근 LinkEvent (관리자 화면 표시용)
+        self._watch: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self.state == CONNECTED
+
+    # ---- 구독 ----
+    def subscribe(self, callback: Callable):
+        with self._lock:
+            if callback not in self._subs:
+                self._subs.append(callback)
+
+    def unsubscribe(self, callback: Callable):
+        with self._lock:
+            if callback in self._subs:
+                self._subs.remove(callback)
+
+    def subscribe_link(self, callback: Callable):
+        """연결 상태 변화(LinkEvent) 구독 - pump()에서 불림"""
+        with self._lock:
+            if callback not in self._link_subs:
+                self._link_subs.append(callback)
+
+    def unsubscribe_link(self, callback: Callable):
+        with self._lock:
+            if callback in self._link_subs:
+                self._link_subs.remove(callback)
+
+    def pump(self) -> int:
+        """쌓인 샘플과 연결 이벤트를 구독자에게 전달 (게임 루프에서 매 프레임) - 전달한 샘플 수 반환"""
+        reader = self.reader
+        items = reader.drain() if reader is not None else []
+        if items:
+            subs = list(self._subs)
+            for item in items:
+                for callback in subs:
+                    callback(item)
+        if reader is not None and not reader.connected:
+            # 읽기 스레드가 예외로 멈춤 (케이블 분리 등) - 메시지 내용과 관계없이 끊긴 것으로 처리
+            with self._lock:
+                if self.reader is reader:
+                    self._lose("lost", reader.error)
+        while self._events:
+            event = self._events.popleft()
+            self.history.append(event)
+            for callback in list(self._link_subs):
+                callback(event)
+        return len(items)
+
+    # ---- 연결 ----
+    def connect(self, port: Optional[str] = None):
+        """포트 열기 요청 (None이면 저장된 포트, 없으면 자동 탐색) - 기존 연결은 닫음"""
+        with self._lock:
+            self._want = True
+            self._backoff = 0.0
+            self.retry_at = None
+            self._start_open(port)
+
+    def disconnect(self):
+        """연결 해제 - 다음 connect()까지 자동 재연결도 하지 않음"""
+        with self._lock:
+            was = self.state
+            self._want = False
+            self.retry_at = None
+            self._gen += 1
+            self._drop("")
+            if was != DISCONNECTED:
+                self._emit("disconnected", self.port)
+
+    def close(self):
+        """앱 종료 시"""
+        self._watch_stop.set()
+        with self._lock:
+            self._subs.clear()
+            self._link_subs.clear()
+        self.disconnect()
+
+    def _start_open(self, port: Optional[str]):
+        """(lock 안에서) 백그라운드 열기 시작"""
+        self._drop("")
+        self._gen += 1
+        gen = self._gen
+        if Serial is None:
+            self.error = "pyserial 미설치: pip install pyserial"
+            return
+        self.state = CONNECTING
+        self.retry_at = None
+        self._emit("connecting", port)
+        threading.Thread(target=self._open_worker, args=(port, gen), name="serial-open", daemon=True).start()
+
+    # ---- 감시 (분리/재연결) ----
+    def start_watch(self):
+        """포트 감시 스레드 시작 (main.py가 connect() 뒤 한 번) - list_ports를 watch_interval마다 확인"""
+        if self._watch is not None or list_ports is None:
+            return
+        self._watch_stop.clear()
+        self._ports = self._list()
+        self._watch = threading.Thread(target=self._watch_loop, name="serial-watch", daemon=True)
+        self._watch.start()
+
+    def _watch_loop(self):
+        while not self._watch_stop.wait(self.watch_interval):
+            try:
+                self._watch_tick()
+            except Exception as e:
+                log.warning(f"포트 감시 오류: {e}")
+
+    def _list(self) -> Dict[str, tuple]:
+        """현재 포트 목록 (열지 않고 OS 목록만 읽음 - 수 ms)"""
+        try:
+            return {p.device: (p.vid, p.pid, p.serial_number) for p in list_ports.comports()}
+        except Exception:
+            return dict(self._ports)
+
+    def _watch_tick(self):
+        ports = self._list()
+        arrived = [ports[d] for d in ports if d not in self._ports]
+        self._ports = ports
+        now = clock.now()
+        with self._lock:
+            if self.state == CONNECTED:
+                reader = self.reader
+                if self._backoff and reader is not None and reader.last_rx > self._attached_at:
+                    self._backoff = 0.0
+                if reader is not None and not reader.connected:
+                    self._lose("lost", reader.error)
+                elif self._listed and self.port not in ports:
+                    self._lose("unplugged", "장치가 분리되었습니다")
+                elif (reader is not None and reader.clock is not None and self.stale_s > 0
+                        and now - reader.last_rx > self.stale_s):
+                    # ping을 보내는데 pong도 샘플도 없음 - 드라이버가 오류 없이 멈춘 경우
+                    self._lose("lost", f"{self.stale_s:.0f}초 동안 장치 응답 없음")
+                return
+            if self.state != DISCONNECTED or not self._want:
+                return
+            plugged = any(self._is_ours(ids) for ids in arrived)
+            if plugged or (self.retry_at is not None and now >= self.retry_at):
+                self._emit("retry", None, "장치가 연결됨" if plugged else "")
+                self._start_open(None)
+
+    def _is_ours(self, ids: tuple) -> bool:
+        """새로 나타난 포트가 저장된 장치인지 (저장된 장치가 없으면 USB 시리얼이면 시도)"""
+        vid, pid, serial_number = ids
+        profile = get_serial_profile()
+        if profile.get("vid") is None:
+            return vid is not None
+        if (vid, pid) != (profile.get("vid"), profile.get("pid")):
+            return False
+        return not profile.get("serial_number") or serial_number == profile["serial_number"]
+
+    def _schedule_retry(self) -> Optional[float]:
+        """(lock 안에서) 다음 자동 재연결 예약 - 대기 시간 반환"""
+        if not self._want:
+            return None
+        self._backoff = self.retry_min if self._backoff <= 0 else min(self.retry_max, self._backoff * 2)
+        self.retry_at = clock.now() + self._backoff
+        return self._backoff
+
+    def _lose(self, kind: str, message: str):
+        """(lock 안에서) 연결이 끊김 - 정리하고 재연결 예약"""
+        port = self.port
+        log.warning(f"{LINK_LABELS[kind]}: {message} (포트: {port})")
+        self._drop(message)
+        self._emit(kind, port, message, self._schedule_retry())
+
+    def _emit(self, kind: str, port: Optional[str], message: str = "", retry_in: Optional[float] = None):
+        self._events.append(LinkEvent(clock.now(), kind, port, message, retry_in))
+
+    def _open_worker(self, port: Optional[str], gen: int):
+        try:
+            self._open(port, gen)
+        except Exception as e:
+            # 예상 못 한 오류로 CONNECTING에 멈춰 있지 않도록 - 실패로 처리하고 재연결 예약
+            log.exception("시리얼 열기 중 오류")
+            self._fail(gen, f"직렬 포트 열기 실패: {e}", port)
+
+    def _open(self, port: Optional[str], gen: int):
+        t0 = clock.now()
+        tries = []
+        if port is not None:
+            path = "explicit"
+            ser, err = self._try_open(port, tries)
+        else:
+            ser, port, path, err = self._open_known(tries)
+        self.connect_ms = (clock.now() - t0) * 1000.0
+        record_probe("serial", {"ok": ser is not None, "path": path, "ms": round(self.connect_ms, 1),
+                                "tries": [(p, round(ms, 1)) for p, ms, _ in tries]})
+        if ser is None:
+            self._fail(gen, err, port)
+            return
+
+        with self._lock:
+            if gen != self._gen:
+                # 그 사이 다른 connect/disconnect가 들어옴
+                try:
+                    ser.close()
+                except Exception:
+                    pass
+                return
+            self.connect_path = path
+            self._attach(ser, port)
+            reader = self.reader
+        # 우리 장치로 확인된 뒤에만 저장 (응답 없는 포트로 저장된 장치 정보를 덮어쓰지 않음)
+        if self._wait_verified(reader, gen):
+            self._save_profile(port)
+
+    def _wait_verified(self, reader: SerialReader, gen: int) -> bool:
+        """(열기 스레드) 첫 pong/샘플이 올 때까지 기다림 - 그 사이 끊기거나 다른 연결로 바뀌면 False"""
+        deadline = clock.now() + max(self.stale_s, 1.0)
+        while clock.now() < deadline:
+            if gen != self._gen or self.reader is not reader or not reader.connected:
+                return False
+            if reader.verified:
+                return True
+            time.sleep(0.05)
+        log.warning(f"{self.port}: 열렸지만 장치 응답 없음 - 장치 정보를 저장하지 않음")
+        return False
+
+    def _open_known(self, tries: list):
+        """
+        포트를 지정하지 않은 연결 - 빠른 경로부터
+        1) 저장된 포트를 바로 엶 (포트 목록을 훑지 않음)
+        2) 같은 VID/PID(+시리얼 번호) 장치가 다른 이름으로 잡혔으면 그 포트 (COM 번호 변경 등)
+        3) 전체 탐색 (core/discovery.py - 후보를 동시에 열고 ping/pong으로 확인)
+        반환: (ser, port, 경로, 오류)
+        """
+        profile = get_serial_profile()
+        saved = profile.get("port") or get_serial_port() or cfg.SERIAL_DEFAULT_PORT
+        err = "직렬 포트를 찾지 못했습니다. 연결/드라이버 확인"
+        if saved:
+            ser, err = self._try_open(saved, tries)
+            if ser is not None:
+                return ser, saved, "saved", ""
+            log.info(f"저장된 포트 {saved} 열기 실패 - 같은 장치 찾는 중")
+
+        if profile.get("vid") is not None and list_ports is not None:
+            for info in list_ports.comports():
+                if (info.vid, info.pid) != (profile.get("vid"), profile.get("pid")):
+                    continue
+                if profile.get("serial_number") and info.serial_number != profile["serial_number"]:
+                    continue
+                if info.device == saved:
+                    continue
+                ser, err = self._try_open(info.device, tries)
+                if ser is not None:
+                    log.info(f"같은 장치를 다른 포트에서 찾음: {info.device}")
+                    return ser, info.device, "by_id", ""
+
+        # 전체 탐색: 후보를 동시에 열어 ping/pong으로 확인 (이 스레드는 UI가 아니므로 결과를 기다림)
+        cands = [p for p in serial_candidates() if not any(p == t for t, _, _ in tries)]
+        if cands:
+            log.info(f"자동 포트 탐색: {', '.join(cands)}")
+            probes = probe_serial(cands, self.baud, prefer=profile, no_reset=self.no_reset).result()
+            self.probes = probes
+            for probe in probes:
+                tries.append((probe.port, probe.ms, probe.ok))
+            for probe in probes:
+                if not probe.verified:
+                    continue  # 열리기만 하고 응답 없는 포트(메인보드 COM1, 다른 USB 시리얼)는 쓰지 않음
+                ser, err = self._try_open(probe.port, tries)
+                if ser is not None:
+                    return ser, probe.port, "scan", ""
+            if not any(probe.verified for probe in probes):
+                err = "응답하는 센서 장치가 없습니다. 연결/펌웨어 확인"
+        return None, saved, "scan", err
+
+    def scan(self) -> Future:
+        """관리자 화면용 - 연결을 끊고 후보 포트를 동시에 확인 -> Future[List[SerialProbe]] (pong 응답 순)
+        탐색 전에 자동 재연결 중이었으면, 끝난 뒤 아무도 다시 연결하지 않았을 때 재연결 예약을 되살림"""
+        with self._lock:
+            want = self._want
+            self.disconnect()
+            gen = self._gen
+        future = probe_serial(serial_candidates(), self.baud, prefer=get_serial_profile(), no_reset=self.no_reset)
+        if want:
+            future.add_done_callback(lambda f: self._resume_after_scan(gen, f.result()))
+        return future
+
+    def _resume_after_scan(self, gen: int, probes: list):
+        with self._lock:
+            if gen != self._gen or self.state != DISCONNECTED:
+                return  # 그 사이 connect/disconnect가 들어옴
+            self._want = True
+            self._backoff = 0.0
+            retry_in = self._schedule_retry()
+            if not any(p.verified for p in probes):
+                self.error = "포트 탐색: 응답하는 장치 없음"
+                self._emit("failed", self.port, self.error, retry_in)
+
+    def _try_open(self, port: str, tries: list):
+        """포트 하나 열기 - (ser, 오류 메시지)"""
+        t0 = clock.now()
+        try:
+            ser = Serial()
+            ser.port = port
+            ser.baudrate = self.baud
+            ser.timeout = SerialReader.READ_TIMEOUT_S
+            if self.no_reset and self._holds_reset(port):
+                # 열기 전에 내려 두면 pyserial이 열 때 DTR/RTS를 올리지 않음 -> 자동 리셋 없음
+                ser.dtr = False
+                ser.rts = False
+            ser.open()
+            ser.reset_input_buffer()  # 열기 전에 쌓인 조각은 버림 (안정화 대기 없음)
+            tries.append((port, (clock.now() - t0) * 1000.0, True))
+            return ser, ""
+        except Exception as e:
+            tries.append((port, (clock.now() - t0) * 1000.0, False))
+            return None, f"직렬 포트 열기 실패: {e}"
+
+    @staticmethod
+    def _holds_reset(port: str) -> bool:
+        """DTR을 내린 채 열 포트인지 - 저장된 장치면 저장된 VID/PID로 (빠른 경로에서 포트 목록을 훑지 않음)"""
+        profile = get_serial_profile()
+        ids = profile if profile.get("port") == port else port_info(port)
+        return holds_reset(ids.get("vid"), ids.get("pid"))
+
+    def _save_profile(self, port: str):
+        """다음 실행의 빠른 경로를 위해 장치 정보 저장 (포트 목록 조회는 이 백그라운드 스레드에서)"""
+        profile = {"port": port, "baud": self.baud}
+        if list_ports is not None:
+            try:
+                for info in list_ports.comports():
+                    if info.device == port:
+                        profile.update(vid=info.vid, pid=info.pid, serial_number=info.serial_number)
+                        break
+            except Exception:
+                pass
+        if profile.get("vid") is None and get_serial_profile().get("vid") is not None:
+            # USB 식별 정보가 있는 저장된 장치를 식별 정보 없는 포트로 바꾸지 않음 (재연결/by_id 경로 유지)
+            log.info(f"{port}: VID 없는 포트 - 저장된 장치 정보 유지")
+            return
+        set_serial_profile(profile)
+        set_serial_port(port)  # 값이 같으면 쓰지 않음
+
+    def _attach(self, ser, port: str):
+        """열린 포트에 읽기 스레드를 붙이고 연결 상태로 전환"""
+        self.clock_sync.reset()
+        reader = SerialReader(
+            ser, parse=parse_line,
+            clock=self.clock_sync if self.ping_interval > 0 else None,
+            ping_interval=self.ping_interval,
+        )
+        reader.start()
+        if self.binary:
+            reader.request_binary()
+        elif self.no_reset:
+            # 지난 실행이 복귀 없이 끝났으면 보드가 아직 바이너리일 수 있음 - 텍스트로 다시 맞춤
+            self._request_text(ser)
+        self.ser = ser
+        self.reader = reader
+        self.port = port
+        self.state = CONNECTED
+        self.error = ""
+        self.retry_at = None
+        self._attached_at = reader.last_rx  # 이후 바이트가 오면 재연결 간격 초기화 (열리기만 하는 장치는 간격 유지)
+        self._listed = list_ports is not None and port in self._list()
+        self._emit("connected", port, f"{self.connect_path}, {self.connect_ms:.0f}ms" if self.connect_path else "")
+        log.info(f"시리얼 연결 성공: {port} (baudrate: {self.baud}, {self.connect_path}, {self.connect_ms:.0f}ms)")
+
+    def _fail(self, gen: int, error: str, port: Optional[str] = None):
+        with self._lock:
+            if gen != self._gen:
+                return
+            if port is not None:
+                self.port = port
+            self.state = DISCONNECTED
+            self.error = error
+            self._emit("failed", port, error, self._schedule_retry())
+        log.warning(error)
+
+    def _drop(self, error: str):
+        """읽기 스레드와 포트 정리 (lock 안에서)"""
+        reader, ser = self.reader, self.ser
+        self.reader = None
+        self.ser = None
+        if reader is not None:
+            reader.stop()
+        if ser is not None:
+            if reader is not None and self.binary:
+                # 리셋 없이 다시 열어도 텍스트 모드로 시작하도록 (분리된 장치에서 멈추지 않게 쓰기 제한 시간)
+                try:
+                    ser.write_timeout = 0.2
+                except Exception:
+                    pass
+                self._request_text(ser)
+            try:
+                ser.close()
+            except Exception:
+                pass
+        self.state = DISCONNECTED
+        self.error = error
+
+    @staticmethod
+    def _request_text(ser):
+        """장치를 텍스트(JSON) 모드로 되돌림 - 응답은 기다리지 않음 (분리된 포트면 조용히 실패)"""
+        try:
+            ser.write(TEXT_HANDSHAKE)
+            ser.flush()
+        except Exception:
+            pass
+
+
+_hub: Optional[SensorHub] = None
+
+
+def get_sensor_hub() -> SensorHub:
+    """프로세스 공용 센서 연결 (처음 호출 시 생성, 연결은 connect()로)"""
+    global _hub
+    if _hub is None:
+        _hub = SensorHub(
+            baud=cfg.SERIAL_BAUD,
+            ping_interval=cfg.CLOCK_SYNC_PING_S,
+            binary=cfg.SERIAL_BINARY,
+            no_reset=getattr(cfg, "SERIAL_NO_RESET", True),
+            retry_min=cfg.SERIAL_RECONNECT_MIN_S,
+            retry_max=cfg.SERIAL_RECONNECT_MAX_S,
+            stale_s=cfg.SERIAL_STALE_S,
+            watch_interval=cfg.SERIAL_WATCH_S,
+        )
+    return _hub
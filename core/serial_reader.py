@@ -0,0 +1,272 @@
+# core/serial_reader.py
+# 시리얼 포트 읽기
+# - LineFramer: in_waiting만큼 한 번에 읽은 바이트를 줄 단위로 자르고 남은 조각은 보관 (블록 없음)
+# - SerialReader: 전용 스레드에서 포트를 계속 비우면서 줄마다 도착 시각(clock.now)을 붙여 큐에 넣음
+#   게임 루프는 drain()으로 쌓인 항목을 한 번에 가져감 (프레임 지터와 무관한 기록)
+#   request_binary()로 바이너리 프레임 모드 핸드셰이크를 요청할 수 있음 (core/protocol.py 참고)
+#   clock(ClockSync)이 주어지면 주기적으로 "ping"을 보내 pong 왕복으로 장치 시계를 맞춤
+import threading
+from collections import deque
+from typing import Callable, List, NamedTuple, Optional
+
+from . import clock
+from .clock_sync import ClockSync
+from .log import get_logger
+from .protocol import BINARY_FRAME_SIZE, BINARY_HANDSHAKE, BinaryFrameDecoder, StatusMessage, is_binary_ack, parse_line
+
+
+log = get_logger("serial")
+
+
+def read_available(ser) -> bytes:
+    """수신 버퍼에 있는 만큼만 읽음 (비어 있으면 b"" - 절대 기다리지 않음)"""
+    n = ser.in_waiting
+    if n <= 0:
+        return b""
+    return ser.read(n)
+
+
+class LineFramer:
+    """
+    바이트 스트림을 줄 단위로 자릅니다.
+    - feed()는 받은 바이트에서 완성된 줄을 한 번에 모두 꺼내고, 마지막 미완성 조각은 다음 호출까지 보관
+    - 줄바꿈 없이 MAX_PENDING을 넘는 쓰레기 데이터는 버림
+    """
+
+    MAX_PENDING = 4096
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def reset(self):
+        self._buf.clear()
+
+    def feed(self, data: bytes) -> List[str]:
+        if data:
+            self._buf += data
+        end = self._buf.rfind(b"\n")
+        if end < 0:
+            if len(self._buf) > self.MAX_PENDING:
+                self._buf.clear()
+            return []
+
+        complete = bytes(self._buf[:end])
+        del self._buf[:end + 1]
+
+        lines = []
+        for raw in complete.split(b"\n"):
+            text = raw.decode("utf-8", errors="ignore").strip()
+            if text:
+                lines.append(text)
+        return lines
+
+    def push(self, data: bytes):
+        """줄로 자르지 않고 버퍼에만 쌓음 (pop_line()과 함께 사용)"""
+        self._buf += data
+        if len(self._buf) > self.MAX_PENDING and self._buf.find(b"\n") < 0:
+            self._buf.clear()
+
+    def pop_line(self) -> Optional[str]:
+        """완성된 줄을 하나만 꺼냄 (없으면 None) - 중간에 형식이 바뀔 수 있을 때 사용"""
+        while True:
+            end = self._buf.find(b"\n")
+            if end < 0:
+                return None
+            raw = bytes(self._buf[:end])
+            del self._buf[:end + 1]
+            text = raw.decode("utf-8", errors="ignore").strip()
+            if text:
+                return text
+
+    def take_pending(self) -> bytes:
+        """아직 줄로 만들지 않은 바이트를 모두 넘기고 비움"""
+        rest = bytes(self._buf)
+        self._buf.clear()
+        return rest
+
+
+class SerialLine(NamedTuple):
+    ts: float   # 도착 시각 (clock.now)
+    text: str
+
+
+class SerialReader:
+    """
+    parse가 주어지면 parse(text, ts) 결과(None이면 버림)를, 아니면 SerialLine을 큐에 넣습니다.
+    큐는 collections.deque라 append/popleft가 원자적이므로 락 없이 스레드 간에 주고받습니다.
+    바이너리 모드로 전환된 뒤에는 BinaryFrameDecoder가 만든 SensorSample을 넣습니다.
+    """
+
+    READ_TIMEOUT_S = 0.1  # 첫 바이트 대기 상한 (stop() 응답 속도)
+    HANDSHAKE_RETRY_S = 1.0  # 바이너리 전환 응답이 없으면 다시 요청하는 간격 (부트로더 중 유실 대비)
+    HANDSHAKE_TRIES = 5      # 이만큼 요청해도 응답이 없으면 텍스트 모드 유지
+    PING_TIMEOUT_S = 1.0     # 이 시간 안에 pong이 없으면 그 ping은 버림
+    PING_BYTES = b"ping\n"
+
+    def __init__(self, ser, parse: Optional[Callable] = None, maxlen: int = 4096,
+                 clock: Optional[ClockSync] = None, ping_interval: float = 0.5):
+        self.ser = ser
+        self.parse = parse
+        self.clock = clock
+        self.ping_interval = ping_interval
+        self._ping_sent: Optional[float] = None  # 응답을 기다리는 ping을 보낸 시각
+        self._last_ping = 0.0
+        self.queue: deque = deque(maxlen=maxlen)
+        self.error = ""
+        self.connected = True
+        self.last_rx = 0.0           # 마지막으로 바이트를 받은 시각 (응답 없음 감지용, start()부터)
+        self.verified = False        # 프로토콜 메시지(샘플/상태)를 한 번이라도 받음 - 우리 장치로 확인됨
+        self._framer = LineFramer()
+        self._running = False
+        self._thread = None
+        self.binary: Optional[BinaryFrameDecoder] = None   # 바이너리 모드일 때만 생성
+        self._awaiting_ack = False
+        self._handshake_sent = 0.0
+        self._handshake_tries = 0
+
+    def request_binary(self):
+        """장치에 바이너리 모드를 요청 (응답 줄이 오면 읽기 스레드가 디코더를 전환)"""
+        self._handshake_tries = 0
+        self._awaiting_ack = True
+        self._send_handshake()
+
+    def _send_handshake(self):
+        self._handshake_tries += 1
+        self._handshake_sent = clock.now()
+        try:
+            self.ser.write(BINARY_HANDSHAKE)
+        except Exception as e:
+            self._awaiting_ack = False
+            self.error = f"바이너리 모드 요청 실패: {e}"
+
+    @property
+    def dropped(self) -> int:
+        """시퀀스 번호로 추정한 유실 샘플 수 (텍스트 모드에서는 0)"""
+        return self.binary.dropped if self.binary is not None else 0
+
+    def start(self):
+        if self._running:
+            return
+        try:
+            self.ser.timeout = self.READ_TIMEOUT_S
+        except Exception:
+            pass
+        self._running = True
+        self.last_rx = clock.now()
+        self._thread = threading.Thread(target=self._run, name="serial-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def drain(self) -> List:
+        """쌓인 항목을 도착 순서대로 모두 꺼냄"""
+        items = []
+        q = self.queue
+        while True:
+            try:
+                items.append(q.popleft())
+            except IndexError:
+                return items
+
+    def _run(self):
+        while self._running:
+            try:
+                # 첫 바이트는 최대 READ_TIMEOUT_S까지 기다리고, 이미 와 있는 바이트는 한 번에 모두 읽음
+                data = self.ser.read(max(1, self.ser.in_waiting))
+            except Exception as e:
+                self.error = f"시리얼 연결 끊어짐: {e}"
+                self.connected = False
+                self._running = False
+                return
+            if self._awaiting_ack and clock.now() - self._handshake_sent > self.HANDSHAKE_RETRY_S:
+                if self._handshake_tries < self.HANDSHAKE_TRIES:
+                    self._send_handshake()
+                else:
+                    self._awaiting_ack = False
+                    log.warning("바이너리 모드 응답 없음 - 텍스트 모드 유지")
+            if self.clock is not None:
+                self._maybe_ping()
+            if not data:
+                continue
+            ts = clock.now()
+            self.last_rx = ts
+            if self.binary is not None:
+                self._push_frames(data, ts)
+            elif self._awaiting_ack:
+                self._feed_until_ack(data, ts)
+            else:
+                for text in self._framer.feed(data):
+                    self._push_line(text, ts)
+
+    def _push_frames(self, data: bytes, ts: float):
+        for item in self.binary.feed(data, ts):
+            self.verified = True  # 체크섬이 맞는 프레임
+            if isinstance(item, StatusMessage) and self.clock is not None:
+                self._on_pong(item, ts, BINARY_FRAME_SIZE)
+            self.queue.append(item)
+
+    def _push_line(self, text: str, ts: float):
+        if self.parse is None:
+            self.queue.append(SerialLine(ts, text))
+        else:
+            item = self.parse(text, ts)
+            if item is not None:
+                self.verified = True
+                if self.clock is not None and isinstance(item, StatusMessage):
+                    self._on_pong(item, ts, len(text) + 2)  # + "\r\n"
+                self.queue.append(item)
+
+    # ---- 시계 동기화 ----
+    def _tx_time(self, nbytes: int) -> float:
+        """nbytes 전송에 걸리는 시간 (8N1 = 바이트당 10비트)"""
+        baud = getattr(self.ser, "baudrate", 0) or 0
+        return nbytes * 10.0 / baud if baud > 0 else 0.0
+
+    def _maybe_ping(self):
+        if self._awaiting_ack:
+            return
+        now = clock.now()
+        if self._ping_sent is not None:
+            if now - self._ping_sent < self.PING_TIMEOUT_S:
+                return
+            self._ping_sent = None  # 응답 없음 - 늦게 온 pong과 짝지어지지 않도록 버림
+        if now - self._last_ping < self.ping_interval:
+            return
+        try:
+            self.ser.write(self.PING_BYTES)
+        except Exception:
+            return
+        self._ping_sent = self._last_ping = clock.now()
+
+    def _on_pong(self, msg: StatusMessage, ts: float, nbytes: int):
+        """pong(장치 millis 포함)을 마지막 ping과 짝지어 왕복 표본으로 추가"""
+        sent = self._ping_sent
+        if msg.status != "pong" or sent is None:
+            return
+        device_ms = msg.data.get("ms")
+        if not isinstance(device_ms, (int, float)):
+            return  # 시각을 보내지 않는 이전 펌웨어
+        self._ping_sent = None
+        # 장치가 ping 줄을 다 받은 뒤에야 응답하고, 응답 마지막 바이트가 도착해야 ts가 찍히므로 전송 시간만큼 좁힘
+        t0 = sent + self._tx_time(len(self.PING_BYTES))
+        t1 = ts - self._tx_time(nbytes)
+        self.clock.add_round_trip(t0, max(t0, t1), int(device_ms))
+
+    def _feed_until_ack(self, data: bytes, ts: float):
+        """핸드셰이크 중: 한 줄씩 보다가 전환 응답이 오면 남은 바이트부터 바이너리로 해석"""
+        framer = self._framer
+        framer.push(data)
+        while True:
+            text = framer.pop_line()
+            if text is None:
+                return
+            if is_binary_ack(parse_line(text, ts)):
+                self._awaiting_ack = False
+                self.binary = BinaryFrameDecoder()
+                self._push_frames(framer.take_pending(), ts)  # 같은 조각에 온 pong 프레임도 시계 동기화에 사용
+                return
+            self._push_line(text, ts)
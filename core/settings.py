@@ -1,13 +1,25 @@
 # core/settings.py
 # 게임 설정 저장 및 로드
+# 설정은 프로세스 공용 Settings 객체가 메모리에 보관 - 조회는 파일을 다시 읽지 않고, 저장은 잠시 모았다가 한 번에
+import atexit
+import functools
 import json
 import os
 import sys
+import threading
 from pathlib import Path
+from typing import Optional
 
+from . import clock
+from .log import get_logger
+from .path_utils import atomic_write
+
+log = get_logger("settings")
+
+@functools.lru_cache(maxsize=None)
 def get_user_data_dir() -> Path:
     """
-    사용자 데이터 디렉토리 경로 반환
+    사용자 데이터 디렉토리 경로 반환 (처음 한 번만 계산/생성)
     EXE 실행 시에도 사용자 홈 디렉토리에 저장
     """
     if sys.platform == "win32":
@@ -26,54 +38,225 @@ def get_user_data_dir() -> Path:
     try:
         data_dir.mkdir(parents=True, exist_ok=True)
     except Exception as e:
-        print(f"[SETTINGS] 데이터 디렉토리 생성 실패: {e}")
+        log.warning(f"데이터 디렉토리 생성 실패: {e}")
         # 폴백: 현재 디렉토리 사용
         data_dir = Path(".")
     
     return data_dir
 
-SETTINGS_FILE = get_user_data_dir() / "settings.json"
+SETTINGS_FILE_NAME = "settings.json"
 
-def load_settings() -> dict:
-    """설정 파일 로드"""
-    if SETTINGS_FILE.exists():
+
+def get_settings_file() -> Path:
+    return get_user_data_dir() / SETTINGS_FILE_NAME
+
+
+def __getattr__(name):
+    # SETTINGS_FILE은 처음 접근할 때 계산 (import만으로 디렉토리를 만들지 않도록)
+    if name == "SETTINGS_FILE":
+        return get_settings_file()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class Settings:
+    """
+    settings.json 메모리 캐시
+    - 처음 한 번만 읽고 조회는 메모리에서
+    - set()은 값이 바뀐 경우에만 dirty 표시 후 flush_delay 뒤 한 번에 저장 (연속 변경은 한 번의 쓰기로 합쳐짐)
+    - 저장은 임시 파일 + os.replace (쓰는 도중 꺼져도 파일이 깨지지 않음)
+    - watch=True면 조회 시 watch_interval 간격으로 파일 (mtime, 크기)를 확인해 외부 편집을 다시 읽음
+      (아직 저장하지 않은 내 변경은 다시 읽은 값 위에 유지)
+    """
+
+    FLUSH_DELAY_S = 0.5
+    WATCH_INTERVAL_S = 1.0
+
+    def __init__(self, path, flush_delay: Optional[float] = None, watch: bool = True):
+        self.path = Path(path)
+        self.flush_delay = self.FLUSH_DELAY_S if flush_delay is None else flush_delay
+        self.watch = watch
+        self._lock = threading.RLock()
+        self._data: Optional[dict] = None
+        self._dirty_keys: set = set()
+        self._timer: Optional[threading.Timer] = None
+        self._sig = None
+        self._checked_at = 0.0
+        self.writes = 0  # 실제 파일 쓰기 횟수 (진단용)
+        atexit.register(self.flush)
+
+    # ---- 읽기 ----
+    def _signature(self):
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _read_file(self) -> dict:
         try:
-            with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
         except Exception as e:
-            print(f"[SETTINGS] 설정 로드 실패: {e}")
+            log.warning(f"설정 로드 실패: {e}")
             return {}
-    return {}
+
+    def _ensure(self):
+        if self._data is None:
+            self._sig = self._signature()
+            self._data = self._read_file()
+            self._checked_at = clock.now()
+            return
+        if not self.watch:
+            return
+        now = clock.now()
+        if now - self._checked_at < self.WATCH_INTERVAL_S:
+            return
+        self._checked_at = now
+        sig = self._signature()
+        if sig != self._sig:
+            self._sig = sig
+            data = self._read_file()
+            for k in self._dirty_keys:  # 저장 대기 중인 내 변경이 우선
+                if k in self._data:
+                    data[k] = self._data[k]
+            self._data = data
+            log.info("설정 파일이 외부에서 변경되어 다시 읽었습니다")
+
+    def get(self, key: str, default=None):
+        with self._lock:
+            self._ensure()
+            return self._data.get(key, default)
+
+    def all(self) -> dict:
+        with self._lock:
+            self._ensure()
+            return dict(self._data)
+
+    # ---- 쓰기 ----
+    def set(self, key: str, value):
+        with self._lock:
+            self._ensure()
+            if key in self._data and self._data[key] == value:
+                return
+            self._data[key] = value
+            self._dirty_keys.add(key)
+            self._schedule()
+
+    def update(self, values: dict, replace: bool = False):
+        """여러 값을 한 번에 (replace=True면 전체 교체)"""
+        with self._lock:
+            self._ensure()
+            if replace:
+                self._dirty_keys.update(self._data)
+                self._data = {}
+            self._data.update(values)
+            self._dirty_keys.update(values)
+            self._schedule()
+
+    def _schedule(self):
+        if self._timer is not None:
+            return  # 이미 예약됨 - 그 사이 변경은 같은 쓰기로 합쳐짐
+        if self.flush_delay <= 0:
+            self.flush()
+            return
+        self._timer = threading.Timer(self.flush_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._dirty_keys)
+
+    def flush(self):
+        """변경된 내용이 있으면 지금 저장"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty_keys or self._data is None:
+                return
+            try:
+                data = json.dumps(self._data, ensure_ascii=False, indent=2).encode("utf-8")
+                atomic_write(self.path, data)
+                self._dirty_keys.clear()
+                self._sig = self._signature()
+                self.writes += 1
+                log.info(f"설정 저장 완료: {self.path}")
+            except Exception as e:
+                log.error(f"설정 저장 실패: {e}")
+
+
+_settings: Optional[Settings] = None
+_last_probes: dict = {}  # 이번 실행 중 마지막 탐색 결과 (실패 포함, 저장 안 함)
+
+
+def get_settings() -> Settings:
+    """프로세스 공용 설정 (처음 호출 시 생성)"""
+    global _settings
+    if _settings is None:
+        _settings = Settings(get_settings_file())
+    return _settings
+
+def load_settings() -> dict:
+    """설정 전체 (복사본)"""
+    return get_settings().all()
 
 def save_settings(settings: dict):
-    """설정 파일 저장"""
-    try:
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(settings, f, ensure_ascii=False, indent=2)
-        print(f"[SETTINGS] 설정 저장 완료: {SETTINGS_FILE}")
-    except Exception as e:
-        print(f"[SETTINGS] 설정 저장 실패: {e}")
+    """설정 전체 교체 후 바로 저장"""
+    s = get_settings()
+    s.update(settings, replace=True)
+    s.flush()
 
 def get_camera_index() -> int:
     """저장된 카메라 인덱스 가져오기"""
-    settings = load_settings()
-    return settings.get("camera_index", 0)
+    return get_settings().get("camera_index", 0)
 
 def set_camera_index(index: int):
-    """카메라 인덱스 저장"""
-    settings = load_settings()
-    settings["camera_index"] = index
-    save_settings(settings)
-    print(f"[SETTINGS] 카메라 인덱스 저장: {index}")
+    """카메라 인덱스 저장 (잠시 뒤 다른 변경과 함께 기록)"""
+    get_settings().set("camera_index", index)
+    log.info(f"카메라 인덱스 저장: {index}")
 
 def get_serial_port() -> str:
     """저장된 시리얼 포트 가져오기"""
-    settings = load_settings()
-    return settings.get("serial_port", None)
+    return get_settings().get("serial_port", None)
 
 def set_serial_port(port: str):
     """시리얼 포트 저장"""
-    settings = load_settings()
-    settings["serial_port"] = port
-    save_settings(settings)
-    print(f"[SETTINGS] 시리얼 포트 저장: {port}")
+    get_settings().set("serial_port", port)
+    log.info(f"시리얼 포트 저장: {port}")
+
+def get_camera_profile() -> dict:
+    """마지막으로 성공한 카메라 설정 {index, backend, width, height, fps, fourcc} (없으면 {})"""
+    return dict(get_settings().get("camera_profile") or {})
+
+def set_camera_profile(profile: dict):
+    get_settings().set("camera_profile", dict(profile))
+
+def get_serial_profile() -> dict:
+    """마지막으로 성공한 시리얼 장치 {port, vid, pid, serial_number, baud} (없으면 {})"""
+    return dict(get_settings().get("serial_profile") or {})
+
+def set_serial_profile(profile: dict):
+    get_settings().set("serial_profile", dict(profile))
+
+def record_probe(kind: str, result: dict):
+    """장치 탐색 결과/소요 시간 기록 (진단용, kind: "camera" / "serial")
+
+    실패한 시도는 메모리에만 남긴다 (장치가 빠진 동안 재시도마다 파일을 다시 쓰지 않도록).
+    """
+    _last_probes[kind] = dict(result)
+    if not result.get("ok"):
+        return
+    s = get_settings()
+    probes = dict(s.get("probe_stats") or {})
+    probes[kind] = dict(result)
+    s.set("probe_stats", probes)
+
+def get_probe_stats() -> dict:
+    """마지막 탐색 결과 (이번 실행의 실패 포함)"""
+    stats = dict(get_settings().get("probe_stats") or {})
+    stats.update(_last_probes)
+    return stats
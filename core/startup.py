@@ -0,0 +1,107 @@
+# core/startup.py
+# 시작 시간 측정 + 무거운 모듈 지연 로딩
+# - mark(phase): 이 모듈을 처음 import한 시점부터의 구간별 ms 기록 (main.py가 가장 먼저 import)
+# - preload(modules): 타이틀 화면이 뜬 뒤 백그라운드 스레드에서 cv2/pyserial/게임·관리자 상태를 미리 import
+# - load(module, attr): 필요한 순간에 가져옴 - 미리 로딩 중이면 import 잠금이 끝날 때까지만 기다림
+# - 타임라인 표는 config.STARTUP_PROFILE, --startup-profile 인자, DDUDDU_STARTUP_PROFILE=1 중 하나로 출력
+import importlib
+import os
+import sys
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+from . import clock
+from .log import get_logger
+
+log = get_logger("game")
+
+_t0 = clock.now()
+_lock = threading.Lock()
+_marks: List[Tuple[str, float, str]] = []   # (구간 이름, 끝난 시각 ms, 스레드)
+_last = {}
+_preload: Optional[threading.Thread] = None
+
+
+def elapsed_ms() -> float:
+    return (clock.now() - _t0) * 1000.0
+
+
+def mark(phase: str, thread: str = "main") -> float:
+    """구간 끝 기록 - 직전 mark(같은 스레드)부터 걸린 ms 반환"""
+    t = elapsed_ms()
+    with _lock:
+        dt = t - _last.get(thread, 0.0)
+        _last[thread] = t
+        _marks.append((phase, t, thread))
+    return dt
+
+
+def profile_enabled() -> bool:
+    if "--startup-profile" in sys.argv or os.getenv("DDUDDU_STARTUP_PROFILE") == "1":
+        return True
+    cfg = sys.modules.get("config")
+    return bool(getattr(cfg, "STARTUP_PROFILE", False))
+
+
+def timeline() -> List[Tuple[str, float, float, str]]:
+    """(구간, 구간 ms, 누적 ms, 스레드) 목록"""
+    rows = []
+    last = {}
+    with _lock:
+        marks = list(_marks)
+    for phase, t, thread in marks:
+        start = last.get(thread, 0.0 if thread == "main" else t)
+        rows.append((phase, t - start, t, thread))
+        last[thread] = t
+    return rows
+
+
+def report():
+    """타임라인 요약을 로그에 남기고, 프로파일 플래그가 켜져 있으면 표를 출력"""
+    rows = timeline()
+    first_frame = next((t for phase, _, t, _ in rows if phase == "first frame"), None)
+    if first_frame is not None:
+        log.info(f"시작 시간: 첫 화면 {first_frame:.0f}ms, 전체 {max(t for _, _, t, _ in rows):.0f}ms")
+    if not profile_enabled():
+        return
+    print("=== 시작 타임라인 (ms) ===")
+    for phase, dt, t, thread in rows:
+        where = "" if thread == "main" else f"  [{thread}]"
+        print(f"  {t:8.1f}  +{dt:7.1f}  {phase}{where}")
+
+
+def load(module: str, attr: Optional[str] = None):
+    """모듈(또는 그 안의 이름)을 가져옴 - 처음이면 여기서 import하고 걸린 시간을 기록"""
+    # sys.modules만 보면 다른 스레드가 아직 실행 중인 반쯤 초기화된 모듈을 받을 수 있어
+    # 항상 import_module로 가져옴 (이미 로딩된 모듈이면 사전 조회 비용뿐)
+    t0 = clock.now()
+    mod = importlib.import_module(module)
+    ms = (clock.now() - t0) * 1000.0
+    if ms >= 1.0:
+        log.info(f"{module} 로딩 대기 {ms:.0f}ms (미리 로딩이 끝나기 전에 필요해짐)")
+    return getattr(mod, attr) if attr else mod
+
+
+def preload(modules: Iterable[str]):
+    """백그라운드 스레드에서 차례로 import (한 번만), 끝나면 타임라인 보고"""
+    global _preload
+    if _preload is not None:
+        return
+    modules = list(modules)
+
+    def run():
+        mark("preload start", thread="preload")
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                log.warning(f"미리 로딩 실패 {name}: {e}")
+            mark(f"import {name}", thread="preload")
+        report()
+
+    _preload = threading.Thread(target=run, name="startup-preload", daemon=True)
+    _preload.start()
+
+
+def preload_done() -> bool:
+    return _preload is not None and not _preload.is_alive()
@@ -0,0 +1,68 @@
+# core/surface_cache.py
+# 이미지/스케일 Surface 프로세스 공용 캐시
+# - 원본 이미지는 경로별로 한 번만 로딩해서 모든 상태가 공유
+# - 스케일 결과는 (원본, 목표 크기, 스케일 모드) 키로 LRU 보관
+import pygame
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from .path_utils import safe_image_load
+
+# 스케일 캐시 최대 개수 (창 크기가 여러 번 바뀌어도 메모리가 무한히 늘지 않도록)
+MAX_SCALED = 64
+
+_images: dict = {}                       # 경로 -> 원본 Surface (로딩 실패 시 None)
+_scaled: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+
+def _convert(image: pygame.Surface) -> pygame.Surface:
+    """디스플레이 픽셀 포맷으로 변환 (blit/scale 속도 향상)"""
+    if pygame.display.get_surface() is None:
+        return image
+    try:
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+    except pygame.error:
+        return image
+
+
+def load_image(path: str) -> Optional[pygame.Surface]:
+    """이미지를 경로별로 한 번만 로딩 (실패 결과도 캐시)"""
+    if path in _images:
+        return _images[path]
+    image = safe_image_load(path)
+    if image is not None:
+        image = _convert(image)
+    _images[path] = image
+    return image
+
+
+def get_scaled(image: pygame.Surface, size: Tuple[int, int], mode: str = "scale") -> pygame.Surface:
+    """
+    미리 스케일된 Surface 반환
+    mode: "scale"(pygame.transform.scale) 또는 "smooth"(smoothscale)
+    """
+    w = max(1, int(size[0]))
+    h = max(1, int(size[1]))
+    key = (image, w, h, mode)
+
+    surf = _scaled.get(key)
+    if surf is not None:
+        _scaled.move_to_end(key)
+        return surf
+
+    if mode == "smooth":
+        surf = pygame.transform.smoothscale(image, (w, h))
+    else:
+        surf = pygame.transform.scale(image, (w, h))
+
+    _scaled[key] = surf
+    while len(_scaled) > MAX_SCALED:
+        _scaled.popitem(last=False)
+    return surf
+
+
+def invalidate():
+    """스케일 캐시 비우기 (뷰포트 재구성 시 호출)"""
+    _scaled.clear()
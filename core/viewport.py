@@ -11,6 +11,11 @@ class Viewport:
         self.offset = (0, 0)
         self.canvas = pygame.Surface((self.scaled_w, self.scaled_h)).convert_alpha()
 
+        # 더티 렉트 출력용 상태
+        self._dirty = []            # 이번 프레임에 바뀐 영역 (캔버스 좌표)
+        self._prev_dirty = []       # 지난 프레임 영역 (지워진 부분도 다시 내보내기 위해)
+        self._full_redraw = True    # True면 다음 present에서 전체 flip
+
     def update_layout(self, win_w, win_h):
         # 전체 화면 사용 (종횡비 제한 없음)
         self.scaled_w = win_w
@@ -20,6 +25,7 @@ class Viewport:
 
         # ★ 전체 화면 크기로 캔버스 재생성
         self.canvas = pygame.Surface((self.scaled_w, self.scaled_h)).convert_alpha()
+        self.invalidate()
 
     # Flutter의 SizedBox처럼 쓰는 헬퍼
     def S(self, v: float) -> int:
@@ -28,7 +34,38 @@ class Viewport:
     def rect(self, x, y, w, h) -> pygame.Rect:
         return pygame.Rect(self.S(x), self.S(y), self.S(w), self.S(h))
 
+    # ----- 더티 렉트 -----
+    def mark_dirty(self, rect):
+        """이번 프레임에 다시 그린 영역 등록 (캔버스 좌표)"""
+        self._dirty.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        """다음 출력은 전체 화면 flip (리사이즈/상태 전환/정적 레이어 재합성 시)"""
+        self._full_redraw = True
+
     def blit_to_window(self, window, bg=None):
         if bg:
             window.fill(bg)
         window.blit(self.canvas, self.offset)
+
+    def present(self, window, bg=None):
+        """캔버스를 창에 출력: 더티 렉트만 update하거나 전체 flip"""
+        if self._full_redraw:
+            self.blit_to_window(window, bg)
+            pygame.display.flip()
+            self._prev_dirty = []
+        else:
+            bounds = self.canvas.get_rect()
+            rects = []
+            for r in self._dirty + self._prev_dirty:
+                r = r.clip(bounds)
+                if r.w > 0 and r.h > 0:
+                    dst = r.move(self.offset)
+                    window.blit(self.canvas, dst, r)
+                    rects.append(dst)
+            if rects:
+                pygame.display.update(rects)
+            self._prev_dirty = self._dirty
+
+        self._dirty = []
+        self._full_redraw = False
@@ -1,41 +1,66 @@
 # main.py
 # pip install pygame==2.5.2 opencv-python
+# 타이틀 화면에 필요 없는 cv2/pyserial과 게임/관리자 상태는 첫 화면을 그린 뒤 백그라운드에서 미리 import (core/startup.py)
+from core import startup  # 시작 타임라인 기준 시각 - 가장 먼저 import
 import pygame, sys
 import multiprocessing
 import config as cfg
 from core.viewport import Viewport
 from core.fonts import make_fonts
+from core import surface_cache
+from core import log
+from core import leaderboard
+from core.settings import get_settings
 from core.path_utils import debug_paths
 from ui.title_state import TitleState
-from ui.game_state import GameState
 from ui.result_state import ResultState
-from ui.admin_state import AdminState
+
+# 지연 로딩 대상 (상태 클래스를 처음 만들 때 startup.load로 가져옴)
+GAME_STATE = ("ui.game_state", "GameState")
+ADMIN_STATE = ("ui.admin_state", "AdminState")
+PRELOAD_MODULES = ("cv2", "serial", GAME_STATE[0], ADMIN_STATE[0])
 
 def main():
+    startup.mark("imports")
+    # 로그: 게임 루프는 큐에 넣기만 하고 파일/콘솔 출력은 백그라운드 스레드가 담당
+    log.setup(cfg.LOG_LEVEL, samples=cfg.LOG_SAMPLES, console=cfg.LOG_CONSOLE,
+              max_bytes=cfg.LOG_MAX_BYTES, backups=cfg.LOG_BACKUPS)
+    startup.mark("log setup")
+
     # Windows에서 경로 문제 디버깅
     if sys.platform.startswith('win'):
         debug_paths()
     
     pygame.init()
+    startup.mark("pygame.init")
 
     # 창 생성 (리사이즈 가능)
     window = pygame.display.set_mode((cfg.BASE_W, cfg.BASE_H), pygame.RESIZABLE)
     pygame.display.set_caption("뚜뚜의 어드벤처")
+    startup.mark("window")
 
     # 뷰포트/폰트
     viewport = Viewport(cfg.BASE_W, cfg.BASE_H)
     viewport.update_layout(*window.get_size())
     fonts = make_fonts(max(0.7, viewport.scale), cfg)
+    startup.mark("fonts")
     
 
     # 초기 상태: 타이틀
     state = TitleState()
     state.enter()
+    startup.mark("title state")
 
     clock = pygame.time.Clock()
     fullscreen = False
     running = True
 
+    # 창 드래그 중 연속으로 들어오는 VIDEORESIZE는 모아 두었다가 멈추면 한 번만 반영
+    pending_size = None
+    pending_since = 0
+    first_frame = True
+    sensors = None  # 공용 센서 허브 (첫 화면 뒤에 연결 시작, 앱이 끝날 때까지 유지)
+
     while running:
         dt = clock.tick(60) / 1000.0
 
@@ -45,45 +70,70 @@ def main():
             handled = False
             if e.type == pygame.QUIT:
                 if hasattr(state, "exit"): state.exit()
+                leaderboard.flush()  # 백그라운드에서 저장 중인 기록을 모두 쓰고 종료
+                get_settings().flush()  # 모아 둔 설정 변경 저장
                 running = False
                 handled = True
             elif e.type == pygame.VIDEORESIZE:
-                w = max(cfg.MIN_W, e.w); h = max(cfg.MIN_H, e.h)
-                window = pygame.display.set_mode((w, h), pygame.RESIZABLE)
-                viewport.update_layout(w, h)
-                fonts = make_fonts(max(0.7, viewport.scale), cfg)
+                pending_size = (e.w, e.h)
+                pending_since = pygame.time.get_ticks()
                 handled = True
             elif e.type == pygame.KEYDOWN and e.key == pygame.K_1:
+                pending_size = None
                 fullscreen = not fullscreen
                 window = pygame.display.set_mode((0,0), pygame.FULLSCREEN) if fullscreen \
                         else pygame.display.set_mode((cfg.BASE_W, cfg.BASE_H), pygame.RESIZABLE)
                 viewport.update_layout(*window.get_size())
+                surface_cache.invalidate()
                 fonts = make_fonts(max(0.7, viewport.scale), cfg)
                 handled = True
 
             if not handled:
                 state.handle_event(e)   # ← 이게 핵심
 
+        # 리사이즈 디바운스: 마지막 이벤트 후 RESIZE_DEBOUNCE_MS 동안 조용하면 레이아웃/폰트 재구성
+        if pending_size is not None:
+            if pygame.time.get_ticks() - pending_since >= cfg.RESIZE_DEBOUNCE_MS:
+                w = max(cfg.MIN_W, pending_size[0]); h = max(cfg.MIN_H, pending_size[1])
+                pending_size = None
+                window = pygame.display.set_mode((w, h), pygame.RESIZABLE)
+                viewport.update_layout(w, h)
+                surface_cache.invalidate()  # 이전 크기로 스케일된 이미지 폐기
+                fonts = make_fonts(max(0.7, viewport.scale), cfg)
+            else:
+                viewport.invalidate()  # 드래그 중에는 전체 출력
+
 
 
+        # 센서 샘플을 구독 중인 상태에게 전달 (읽기 스레드가 모아 둔 것만 - 블록 없음)
+        if sensors is not None:
+            sensors.pump()
+
         # 상태 업데이트/렌더
         state.update(dt)
+        # 더티 렉트를 보고하지 않는 상태(관리자 화면 등)는 매 프레임 전체 출력
+        if cfg.PRESENT_MODE != "dirty" or not getattr(state, "reports_dirty", False):
+            viewport.invalidate()
         state.render(viewport, fonts)
 
         # --- 상태 전환 ---
+        # 게임/관리자 상태 클래스는 지연 로딩이라 isinstance 대신 클래스 이름으로 구분
         if getattr(state, "next", None):
             tag, payload = state.next
-            if isinstance(state, TitleState) and tag == "game":
+            kind = type(state).__name__
+            if kind == "TitleState" and tag == "game":
                 player_name = payload.get("name", "")
                 state.exit()
                 # 카메라 인덱스는 자동으로 저장된 값 사용
+                GameState = startup.load(*GAME_STATE)
                 state = GameState(target_fps=30, prefer_size=(1280, 720), player_name=player_name)
                 state.enter()
-            elif isinstance(state, TitleState) and tag == "admin":
+            elif kind == "TitleState" and tag == "admin":
                 state.exit()
+                AdminState = startup.load(*ADMIN_STATE)
                 state = AdminState()
                 state.enter()
-            elif isinstance(state, GameState) and tag == "result":                
+            elif kind == "GameState" and tag == "result":                
                 state.exit()
                 state = ResultState(
                     player_name = payload.get("name",""),
@@ -91,24 +141,43 @@ def main():
                     best_close_cm = payload.get("best_close_cm"),
                 )
                 state.enter()
-            elif isinstance(state, GameState) and tag == "title":
+            elif kind == "GameState" and tag == "title":
                 state.exit()
                 state = TitleState()
                 state.enter()
-            elif isinstance(state, AdminState) and tag == "title":
+            elif kind == "AdminState" and tag == "title":
                 state.exit()
                 state = TitleState()
                 state.enter()
-            elif isinstance(state, ResultState) and tag == "title":
+            elif kind == "ResultState" and tag == "title":
                 state.exit()
                 state = TitleState()
                 state.enter()
 
-        # 창에 출력 (배경색 없이)
-        viewport.blit_to_window(window, bg=None)
-        pygame.display.flip()
+            viewport.invalidate()  # 새 상태의 첫 프레임은 전체 출력
+
+        # 창에 출력 (배경색 없이, 바뀐 영역만)
+        viewport.present(window, bg=None)
+
+        if first_frame:
+            # 타이틀이 뜬 뒤에야 무거운 모듈을 불러옴 (이름을 입력하는 동안 백그라운드에서)
+            first_frame = False
+            startup.mark("first frame")
+            startup.preload(PRELOAD_MODULES)
+            # 포트 열기는 백그라운드 스레드 - 게임을 시작할 때쯤이면 이미 샘플이 흐르는 상태
+            sensors = startup.load("core.sensor_hub", "get_sensor_hub")()
+            sensors.connect()
+            sensors.start_watch()  # 분리/재연결 감시 (무인 운영 시 자동 복구)
+            startup.mark("sensor hub")
 
+    if sensors is not None:
+        sensors.close()
+    # 카메라는 상태가 바뀌어도 열어 두므로 여기서 해제 (쓴 적 없으면 모듈도 로딩되지 않은 상태)
+    camera_manager = sys.modules.get("core.camera_manager")
+    if camera_manager is not None:
+        camera_manager.shutdown()
     pygame.quit()
+    log.shutdown()  # 남은 로그를 모두 쓰고 종료
     sys.exit(0)
 
 if __name__ == "__main__":
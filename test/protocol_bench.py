@@ -0,0 +1,80 @@
+# test/protocol_bench.py
+# 센서 줄 프로토콜 파서 마이크로 벤치마크 (초당 처리 줄 수)
+# 기존 GameState 방식(json.loads 먼저 → 실패 시 문자열 분리)과 core.protocol.parse_line 비교
+#
+# 실행: python test/protocol_bench.py
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.protocol import BinaryFrameDecoder, encode_binary_frame, parse_line
+
+# 펌웨어가 실제로 보내는 비율에 가깝게 구성 (대부분 {"cm": N})
+LINES = (
+    ['{"cm": 17}'] * 80
+    + ['{"near": true, "cm": 4}'] * 5
+    + ['{"distance": 25, "timestamp": 12345, "unit": "cm"}'] * 5
+    + ["cm=25"] * 5
+    + ["Distance: 25 cm"] * 5
+)
+
+
+def legacy_parse(line: str):
+    """기존 GameState._handle_serial_line의 파싱 부분 (부수효과 제외)"""
+    cm = None
+    near = False
+    try:
+        obj = json.loads(line)
+        if "distance" in obj:
+            cm = float(obj["distance"])
+        elif "cm" in obj:
+            cm = float(obj["cm"])
+        if obj.get("near"):
+            near = True
+    except json.JSONDecodeError:
+        if line.startswith("cm="):
+            cm = float(line.split("=", 1)[1])
+        elif line.startswith("Distance:"):
+            parts = line.split()
+            if len(parts) >= 2:
+                cm = float(parts[1])
+    return cm, near
+
+
+def bench(name, fn, rounds=2000):
+    n = 0
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        for line in LINES:
+            fn(line)
+            n += 1
+    dt = time.perf_counter() - t0
+    rate = n / dt
+    print(f"{name:<12} {n:>8}줄  {dt * 1000:8.1f}ms  {rate:12,.0f} 줄/초")
+    return rate
+
+
+if __name__ == "__main__":
+    # 두 파서가 같은 값을 내는지 먼저 확인
+    for line in set(LINES):
+        s = parse_line(line, 0.0)
+        assert (s.cm, s.near) == legacy_parse(line), line
+
+    before = bench("기존(json)", legacy_parse)
+    after = bench("parse_line", lambda line: parse_line(line, 0.0))
+    print(f"속도 향상: {after / before:.1f}배")
+
+    # 바이너리 프레임 모드: 같은 개수의 샘플을 한 덩어리씩 디코딩
+    frames = [encode_binary_frame(i, i * 10, 17.0, i % 20 == 0) for i in range(len(LINES))]
+    chunk = b"".join(frames)
+    decoder = BinaryFrameDecoder()
+    t0 = time.perf_counter()
+    rounds = 2000
+    for _ in range(rounds):
+        decoder.feed(chunk, 0.0)
+    dt = time.perf_counter() - t0
+    n = rounds * len(frames)
+    print(f"{'binary':<12} {n:>8}개  {dt * 1000:8.1f}ms  {n / dt:12,.0f} 샘플/초 (유실 {decoder.dropped})")
+    print(f"전송량: 텍스트 {sum(len(l) + 2 for l in LINES)}B / 바이너리 {len(chunk)}B")
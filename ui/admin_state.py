@@ -2,49 +2,59 @@
 # 관리자 페이지 - 시스템 설정 및 관리
 import pygame
 import os
-import time
-import json
 from typing import Optional, List, Dict
 import config as cfg
 from core.viewport import Viewport
 from core.fonts import FontPack
-from core.leaderboard import load_scores, save_score, reset_leaderboard, DATA_FILE
-from core.path_utils import get_asset_path, safe_image_load
-from core.settings import get_camera_index, set_camera_index, get_serial_port, set_serial_port
-
-try:
-    from serial import Serial
-    from serial.tools import list_ports
-    import glob
-except Exception:
-    Serial = None
-    list_ports = None
-    glob = None
+from core.leaderboard import load_scores, replace_scores, reset_leaderboard
+from core.path_utils import get_asset_path
+from core.surface_cache import load_image, get_scaled
+from core.camera import CameraSource, FramePresenter
+from core.camera_manager import backend_name, get_camera_manager
+from core import clock
+from core.sensor_hub import CONNECTING, LINK_LABELS, candidate_ports, get_sensor_hub
+from core.protocol import SensorSample
+from core.log import get_logger, sample_logging_enabled, set_sample_logging
+from core.settings import get_camera_index, get_camera_profile, set_camera_index, get_serial_port
 
 try:
     import cv2 as cv
 except Exception:
     cv = None
 
+log = get_logger("admin")
+serial_log = get_logger("serial")
+camera_log = get_logger("camera")
+
 class AdminState:
     def __init__(self):
         # 시리얼/센서 (저장된 포트 로드)
-        self.ser = None
+        # 연결은 공용 센서 허브(core/sensor_hub.py)가 유지 - 이 화면은 구독해서 표시/재연결만
+        self.sensors = get_sensor_hub()
         saved_port = get_serial_port()
-        self.serial_port = saved_port if saved_port else cfg.SERIAL_DEFAULT_PORT
+        self.serial_port = self.sensors.port or saved_port or cfg.SERIAL_DEFAULT_PORT
         self.serial_baud = cfg.SERIAL_BAUD
-        self.serial_connected = False
-        self.serial_error = ""
+        self.serial_connected = self.sensors.connected
+        self.serial_error = self.sensors.error
         self.latest_distance = None
         self.distance_history: List[float] = []
-        self._rx_buf = ""
-        
-        # 카메라 (저장된 인덱스 로드)
-        self.camera_index = get_camera_index()
+        self.clock_sync = self.sensors.clock_sync  # 장치 시계 동기화 추정 (오차 표시용)
+        self.serial_scan = None     # 진행 중인 포트 탐색 (Future)
+        self.serial_probes: list = []  # 마지막 탐색 결과 (SerialProbe)
+        
+        # 카메라 (게임이 이미 연 장치 -> 마지막으로 성공한 설정 -> 저장된 인덱스 순)
+        # 게임이 다른 인덱스에서 찾았을 수 있으므로 공용 관리자 기준으로 맞춤 (예전 인덱스로 다시 열지 않도록)
+        manager = get_camera_manager()
+        if manager.index is not None:
+            self.camera_index = manager.index
+        else:
+            self.camera_index = get_camera_profile().get("index", get_camera_index())
         self.camera_connected = False
         self.camera_error = ""
         self.camera_frame = None
-        self.cap = None
+        self.camera_seq = 0
+        self._presenter = FramePresenter()
+        self.camera: Optional[CameraSource] = None  # 공용 캡처 스레드 (core/camera_manager.py)
         
         # 리더보드
         self.leaderboard_data: List[Dict] = []
@@ -62,8 +72,9 @@ class AdminState:
         # 배경 이미지
         self._load_images()
         
-        # 자동 연결 시도
-        self._try_connect_serial()
+        # 자동 연결 시도 (시리얼은 끊겨 있을 때만 - 열린 연결은 그대로 사용)
+        if not self.sensors.connected and self.sensors.state != CONNECTING:
+            self._try_connect_serial(auto=True)
         self._try_connect_camera()
         self._load_leaderboard()
     
@@ -71,215 +82,140 @@ class AdminState:
         """배경 이미지 로딩"""
         base_path = get_asset_path("images", "title_state")
         try:
-            self.bg_image = safe_image_load(os.path.join(base_path, "background.jpg"))
-            self.board_background = safe_image_load(os.path.join(base_path, "board_background.png"))
+            self.bg_image = load_image(os.path.join(base_path, "background.jpg"))
+            self.board_background = load_image(os.path.join(base_path, "board_background.png"))
         except Exception as e:
-            print(f"관리자 페이지 이미지 로딩 실패: {e}")
+            log.warning(f"관리자 페이지 이미지 로딩 실패: {e}")
             self.bg_image = None
             self.board_background = None
     
     # ========== 시리얼/센서 ==========
     def _candidate_ports(self) -> List[str]:
         """사용 가능한 시리얼 포트 찾기"""
-        if list_ports is None:
-            return []
-        
-        ports = []
-        
-        # macOS에서 USB 시리얼 포트 찾기
-        if glob is not None:
-            try:
-                usb_ports = glob.glob('/dev/tty.usbmodem*')
-                usb_ports.extend(glob.glob('/dev/tty.usbserial*'))
-                ports.extend(usb_ports)
-            except Exception:
-                pass
-        
-        # Windows/Linux에서 포트 찾기
-        for p in list_ports.comports():
-            name = p.device
-            if "usbmodem" in name or "usbserial" in name or name.startswith("COM"):
-                if name not in ports:
-                    ports.append(name)
-        
-        return sorted(set(ports))
-    
-    def _try_connect_serial(self):
-        """시리얼 포트 연결 시도"""
-        if Serial is None:
-            self.serial_error = "pyserial이 설치되지 않았습니다"
-            return False
-        
-        # 이미 연결되어 있으면 해제
-        if self.ser:
-            try:
-                self.ser.close()
-            except:
-                pass
-            self.ser = None
-        
-        # 포트 자동 찾기
-        if self.serial_port is None:
-            ports = self._candidate_ports()
-            if ports:
-                self.serial_port = ports[0]
-            else:
-                self.serial_error = "시리얼 포트를 찾을 수 없습니다"
-                self.serial_connected = False
-                return False
-        
-        # 연결 시도
-        try:
-            self.ser = Serial(self.serial_port, self.serial_baud, timeout=1)
-            self.ser.reset_input_buffer()
-            self.ser.reset_output_buffer()
-            time.sleep(0.5)
-            self.serial_connected = True
-            self.serial_error = ""
-            set_serial_port(self.serial_port)  # 포트 저장
-            print(f"[ADMIN] 시리얼 연결 성공: {self.serial_port}")
-            return True
-        except Exception as e:
-            self.serial_connected = False
-            self.serial_error = f"연결 실패: {e}"
-            print(f"[ADMIN] 시리얼 연결 실패: {e}")
-            return False
+        return candidate_ports()
     
+    def _try_connect_serial(self, auto: bool = False):
+        """시리얼 포트 연결 요청 (백그라운드에서 열림 - 결과는 _read_serial에서 반영)
+        auto=True면 포트를 허브에 맡김 (저장된 장치부터 시도, 실패하면 전체 탐색)"""
+        if auto:
+            self.sensors.connect()
+        else:
+            # 포트 자동 찾기
+            if self.serial_port is None:
+                ports = self._candidate_ports()
+                if ports:
+                    self.serial_port = ports[0]
+                else:
+                    self.serial_error = "시리얼 포트를 찾을 수 없습니다"
+                    self.serial_connected = False
+                    return False
+            self.sensors.connect(self.serial_port)  # 포트는 연결에 성공하면 허브가 저장
+        self.serial_connected = False
+        self.serial_error = self.sensors.error
+        return True
+
     def _disconnect_serial(self):
         """시리얼 포트 연결 해제"""
-        if self.ser:
-            try:
-                self.ser.close()
-            except:
-                pass
-            self.ser = None
+        self.sensors.disconnect()
         self.serial_connected = False
         self.serial_error = ""
     
-    def _read_serial(self):
-        """시리얼 데이터 읽기"""
-        if not self.serial_connected or not self.ser:
+    def _scan_serial(self):
+        """후보 포트를 동시에 열어 ping/pong 확인 (백그라운드 - 결과는 _read_serial에서 반영)"""
+        if self.serial_scan is not None:
             return
-        
-        try:
-            if self.ser.in_waiting > 0:
-                try:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        self._handle_serial_line(line)
-                except Exception as e:
-                    print(f"[ADMIN] 시리얼 읽기 오류: {e}")
-        except Exception as e:
-            print(f"[ADMIN] 시리얼 연결 오류: {e}")
-            self.serial_connected = False
-            self.serial_error = str(e)
+        self.serial_scan = self.sensors.scan()
+        self.serial_probes = []
+
+    def _read_serial(self):
+        """허브 연결 상태 반영 (샘플은 main.py의 sensors.pump()가 _handle_sample로 전달)"""
+        hub = self.sensors
+        if self.serial_scan is not None and self.serial_scan.done():
+            self.serial_probes = self.serial_scan.result()
+            self.serial_scan = None
+            best = next((p for p in self.serial_probes if p.verified), None)  # 응답한 포트만
+            if best is not None:
+                self.serial_port = best.port
+                self._try_connect_serial()
+            else:
+                serial_log.warning("포트 탐색: 응답하는 장치 없음")
+        if self.serial_connected and not hub.connected and hub.error:
+            serial_log.warning(f"시리얼 연결 오류: {hub.error}")
+        self.serial_connected = hub.connected
+        self.serial_error = hub.error
+        if hub.port:
+            self.serial_port = hub.port
     
-    def _handle_serial_line(self, line: str):
-        """시리얼 데이터 파싱"""
-        try:
-            # JSON 형식 파싱
-            obj = json.loads(line)
-            
-            if "distance" in obj:
-                distance = float(obj["distance"])
-                self.latest_distance = distance
-                self.distance_history.append(distance)
-                if len(self.distance_history) > 50:
-                    self.distance_history.pop(0)
-            elif "cm" in obj:
-                distance = float(obj["cm"])
-                self.latest_distance = distance
-                self.distance_history.append(distance)
-                if len(self.distance_history) > 50:
-                    self.distance_history.pop(0)
-        except json.JSONDecodeError:
-            # 텍스트 형식
-            if "cm=" in line:
-                try:
-                    distance = float(line.split("=", 1)[1])
-                    self.latest_distance = distance
-                    self.distance_history.append(distance)
-                    if len(self.distance_history) > 50:
-                        self.distance_history.pop(0)
-                except:
-                    pass
-        except Exception as e:
-            print(f"[ADMIN] 데이터 파싱 오류: {e}")
+    def _on_link(self, event):
+        """허브 연결 상태 변화 (분리/자동 재연결) - 어느 탭에 있든 상태 표시 갱신"""
+        self.serial_connected = self.sensors.connected
+        self.serial_error = self.sensors.error
+        if event.port:
+            self.serial_port = event.port
+
+    def _handle_sample(self, sample):
+        """core.protocol 공용 파서가 만든 샘플 반영"""
+        if isinstance(sample, SensorSample) and sample.cm is not None:
+            self.latest_distance = sample.cm
+            self.distance_history.append(sample.cm)
+            if len(self.distance_history) > 50:
+                self.distance_history.pop(0)
     
     # ========== 카메라 ==========
-    def _try_connect_camera(self):
-        """카메라 연결 시도"""
+    def _try_connect_camera(self, reopen: bool = False, scan: bool = False):
+        """카메라 연결 시도 (공용 관리자 - 같은 인덱스가 이미 열려 있으면 그대로 사용)
+        저장된 설정으로 바로 안 열리면 관리자가 백그라운드에서 찾음 - 끝나면 update에서 다시 호출"""
         if cv is None:
             self.camera_error = "opencv-python이 설치되지 않았습니다"
             return False
         
-        # 이미 연결되어 있으면 해제
-        if self.cap:
-            try:
-                self.cap.release()
-            except:
-                pass
-            self.cap = None
+        # 이 화면이 들고 있던 소스를 먼저 내려놓음
+        self._stop_camera_source()
         
-        # 연결 시도
-        try:
-            if os.name == 'nt':
-                backends = [cv.CAP_DSHOW, cv.CAP_MSMF, cv.CAP_ANY]
-            else:
-                backends = [cv.CAP_AVFOUNDATION, cv.CAP_V4L2, cv.CAP_ANY]
-            
-            for backend in backends:
-                try:
-                    self.cap = cv.VideoCapture(self.camera_index, backend)
-                    if self.cap and self.cap.isOpened():
-                        self.camera_connected = True
-                        self.camera_error = ""
-                        set_camera_index(self.camera_index)  # 인덱스 저장
-                        print(f"[ADMIN] 카메라 연결 성공: 인덱스 {self.camera_index}")
-                        return True
-                    else:
-                        if self.cap:
-                            self.cap.release()
-                        self.cap = None
-                except Exception as e:
-                    print(f"[ADMIN] 백엔드 {backend} 실패: {e}")
-                    continue
-            
-            self.camera_connected = False
-            self.camera_error = f"카메라 인덱스 {self.camera_index}에 연결할 수 없습니다"
-            return False
-            
-        except Exception as e:
+        manager = get_camera_manager()
+        self.camera = manager.acquire(None if scan else self.camera_index, scan=scan, reopen=reopen)
+        if self.camera is None:
             self.camera_connected = False
-            self.camera_error = f"연결 실패: {e}"
-            print(f"[ADMIN] 카메라 연결 실패: {e}")
+            self.camera_error = manager.error
             return False
+        self.camera_index = manager.index  # 전체 탐색이면 찾은 인덱스
+        self.camera_connected = True
+        self.camera_error = ""
+        set_camera_index(self.camera_index)  # 인덱스 저장
+        camera_log.info(f"카메라 연결 성공: 인덱스 {self.camera_index}")
+        return True
     
+    def _scan_camera(self):
+        """후보 인덱스 x 백엔드를 모두 시험 (백그라운드 - 끝나면 update에서 가장 좋은 장치로 연결)"""
+        self._stop_camera_source()
+        manager = get_camera_manager()
+        manager.scan()
+        self.camera_connected = False
+        self.camera_error = manager.error
+
+    def _stop_camera_source(self):
+        """이 화면의 카메라 사용 종료 (장치는 공용 관리자가 유지)"""
+        if self.camera:
+            get_camera_manager().detach()
+            self.camera = None
+
     def _disconnect_camera(self):
-        """카메라 연결 해제"""
-        if self.cap:
-            try:
-                self.cap.release()
-            except:
-                pass
-            self.cap = None
+        """카메라 연결 해제 (장치까지 닫음)"""
+        self._stop_camera_source()
+        get_camera_manager().close()
         self.camera_connected = False
         self.camera_frame = None
         self.camera_error = ""
     
     def _read_camera(self):
         """카메라 프레임 읽기"""
-        if not self.camera_connected or not self.cap:
+        if not self.camera_connected or not self.camera:
             return
         
-        try:
-            ret, frame = self.cap.read()
-            if ret:
-                self.camera_frame = cv.flip(frame, 1)
-            else:
-                self.camera_frame = None
-        except Exception as e:
-            print(f"[ADMIN] 카메라 읽기 오류: {e}")
+        # 캡처 스레드의 최신 프레임 (좌우 반전은 렌더 시 리사이즈와 함께 처리)
+        self.camera_frame, _, self.camera_seq = self.camera.latest()
+        if self.camera.error:
+            self.camera_error = self.camera.error
     
     # ========== 리더보드 ==========
     def _load_leaderboard(self):
@@ -287,23 +223,22 @@ class AdminState:
         try:
             self.leaderboard_data = load_scores()
         except Exception as e:
-            print(f"[ADMIN] 리더보드 로딩 실패: {e}")
+            log.error(f"리더보드 로딩 실패: {e}")
             self.leaderboard_data = []
     
     def _save_leaderboard(self):
         """리더보드 데이터 저장"""
         try:
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.leaderboard_data, f, ensure_ascii=False, indent=2)
-            print("[ADMIN] 리더보드 저장 완료")
+            replace_scores(self.leaderboard_data)
+            log.info("리더보드 저장 완료")
         except Exception as e:
-            print(f"[ADMIN] 리더보드 저장 실패: {e}")
+            log.error(f"리더보드 저장 실패: {e}")
     
     def _delete_selected_row(self):
         """선택된 행 삭제"""
         if 0 <= self.selected_row < len(self.leaderboard_data):
             deleted = self.leaderboard_data.pop(self.selected_row)
-            print(f"[ADMIN] 삭제됨: {deleted}")
+            log.info(f"삭제됨: {deleted}")
             self._save_leaderboard()
             if self.selected_row >= len(self.leaderboard_data):
                 self.selected_row = max(0, len(self.leaderboard_data) - 1)
@@ -333,7 +268,7 @@ class AdminState:
                 try:
                     row["best_fast_ms"] = int(self.edit_value)
                 except ValueError:
-                    print("[ADMIN] 잘못된 점수 형식")
+                    log.warning("잘못된 점수 형식")
             
             self._save_leaderboard()
         
@@ -353,19 +288,23 @@ class AdminState:
         self._load_leaderboard()
         self.selected_row = 0
         self.reset_confirm = False
-        print("[ADMIN] 리더보드가 초기 상태로 초기화되었습니다")
+        log.info("리더보드가 초기 상태로 초기화되었습니다")
     
     # ========== 라이프사이클 ==========
     def enter(self):
         """상태 진입"""
         pygame.key.start_text_input()
+        self.sensors.subscribe(self._handle_sample)
+        self.sensors.subscribe_link(self._on_link)
         self._load_leaderboard()
     
     def exit(self):
         """상태 종료"""
         pygame.key.stop_text_input()
-        self._disconnect_serial()
-        self._disconnect_camera()
+        self.sensors.unsubscribe(self._handle_sample)  # 연결은 게임을 위해 유지
+        self.sensors.unsubscribe_link(self._on_link)
+        self._stop_camera_source()  # 장치는 공용 관리자가 계속 열어 둠
+        self.camera_connected = False
     
     # ========== 이벤트 처리 ==========
     def handle_event(self, e: pygame.event.Event):
@@ -427,13 +366,20 @@ class AdminState:
                             idx = 0
                         self.serial_port = ports[idx]
                         self._try_connect_serial()
+                elif e.key == pygame.K_s:  # Scan (후보 포트 동시 확인)
+                    self._scan_serial()
+                elif e.key == pygame.K_l:  # 샘플 로그 전환
+                    set_sample_logging(not sample_logging_enabled())
+                    log.info(f"샘플 로그: {'켜짐' if sample_logging_enabled() else '꺼짐'}")
             
             # 카메라 탭
             elif self.tab == "camera":
-                if e.key == pygame.K_c:  # Connect
-                    self._try_connect_camera()
+                if e.key == pygame.K_c:  # Connect (장치를 다시 엶)
+                    self._try_connect_camera(reopen=True)
                 elif e.key == pygame.K_d:  # Disconnect
                     self._disconnect_camera()
+                elif e.key == pygame.K_s:  # Scan (모든 인덱스/백엔드 동시 탐색)
+                    self._scan_camera()
                 elif e.key == pygame.K_UP:  # Camera Index +1
                     self.camera_index = min(9, self.camera_index + 1)
                     self._try_connect_camera()
@@ -475,10 +421,13 @@ class AdminState:
     # ========== 업데이트 ==========
     def update(self, dt: float):
         """상태 업데이트"""
-        if self.tab == "serial" and self.serial_connected:
+        if self.tab == "serial":
             self._read_serial()
-        elif self.tab == "camera" and self.camera_connected:
-            self._read_camera()
+        elif self.tab == "camera":
+            if self.camera is None and get_camera_manager().search_done:
+                self._try_connect_camera(scan=True)  # 백그라운드 탐색 결과 받기 (찾은 인덱스로)
+            if self.camera_connected:
+                self._read_camera()
     
     # ========== 렌더 ==========
     def render(self, viewport: Viewport, fonts: FontPack):
@@ -487,14 +436,14 @@ class AdminState:
         
         # 배경
         if self.bg_image:
-            bg_scaled = pygame.transform.scale(self.bg_image, (viewport.scaled_w, viewport.scaled_h))
+            bg_scaled = get_scaled(self.bg_image, (viewport.scaled_w, viewport.scaled_h))
             canvas.blit(bg_scaled, (0, 0))
         else:
             canvas.fill((20, 25, 35))
         
         # 제목
         title_text = ""
-        title_surf = fonts.h1.render(title_text, True, cfg.ACC)
+        title_surf = fonts.render("h1", title_text, cfg.ACC)
         title_x = (viewport.scaled_w - title_surf.get_width()) // 2
         canvas.blit(title_surf, (title_x, S(20)))
         
@@ -514,7 +463,7 @@ class AdminState:
         
         # 하단 안내
         help_text = "ESC: 나가기"
-        help_surf = fonts.txt.render(help_text, True, cfg.SUBT)
+        help_surf = fonts.render("txt", help_text, cfg.SUBT)
         help_x = (viewport.scaled_w - help_surf.get_width()) // 2
         canvas.blit(help_surf, (help_x, viewport.scaled_h - S(50)))
     
@@ -546,7 +495,7 @@ class AdminState:
             
             pygame.draw.rect(canvas, color, rect, border_radius=S(10))
             
-            text_surf = fonts.h3.render(label, True, text_color)
+            text_surf = fonts.render("h3", label, text_color)
             text_x = x + (tab_width - text_surf.get_width()) // 2
             text_y = y + (tab_height - text_surf.get_height()) // 2
             canvas.blit(text_surf, (text_x, text_y))
@@ -559,7 +508,7 @@ class AdminState:
         
         # 패널 배경
         if not self.board_background:
-            bg_scaled = pygame.transform.scale(self.board_background, (panel_w, panel_h))
+            bg_scaled = get_scaled(self.board_background, (panel_w, panel_h))
             canvas.blit(bg_scaled, (panel_x, panel_y))
         else:
             panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
@@ -570,28 +519,80 @@ class AdminState:
         x = panel_x + S(50)
         
         # 연결 상태
-        status_text = f"상태: {'연결됨' if self.serial_connected else '연결 안 됨'}"
+        if self.serial_connected:
+            status_text = "상태: 연결됨"
+        elif self.sensors.state == CONNECTING:
+            status_text = "상태: 연결 중..."
+        else:
+            status_text = "상태: 연결 안 됨"
         status_color = cfg.OK if self.serial_connected else cfg.WARN
-        status_surf = fonts.h2.render(status_text, True, status_color)
+        status_surf = fonts.render("h2", status_text, status_color)
         canvas.blit(status_surf, (x, y))
         y += S(60)
         
         # 포트 정보
         port_text = f"포트: {self.serial_port if self.serial_port else '없음'}"
-        port_surf = fonts.h3.render(port_text, True, cfg.TEXT)
+        port_surf = fonts.render("h3", port_text, cfg.TEXT)
         canvas.blit(port_surf, (x, y))
         y += S(50)
-        
+
+        # 마지막 연결 진단 (saved: 저장된 포트, by_id: 같은 VID/PID, scan: 전체 탐색, explicit: 직접 선택)
+        if self.serial_connected and self.sensors.connect_path:
+            probe_text = f"연결: {self.sensors.connect_path}, {self.sensors.connect_ms:.0f} ms"
+            canvas.blit(fonts.render("txt", probe_text, cfg.SUBT), (x, y))
+            y += S(45)
+
+        # 포트 탐색 결과 (응답 순)
+        if self.serial_scan is not None:
+            canvas.blit(fonts.render("txt", "포트 탐색 중...", cfg.SUBT), (x, y))
+            y += S(45)
+        for probe in self.serial_probes[:4]:
+            if probe.pong:
+                probe_text = f"{probe.port}: 응답 (RTT {probe.rtt_ms:.0f} ms)"
+            elif probe.data:
+                probe_text = f"{probe.port}: 샘플 수신 (ping 응답 없음)"
+            elif probe.ok:
+                probe_text = f"{probe.port}: 열림, 응답 없음"
+            else:
+                probe_text = f"{probe.port}: {probe.error}"
+            canvas.blit(fonts.render("txt", probe_text, cfg.OK if probe.verified else cfg.SUBT), (x, y))
+            y += S(35)
+
+        # 장치 시계 동기화 추정
+        reader = self.sensors.reader
+        if self.serial_connected and reader and reader.clock is not None:
+            if self.clock_sync.ready:
+                sync_text = (f"시계 동기화: 오차 ±{self.clock_sync.error_s * 1000:.1f} ms, "
+                             f"RTT {self.clock_sync.min_rtt_s * 1000:.1f} ms, 드리프트 {self.clock_sync.drift_ppm:+.0f} ppm")
+                sync_color = cfg.TEXT
+            else:
+                sync_text = "시계 동기화: 측정 중... (pong에 ms가 없으면 펌웨어 업데이트 필요)"
+                sync_color = cfg.SUBT
+            sync_surf = fonts.render("txt", sync_text, sync_color)
+            canvas.blit(sync_surf, (x, y))
+            y += S(45)
+
         # 에러 메시지
         if self.serial_error:
-            error_surf = fonts.txt.render(f"오류: {self.serial_error}", True, cfg.WARN)
+            error_surf = fonts.render("txt", f"오류: {self.serial_error}", cfg.WARN)
             canvas.blit(error_surf, (x, y))
             y += S(50)
+
+        # 자동 재연결 상태와 최근 연결 기록
+        hub = self.sensors
+        if not self.serial_connected and hub.retry_at is not None:
+            retry_text = f"자동 재연결: {max(0.0, hub.retry_at - clock.now()):.0f}초 후"
+            canvas.blit(fonts.render("txt", retry_text, cfg.SUBT), (x, y))
+            y += S(40)
+        for event in list(hub.history)[-3:]:
+            event_text = f"{clock.now() - event.ts:.0f}초 전 {LINK_LABELS.get(event.kind, event.kind)} {event.port or ''} {event.message}"
+            canvas.blit(fonts.render("txt", event_text.strip(), cfg.SUBT), (x, y))
+            y += S(35)
         
         # 현재 거리
         if self.latest_distance is not None:
             distance_text = f"현재 거리: {self.latest_distance:.1f} cm"
-            distance_surf = fonts.h2.render(distance_text, True, cfg.ACC)
+            distance_surf = fonts.render("h2", distance_text, cfg.ACC)
             canvas.blit(distance_surf, (x, y))
             y += S(80)
             
@@ -629,11 +630,13 @@ class AdminState:
         help_lines = [
             "C: 연결 시도",
             "D: 연결 해제",
-            "P: 다음 포트"
+            "P: 다음 포트",
+            "S: 포트 탐색 (ping 응답 확인)",
+            f"L: 샘플 로그 {'끄기' if sample_logging_enabled() else '켜기'} (현재 {'켜짐' if sample_logging_enabled() else '꺼짐'})",
         ]
         
         for line in help_lines:
-            help_surf = fonts.txt.render(line, True, cfg.SUBT)
+            help_surf = fonts.render("txt", line, cfg.SUBT)
             canvas.blit(help_surf, (x, y))
             y += S(35)
     
@@ -644,7 +647,7 @@ class AdminState:
         
         # 패널 배경
         if not self.board_background:
-            bg_scaled = pygame.transform.scale(self.board_background, (panel_w, panel_h))
+            bg_scaled = get_scaled(self.board_background, (panel_w, panel_h))
             canvas.blit(bg_scaled, (panel_x, panel_y))
         else:
             panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
@@ -657,19 +660,43 @@ class AdminState:
         # 연결 상태
         status_text = f"상태: {'연결됨' if self.camera_connected else '연결 안 됨'}"
         status_color = cfg.OK if self.camera_connected else cfg.WARN
-        status_surf = fonts.h2.render(status_text, True, status_color)
+        status_surf = fonts.render("h2", status_text, status_color)
         canvas.blit(status_surf, (x, y))
         y += S(60)
         
         # 카메라 인덱스
         index_text = f"카메라 인덱스: {self.camera_index}"
-        index_surf = fonts.h3.render(index_text, True, cfg.TEXT)
+        index_surf = fonts.render("h3", index_text, cfg.TEXT)
         canvas.blit(index_surf, (x, y))
         y += S(50)
+
+        # 마지막 열기 진단 (저장된 설정으로 바로 열었는지, 탐색했는지)
+        manager = get_camera_manager()
+        if self.camera_connected and manager.open_path:
+            how = "저장된 설정" if manager.open_path == "fast" else "탐색"
+            probe_text = (f"열기: {how}, 시도 {len(manager.probes)}회, {manager.open_ms:.0f} ms "
+                          f"(백엔드 {backend_name(manager.backend)}, 포맷 {manager.fourcc or '?'})")
+            canvas.blit(fonts.render("txt", probe_text, cfg.SUBT), (x, y))
+            y += S(45)
+
+        # 탐색 결과 (순위 순 - 프레임이 나온 장치가 위)
+        if manager.searching:
+            canvas.blit(fonts.render("txt", "카메라 탐색 중...", cfg.SUBT), (x, y))
+            y += S(45)
+        for probe in manager.last_scan[:4]:
+            probe_text = f"인덱스 {probe.index} / {backend_name(probe.backend)}: "
+            if probe.frame:
+                probe_text += f"프레임 OK ({probe.ms:.0f} ms)"
+            elif probe.ok:
+                probe_text += f"열림, 프레임 없음 ({probe.ms:.0f} ms)"
+            else:
+                probe_text += probe.error
+            canvas.blit(fonts.render("txt", probe_text, cfg.OK if probe.frame else cfg.SUBT), (x, y))
+            y += S(35)
         
         # 에러 메시지
         if self.camera_error:
-            error_surf = fonts.txt.render(f"오류: {self.camera_error}", True, cfg.WARN)
+            error_surf = fonts.render("txt", f"오류: {self.camera_error}", cfg.WARN)
             canvas.blit(error_surf, (x, y))
             y += S(50)
         
@@ -686,10 +713,7 @@ class AdminState:
             preview_x = x + (preview_w - tw) // 2
             preview_y = y
             
-            rgb = cv.cvtColor(self.camera_frame, cv.COLOR_BGR2RGB)
-            surf = pygame.image.frombuffer(rgb.tobytes(), (fw, fh), "RGB")
-            if (fw, fh) != (tw, th):
-                surf = pygame.transform.smoothscale(surf, (tw, th))
+            surf = self._presenter.present(self.camera_frame, (tw, th), True, self.camera_seq)
             
             canvas.blit(surf, (preview_x, preview_y))
             y += th + S(30)
@@ -698,12 +722,13 @@ class AdminState:
         help_lines = [
             "C: 연결 시도",
             "D: 연결 해제",
+            "S: 전체 탐색",
             "↑/↓: 인덱스 변경",
             "0-9: 인덱스 직접 선택"
         ]
         
         for line in help_lines:
-            help_surf = fonts.txt.render(line, True, cfg.SUBT)
+            help_surf = fonts.render("txt", line, cfg.SUBT)
             canvas.blit(help_surf, (x, y))
             y += S(35)
     
@@ -714,7 +739,7 @@ class AdminState:
         
         # 패널 배경
         if not self.board_background:
-            bg_scaled = pygame.transform.scale(self.board_background, (panel_w, panel_h))
+            bg_scaled = get_scaled(self.board_background, (panel_w, panel_h))
             canvas.blit(bg_scaled, (panel_x, panel_y))
         else:
             panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
@@ -725,7 +750,7 @@ class AdminState:
         x = panel_x + S(50)
         
         # 제목
-        title_surf = fonts.h2.render("리더보드 데이터", True, cfg.TEXT)
+        title_surf = fonts.render("h2", "리더보드 데이터", cfg.TEXT)
         canvas.blit(title_surf, (x, y))
         y += S(60)
         
@@ -735,7 +760,7 @@ class AdminState:
         headers = ["순위", "이름", "시간(ms)", "점수"]
         
         for i, header in enumerate(headers):
-            header_surf = fonts.h3.render(header, True, cfg.ACC)
+            header_surf = fonts.render("h3", header, cfg.ACC)
             canvas.blit(header_surf, (col_x[i], y))
         y += S(50)
         
@@ -759,7 +784,7 @@ class AdminState:
             
             # 순위
             rank_text = str(idx + 1)
-            rank_surf = fonts.txt.render(rank_text, True, cfg.TEXT)
+            rank_surf = fonts.render("txt", rank_text, cfg.TEXT)
             canvas.blit(rank_surf, (col_x[0], y))
             
             # 이름
@@ -770,7 +795,7 @@ class AdminState:
             else:
                 name_text = name
                 name_color = cfg.TEXT
-            name_surf = fonts.txt.render(name_text, True, name_color)
+            name_surf = fonts.render("txt", name_text, name_color)
             canvas.blit(name_surf, (col_x[1], y))
             
             # 시간
@@ -781,12 +806,12 @@ class AdminState:
             else:
                 time_text = str(time_ms)
                 time_color = cfg.TEXT
-            time_surf = fonts.txt.render(time_text, True, time_color)
+            time_surf = fonts.render("txt", time_text, time_color)
             canvas.blit(time_surf, (col_x[2], y))
             
             # 점수
             score = row.get("best_score", 0)
-            score_surf = fonts.txt.render(str(score), True, cfg.TEXT)
+            score_surf = fonts.render("txt", str(score), cfg.TEXT)
             canvas.blit(score_surf, (col_x[3], y))
             
             y += S(45)
@@ -797,7 +822,7 @@ class AdminState:
         if self.reset_confirm:
             # 초기화 확인 메시지
             confirm_text = "정말로 리더보드를 초기화하시겠습니까?"
-            confirm_surf = fonts.h3.render(confirm_text, True, cfg.WARN)
+            confirm_surf = fonts.render("h3", confirm_text, cfg.WARN)
             canvas.blit(confirm_surf, (x, y))
             y += S(50)
             
@@ -821,6 +846,6 @@ class AdminState:
             ]
         
         for line in help_lines:
-            help_surf = fonts.txt.render(line, True, cfg.SUBT)
+            help_surf = fonts.render("txt", line, cfg.SUBT)
             canvas.blit(help_surf, (x, y))
             y += S(35)
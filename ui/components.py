@@ -4,6 +4,7 @@ import pygame
 from typing import List, Dict
 
 import config as cfg
+from core.fonts import FontPack
 
 # ----- 유틸 -----
 def _scale_from_rect(rect: pygame.Rect, base_h: int = 360) -> float:
@@ -32,7 +33,7 @@ def _ellipsize(text: str, font: pygame.font.Font, max_w: int) -> str:
     return text[:max(0, lo - 1)] + ell
 
 # ----- 카드 -----
-def draw_card(surf: pygame.Surface, rect: pygame.Rect, title: str, font_h2: pygame.font.Font):
+def draw_card(surf: pygame.Surface, rect: pygame.Rect, title: str, fonts: FontPack):
     s = _scale_from_rect(rect)
     radius = _S(16, s)
     border = max(1, _S(2, s))
@@ -44,7 +45,7 @@ def draw_card(surf: pygame.Surface, rect: pygame.Rect, title: str, font_h2: pyga
     pygame.draw.rect(surf, cfg.LINE, rect, width=border, border_radius=radius)
 
     # Title
-    title_surf = font_h2.render(title, True, cfg.TEXT)
+    title_surf = fonts.render("h2", title, cfg.TEXT)
     surf.blit(title_surf, (rect.x + pad_x, rect.y + pad_top))
 
     # Title underline
@@ -63,8 +64,7 @@ def draw_table(
     headers: List[str],
     rows: List[Dict],
     col_w: List[int],
-    font_h3: pygame.font.Font,
-    font_txt: pygame.font.Font,
+    fonts: FontPack,
 ):
     s = _scale_from_rect(rect)
     pad_x = _S(20, s)
@@ -78,7 +78,7 @@ def draw_table(
 
     # 헤더
     for i, head in enumerate(headers):
-        surf.blit(font_h3.render(head, True, cfg.SUBT), (col_x[i], head_top))
+        surf.blit(fonts.render("h3", head, cfg.SUBT), (col_x[i], head_top))
 
     # 행들
     y = row_top
@@ -101,8 +101,8 @@ def draw_table(
         vals = [str(idx), r.get("name", "-"), str(last_str)]
         # 각 컬럼 그리기 (폭 내 말줄임)
         for i, val in enumerate(vals):
-            txt = _ellipsize(val, font_txt, max(10, col_w[i] - _S(8, s)))
-            surf.blit(font_txt.render(txt, True, cfg.TEXT), (col_x[i], y))
+            txt = _ellipsize(val, fonts.txt, max(10, col_w[i] - _S(8, s)))
+            surf.blit(fonts.render("txt", txt, cfg.TEXT), (col_x[i], y))
 
         y += row_gap
 
@@ -114,9 +114,7 @@ def draw_input_box(
     text: str,
     cursor_on: bool,
     composing: str,
-    font_h2: pygame.font.Font,
-    font_h3: pygame.font.Font,
-    font_txt: pygame.font.Font,
+    fonts: FontPack,
     *,
     text_align: str = "left",
     placeholder_align: str = "center",
@@ -132,11 +130,11 @@ def draw_input_box(
 
     # 라벨
     label_pos = (rect.x + pad_x, rect.y - _S(48, s))
-    surf.blit(font_h3.render(label, True, cfg.SUBT), label_pos)
+    surf.blit(fonts.render("h3", label, cfg.SUBT), label_pos)
 
     # ===== 입력 텍스트 =====
     shown = text if text else ""
-    text_surf = font_h2.render(shown, True, cfg.TEXT)
+    text_surf = fonts.render("h2", shown, cfg.TEXT)
 
     # 정렬 계산
     def _aligned_x(w: int, align: str) -> int:
@@ -155,7 +153,7 @@ def draw_input_box(
 
     # ===== 조합(IME) 중 문자열 or 커서 =====
     if composing:
-        comp_surf = font_h2.render(composing, True, cfg.ACC)
+        comp_surf = fonts.render("h2", composing, cfg.ACC)
         cx = text_x + (text_surf.get_width() if shown else 0)
         cy = text_y
         surf.blit(comp_surf, (cx, cy))
@@ -178,7 +176,7 @@ def draw_input_box(
     # ===== 플레이스홀더(힌트) – 비어 있을 때 중앙 정렬 =====
     if (not shown) and (not composing):
         hint = "이름을 입력하고 Enter를 누르세요"
-        hint_surf = font_txt.render(hint, True, (140, 150, 160))
+        hint_surf = fonts.render("txt", hint, (140, 150, 160))
 
         if placeholder_align == "center":
             hx = rect.x + (rect.w - hint_surf.get_width()) // 2
@@ -1,52 +1,54 @@
 # ui/game_state.py
 # 웹캠 + 아두이노(초음파) + 판정(SPEED/CLOSEST) GameState
-import time
 import os
 from typing import Optional, List
 
 import pygame
-import cv2 as cv
-import json
 import config as cfg
 from core.viewport import Viewport
 from core.fonts import FontPack
-from core.leaderboard import save_score
-from core.path_utils import get_asset_path, safe_image_load
-from core.settings import get_camera_index, get_serial_port
-
-try:
-    from serial import Serial
-    from serial.tools import list_ports
-    import glob
-except Exception:
-    Serial = None
-    list_ports = None
-    glob = None
-
+from core.leaderboard import submit_score
+from core.path_utils import get_asset_path
+from core.surface_cache import load_image, get_scaled
+from core.camera import CameraSource, FramePresenter
+from core.camera_manager import get_camera_manager
+from core.sensor_hub import CONNECTING, DISCONNECTED, LINK_LABELS, candidate_ports, get_sensor_hub
+from core import clock
+from core.log import get_logger
+from core.protocol import SensorSample
+from core.settings import get_serial_port
+
+
+log = get_logger("game")
+serial_log = get_logger("serial")
+camera_log = get_logger("camera")
 
 class GameState:
+    reports_dirty = True  # 바뀐 영역을 viewport.mark_dirty로 보고함
+
     def __init__(self, cam_index: int = None, target_fps: int = 30, prefer_size=(1280, 720), player_name: str = ""):
-        # 카메라 (저장된 인덱스 사용)
-        if cam_index is None:
-            cam_index = get_camera_index()
+        # 카메라 (None이면 이미 열린 장치 또는 저장된 인덱스)
         self.cam_index = cam_index
         self.target_fps = target_fps
         self.prefer_size = prefer_size
-        self.cap: Optional[cv.VideoCapture] = None
+        self.camera: Optional[CameraSource] = None  # 공용 캡처 스레드 (최신 프레임 슬롯)
         self.frame = None
+        self.frame_seq = 0
+        self._presenter = FramePresenter()     # 프레임 -> Surface 변환 (버퍼 재사용)
         self.mirror = True
         self.ok_cam = False
         self.err_cam = ""
         self.player_name = player_name
 
-        # 직렬
-        self.ser = None
+        # 직렬 (연결은 main.py가 여는 공용 센서 허브가 유지 - 여기서는 구독만)
+        self.sensors = get_sensor_hub()
         saved_port = get_serial_port()
-        self.serial_port = saved_port if saved_port else cfg.SERIAL_DEFAULT_PORT  # 저장된 포트 사용
-        self.serial_baud = cfg.SERIAL_BAUD
-        self.ok_ser = False
-        self.err_ser = ""
-        self._rx_buf = ""
+        self.serial_port = self.sensors.port or saved_port or cfg.SERIAL_DEFAULT_PORT
+        self.ok_ser = self.sensors.connected
+        self.err_ser = self.sensors.error
+        self.clock_sync = self.sensors.clock_sync  # 장치 millis() -> 호스트 시각 (근접 판정 시각 보정)
+        self.link_event = self.sensors.history[-1] if self.sensors.history else None  # 마지막 연결 상태 변화
+        self._link_lost = False  # 이번 판에서 연결이 끊긴 적 있음 (다시 연결되면 잠깐 알림)
 
         # 센서/판정 상태
         self.latest_cm: Optional[float] = None
@@ -70,6 +72,13 @@ class GameState:
 
         # 전환
         self.next: Optional[tuple[str, dict]] = None
+
+        # 정적 레이어 캐시 (enter/창 크기 변경 시 재합성)
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_key = None
+        self._video_rect = pygame.Rect(0, 0, 0, 0)
+        self._foreground: List[tuple] = []
+        self._overlay: Optional[pygame.Surface] = None
         
         # 이미지 로딩
         self._load_images()
@@ -80,21 +89,21 @@ class GameState:
         
         try:
             # 배경 이미지
-            self.bg_image = safe_image_load(os.path.join(base_path, "background.jpg"))
+            self.bg_image = load_image(os.path.join(base_path, "background.jpg"))
             
             # 타이틀 이미지
-            self.title_image = safe_image_load(os.path.join(base_path, "way_to_ssulmo_center.png"))
+            self.title_image = load_image(os.path.join(base_path, "way_to_ssulmo_center.png"))
             
             # 캐릭터 이미지들
-            self.character_left = safe_image_load(os.path.join(base_path, "smile_book.png"))  # 왼쪽 캐릭터
-            self.character_right = safe_image_load(os.path.join(base_path, "smile_dduddu.png"))  # 오른쪽 캐릭터
-            self.character_top_right = safe_image_load(os.path.join(base_path, "ssulmon.png"))  # 오른쪽 상단 캐릭터
+            self.character_left = load_image(os.path.join(base_path, "smile_book.png"))  # 왼쪽 캐릭터
+            self.character_right = load_image(os.path.join(base_path, "smile_dduddu.png"))  # 오른쪽 캐릭터
+            self.character_top_right = load_image(os.path.join(base_path, "ssulmon.png"))  # 오른쪽 상단 캐릭터
             
             # 기타 이미지들
-            self.gwangmyeong_image = safe_image_load(os.path.join(base_path, "gwangmyeong_x_ssulmo_white.png"))
+            self.gwangmyeong_image = load_image(os.path.join(base_path, "gwangmyeong_x_ssulmo_white.png"))
             
         except Exception as e:
-            print(f"게임 이미지 로딩 실패: {e}")
+            log.warning(f"게임 이미지 로딩 실패: {e}")
             # 기본값으로 None 설정
             self.bg_image = None
             self.title_image = None
@@ -105,303 +114,117 @@ class GameState:
 
     # ---------- 라이프사이클 ----------
     def enter(self):
+        self._static_layer = None
         self._open_camera()
         self._open_serial()
         
         # 게임 시작 시간 설정 (게임 진입 시점)
-        self.game_start_time = time.time()
-        print(f"[GAME] 게임 시작! 시작 시간: {time.strftime('%H:%M:%S')}")
+        self.game_start_time = clock.now()
+        log.info(f"게임 시작! 시작 시간: {clock.wall_str()}")
 
     def exit(self):
-        if self.cap:
-            self.cap.release()
-            self.cap = None
-        if self.ser:
-            try: self.ser.close()
-            except Exception: pass
-            self.ser = None
+        if self.camera:
+            get_camera_manager().detach()  # 장치는 다음 판을 위해 열어 둠
+            self.camera = None
+        self._close_serial()
 
     # ---------- 내부 유틸 ----------
     def _open_camera(self):
-        try:
-            # Windows와 macOS/Linux에서 다른 백엔드 사용
-            if os.name == 'nt':  # Windows
-                backends = [cv.CAP_DSHOW, cv.CAP_MSMF, cv.CAP_ANY]
-                print("Windows 환경에서 웹캠 연결 시도...")
-                print("Windows 웹캠 문제 해결 방법:")
-                print("1. 웹캠이 다른 프로그램에서 사용 중인지 확인")
-                print("2. 웹캠 드라이버 업데이트")
-                print("3. Windows 카메라 앱에서 웹캠 권한 확인")
-            else:  # macOS/Linux
-                backends = [cv.CAP_AVFOUNDATION, cv.CAP_V4L2, cv.CAP_ANY]
-                print("macOS/Linux 환경에서 웹캠 연결 시도...")
-            
-            self.cap = None
-            
-            # 먼저 기본 인덱스로 시도
-            for backend in backends:
-                try:
-                    print(f"백엔드 {backend}로 카메라 {self.cam_index} 연결 시도...")
-                    self.cap = cv.VideoCapture(self.cam_index, backend)
-                    if self.cap and self.cap.isOpened():
-                        print(f"웹캠 연결 성공 (백엔드: {backend})")
-                        break
-                    else:
-                        if self.cap:
-                            self.cap.release()
-                        self.cap = None
-                except Exception as e:
-                    print(f"백엔드 {backend} 실패: {e}")
-                    continue
-            
-            # 기본 인덱스로 실패한 경우 다른 인덱스 시도
-            if not self.cap or not self.cap.isOpened():
-                print("기본 카메라 인덱스로 연결 실패, 다른 인덱스 시도...")
-                
-                # Windows에서는 더 많은 인덱스 시도
-                if os.name == 'nt':
-                    indices_to_try = [1, 2, 3, 0]  # Windows에서는 1,2,3번도 시도
-                else:
-                    indices_to_try = [1, 2, 0]
-                
-                for idx in indices_to_try:
-                    if idx == self.cam_index:
-                        continue
-                    print(f"카메라 인덱스 {idx} 시도...")
-                    
-                    for backend in backends:
-                        try:
-                            self.cap = cv.VideoCapture(idx, backend)
-                            if self.cap and self.cap.isOpened():
-                                self.cam_index = idx
-                                print(f"웹캠 연결 성공 (인덱스: {idx}, 백엔드: {backend})")
-                                break
-                            else:
-                                if self.cap:
-                                    self.cap.release()
-                                self.cap = None
-                        except Exception as e:
-                            print(f"인덱스 {idx}, 백엔드 {backend} 실패: {e}")
-                            continue
-                    if self.cap and self.cap.isOpened():
-                        break
-                
-                if not self.cap or not self.cap.isOpened():
-                    self.ok_cam = False
-                    error_msg = "웹캠을 찾을 수 없습니다."
-                    
-                    if os.name == 'nt':
-                        error_msg += "\n\nWindows 웹캠 문제 해결 방법:"
-                        error_msg += "\n1. 웹캠이 다른 프로그램에서 사용 중인지 확인"
-                        error_msg += "\n2. 웹캠 드라이버 업데이트"
-                        error_msg += "\n3. Windows 설정 > 개인정보 > 카메라 권한 확인"
-                        error_msg += "\n4. 웹캠을 물리적으로 연결/재연결"
-                        error_msg += "\n5. webcam_test.py 스크립트로 진단 실행"
-                    else:
-                        error_msg += "\n\nmacOS/Linux 웹캠 문제 해결 방법:"
-                        error_msg += "\n1. 웹캠 권한 확인"
-                        error_msg += "\n2. 다른 프로그램에서 웹캠 사용 중인지 확인"
-                        error_msg += "\n3. webcam_test.py 스크립트로 진단 실행"
-                    
-                    self.err_cam = error_msg
-                    print("모든 카메라 인덱스와 백엔드 시도 실패")
-                    print("webcam_test.py 스크립트를 실행하여 웹캠 상태를 진단하세요.")
-                    return
-            
-            # 카메라 설정
-            w, h = self.prefer_size
-            print(f"카메라 해상도 설정: {w}x{h}, FPS: {self.target_fps}")
-            
-            # Windows에서는 설정 순서가 중요할 수 있음
-            if os.name == 'nt':
-                # Windows: FPS 먼저 설정
-                self.cap.set(cv.CAP_PROP_FPS, self.target_fps)
-                self.cap.set(cv.CAP_PROP_FRAME_WIDTH, w)
-                self.cap.set(cv.CAP_PROP_FRAME_HEIGHT, h)
-            else:
-                # macOS/Linux: 해상도 먼저 설정
-                self.cap.set(cv.CAP_PROP_FRAME_WIDTH, w)
-                self.cap.set(cv.CAP_PROP_FRAME_HEIGHT, h)
-                self.cap.set(cv.CAP_PROP_FPS, self.target_fps)
-            
-            # 실제 설정된 값 확인
-            actual_width = int(self.cap.get(cv.CAP_PROP_FRAME_WIDTH))
-            actual_height = int(self.cap.get(cv.CAP_PROP_FRAME_HEIGHT))
-            actual_fps = self.cap.get(cv.CAP_PROP_FPS)
-            
-            print(f"실제 카메라 설정: {actual_width}x{actual_height}, FPS: {actual_fps}")
-            
-            # 로깅 레벨 설정
-            try:
-                cv.utils.logging.setLogLevel(cv.utils.logging.LOG_LEVEL_ERROR)
-            except Exception:
-                pass
-                
-            self.ok_cam = True
-            print(f"웹캠 초기화 완료: 인덱스 {self.cam_index}, 해상도 {actual_width}x{actual_height}, FPS {actual_fps}")
-            
-        except Exception as e:
-            self.ok_cam = False
-            error_msg = f"카메라 초기화 실패: {e}"
-            
-            if os.name == 'nt':
-                error_msg += "\n\nWindows 특정 해결 방법:"
-                error_msg += "\n1. 관리자 권한으로 실행"
-                error_msg += "\n2. DirectShow 필터 확인"
-                error_msg += "\n3. webcam_test.py로 진단"
-            
-            self.err_cam = error_msg
-            print(f"카메라 초기화 오류: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def _candidate_ports(self) -> List[str]:
-        if list_ports is None:
-            return []
-        
-        ports = []
-        
-        # macOS에서 glob 패턴으로 USB 시리얼 포트 찾기 (테스트 코드 방식)
-        if glob is not None:
-            try:
-                usb_ports = glob.glob('/dev/tty.usbmodem*')
-                usb_ports.extend(glob.glob('/dev/tty.usbserial*'))
-                ports.extend(usb_ports)
-            except Exception:
-                pass
-        
-        # 기존 방식으로도 찾기
-        for p in list_ports.comports():
-            name = p.device
-            if "usbmodem" in name or "usbserial" in name or name.startswith("COM"):
-                if name not in ports:  # 중복 방지
-                    ports.append(name)
-        
-        return sorted(set(ports))
+        # 공용 관리자가 이미 연 장치가 있으면 그대로 받음 (첫 판에만 실제로 탐색)
+        manager = get_camera_manager()
+        self.camera = manager.acquire(self.cam_index, prefer_size=self.prefer_size, fps=self.target_fps)
+        self.ok_cam = self.camera is not None
+        if self.ok_cam:
+            self.cam_index = manager.index
+            self.err_cam = ""
+        else:
+            self.err_cam = manager.error
 
     def _open_serial(self):
-        if Serial is None:
-            self.ok_ser = False
-            self.err_ser = "pyserial 미설치: pip install pyserial"
-            return
+        # 공용 허브에 구독 - 이미 연결돼 있으면 바로 샘플이 들어옴 (포트를 다시 열거나 기다리지 않음)
+        self.sensors.subscribe(self._handle_sample)
+        self.sensors.subscribe_link(self._on_link)
+        if self.sensors.state == DISCONNECTED:
+            self.sensors.connect()  # 포트는 허브가 결정 (저장된 장치 -> 같은 VID/PID -> 전체 탐색)
+        self._sync_serial_status()
 
-        port = self.serial_port
-        if port is None:
-            cands = self._candidate_ports()
-            if cands:
-                port = cands[0]
-                print(f"자동 포트 감지: {port}")
-            else:
-                self.ok_ser = False
-                self.err_ser = "직렬 포트를 찾지 못했습니다. 연결/드라이버 확인"
-                return
-
-        try:
-            self.ser = Serial(port, self.serial_baud, timeout=1)  # 타임아웃 1초로 변경
-            # 연결 후 버퍼 완전 클리어
-            self.ser.reset_input_buffer()
-            self.ser.reset_output_buffer()
-            time.sleep(0.5)  # 안정화 대기
-            self.serial_port = port
-            self.ok_ser = True
-            self.err_ser = ""
-            self._rx_buf = ""
-            print(f"시리얼 연결 성공: {port} (baudrate: {self.serial_baud})")
-        except Exception as e:
-            self.ok_ser = False
-            self.err_ser = f"직렬 포트 열기 실패: {e}"
-            print(f"시리얼 연결 실패: {e}")
+    def _close_serial(self):
+        self.sensors.unsubscribe(self._handle_sample)  # 연결은 다음 판을 위해 유지
+        self.sensors.unsubscribe_link(self._on_link)
 
     def _serial_reconnect(self, next_port: Optional[str] = None):
-        if self.ser:
-            try: self.ser.close()
-            except Exception: pass
-            self.ser = None
         if next_port is not None:
             self.serial_port = next_port
-        self._open_serial()
-
-    def _consume_serial_lines(self):
-        if not self.ok_ser or not self.ser:
+        self.sensors.connect(next_port)
+        self._sync_serial_status()
+
+    def _sync_serial_status(self):
+        """허브의 연결 상태를 화면 표시용 값에 반영"""
+        hub = self.sensors
+        was_ok = self.ok_ser
+        self.ok_ser = hub.connected
+        self.err_ser = hub.error
+        if hub.port:
+            self.serial_port = hub.port
+        if was_ok and not self.ok_ser:
+            serial_log.warning(f"연결 상태: {self.ok_ser}, 포트: {self.serial_port}")
+
+    def _on_link(self, event):
+        # 허브가 pump()에서 부름 - 분리/자동 재연결 상태를 화면에 표시
+        self.link_event = event
+        if event.kind in ("lost", "unplugged"):
+            self._link_lost = True
+        self._sync_serial_status()
+
+    def _link_text(self) -> str:
+        """영상 패널 아래쪽에 표시할 센서 연결 상태 (정상 연결이면 빈 문자열)"""
+        event = self.link_event
+        if event is None:
+            return ""
+        now = clock.now()
+        if self.ok_ser:
+            return "센서 다시 연결됨" if self._link_lost and event.kind == "connected" and now - event.ts < 2.0 else ""
+        if self.sensors.state == CONNECTING:
+            return "센서 연결 중..."
+        label = LINK_LABELS.get(event.kind, event.kind)
+        if self.sensors.retry_at is not None:
+            return f"센서 {label} - {max(0.0, self.sensors.retry_at - now):.0f}초 후 다시 연결"
+        return f"센서 {label}"
+
+    def _handle_sample(self, sample):
+        # 허브가 pump()에서 부름 - 게임 시작(enter 완료) 전에 들어온 샘플과 완료 후 샘플은 버림
+        if self.game_completed or (self.game_start_time is not None and sample.ts < self.game_start_time):
             return
-        try:
-            # 테스트 코드와 동일한 방식으로 데이터 읽기
-            if self.ser.in_waiting > 0:
-                # UTF-8 디코딩 오류 방지를 위한 에러 처리 개선
-                try:
-                    line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                    if line:
-                        self._handle_serial_line(line)
-                except UnicodeDecodeError as ude:
-                    print(f"[SERIAL] UTF-8 디코딩 오류: {ude}")
-                    # 버퍼 클리어
-                    self.ser.reset_input_buffer()
-                except Exception as decode_error:
-                    print(f"[SERIAL] 디코딩 오류: {decode_error}")
-                    # 버퍼 클리어
-                    self.ser.reset_input_buffer()
-        except Exception as e:
-            print(f"[SERIAL] 읽기 오류: {e}")
-            print(f"[SERIAL] 연결 상태: {self.ok_ser}, 포트: {self.serial_port}")
-            # 연결이 끊어진 경우에만 연결 상태를 False로 변경
-            if "device disconnected" in str(e).lower() or "permission denied" in str(e).lower():
-                self.ok_ser = False
-                self.err_ser = f"시리얼 연결 끊어짐: {e}"
-
-    def _handle_serial_line(self, line: str):
         # 시리얼 데이터 수신 로그
-        print(f"[SERIAL] 수신: {line}")
-        
-        # 테스트 코드와 동일한 JSON 파싱 방식
+        serial_log.debug("수신: %s", sample)
+
+        if not isinstance(sample, SensorSample):
+            return  # 상태 메시지(ready/pong 등)
         try:
-            # JSON 형식 파싱 시도
-            obj = json.loads(line)
-            
-            # 새로운 Arduino 코드 형식 지원: {"distance": 25, "timestamp": 12345, "unit": "cm"}
-            if "distance" in obj:
-                try:
-                    self._on_distance(float(obj["distance"]))
-                except Exception as e:
-                    print(f"거리 데이터 파싱 오류: {e}")
-            
-            # 기존 형식 지원: {"cm": 17}
-            elif "cm" in obj:
-                try:
-                    self._on_distance(float(obj["cm"]))
-                except Exception as e:
-                    print(f"거리 데이터 파싱 오류: {e}")
-            
-            # 근접 감지: {"near": true}
-            if obj.get("near"):
-                self._on_near()
-                
-        except json.JSONDecodeError:
-            # 일반 텍스트 형식 처리 (기존 호환성)
-            if line.startswith("cm="):
-                try:
-                    self._on_distance(float(line.split("=",1)[1]))
-                except Exception:
-                    pass
-            elif line.startswith("Distance:"):
-                try:
-                    # "Distance: 25 cm" 형식 처리
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        self._on_distance(float(parts[1]))
-                except Exception:
-                    pass
-            else:
-                print(f"알 수 없는 데이터 형식: {line}")
+            ts = self._event_time(sample)
+            if sample.cm is not None:
+                self._on_distance(sample.cm, ts)
+            # 근접 감지: {"near": true, ...}
+            if sample.near:
+                self._on_near(ts)
         except Exception as e:
-            print(f"시리얼 데이터 처리 오류: {e}")
+            serial_log.warning(f"시리얼 데이터 처리 오류: {e}")
+
+    def _event_time(self, sample: SensorSample) -> float:
+        """장치 측정 시각을 호스트 시각으로 환산 (시계가 아직 안 맞았거나 시각이 없으면 도착 시각)"""
+        if sample.device_ms is not None and self.clock_sync.ready:
+            mapped = self.clock_sync.to_host(sample.device_ms)
+            if mapped is not None:
+                return min(mapped, sample.ts)  # 측정은 도착보다 늦을 수 없음
+        return sample.ts
 
     # ---- 판정 로직 핵심 ----
-    def _on_distance(self, d: float):
+    def _on_distance(self, d: float, ts: float):
         self.latest_cm = d
-        now = time.time()
+        now = ts  # 줄이 포트에 도착한 시각 (clock.now)
 
         # 시리얼 로그 출력
-        print(f"[SERIAL] 거리: {d:.1f}cm, 시간: {time.strftime('%H:%M:%S')}")
+        serial_log.debug("거리: %.1fcm", d)
 
         # 시도 시작 조건 (공통): 거리 업데이트가 오면 "최근 업데이트 시각" 갱신
         self.last_update_ts = now
@@ -414,10 +237,10 @@ class GameState:
         if (not self.armed) and d <= cfg.ARM_ZONE_CM:
             self.armed = True
             self.in_attempt = True
-            print(f"[GAME] 무장! 거리: {d:.1f}cm, ARM_ZONE: {cfg.ARM_ZONE_CM}cm")
+            log.info(f"무장! 거리: {d:.1f}cm, ARM_ZONE: {cfg.ARM_ZONE_CM}cm")
 
-    def _on_near(self):
-        now = time.time()
+    def _on_near(self, ts: float):
+        now = ts  # 장치 측정 시각(동기화된 경우) 또는 도착 시각 (clock.now) - 프레임 지터와 무관
         # 쿨다운
         if (self.last_near_ts is not None) and (now - self.last_near_ts < self.near_cooldown_s):
             return
@@ -429,25 +252,25 @@ class GameState:
         self.near_count += 1
         self.last_near_ts = now
 
-        print(f"[SERIAL] 근접 감지! 거리: {self.latest_cm:.1f}cm, 시간: {time.strftime('%H:%M:%S')}")
+        serial_log.info(f"근접 감지! 거리: {self.latest_cm:.1f}cm, 시간: {clock.wall_str()}")
 
         # SPEED 모드로 고정된 로직 (게임 시작부터 근접까지의 시간 측정)
         if self.armed and self.game_start_time is not None:
-            elapsed_ms = int((now - self.game_start_time) * 1000)
+            elapsed_ms = max(0, int((now - self.game_start_time) * 1000))
             self.best_fast_ms = elapsed_ms if self.best_fast_ms is None else min(self.best_fast_ms, elapsed_ms)
             elapsed_sec = elapsed_ms / 1000.0
-            print(f"[GAME] 기록! 소요시간: {elapsed_sec:.2f}초 (게임 시작부터 근접까지), 최고기록: {self.best_fast_ms}ms")
+            log.info(f"기록! 소요시간: {elapsed_sec:.2f}초 (게임 시작부터 근접까지), 최고기록: {self.best_fast_ms}ms")
             
             # 리더보드에 기록 저장
             try:
-                save_score(self.player_name, self.best_fast_ms, self.best_close_cm)
+                submit_score(self.player_name, self.best_fast_ms, self.best_close_cm)
                 elapsed_sec = self.best_fast_ms / 1000.0
-                print(f"[GAME] 리더보드에 기록 저장됨: {self.player_name} - {elapsed_sec:.2f}초")
+                log.info(f"리더보드 기록 반영 (저장은 백그라운드): {self.player_name} - {elapsed_sec:.2f}초")
             except Exception as e:
-                print(f"[GAME] 리더보드 저장 실패: {e}")
+                log.error(f"리더보드 저장 실패: {e}")
             
             # 게임 성공! 결과 화면으로 전환
-            print(f"[GAME] 게임 성공! 결과 화면으로 전환합니다.")
+            log.info("게임 성공! 결과 화면으로 전환합니다.")
             self.game_completed = True  # 게임 완료 상태 설정
             self.next = ("result", {
                 "name": self.player_name,
@@ -478,13 +301,11 @@ class GameState:
         has_ctrl  = bool(mods & pygame.KMOD_CTRL)
         has_cmd   = bool(mods & (pygame.KMOD_META | pygame.KMOD_LMETA | pygame.KMOD_RMETA))
 
-        print(f"GameState: {e.key} pressed, mods={mods}, has_shift={has_shift}, has_ctrl={has_ctrl}, has_cmd={has_cmd}")
+        log.debug("key %s pressed, mods=%s, has_shift=%s, has_ctrl=%s, has_cmd=%s", e.key, mods, has_shift, has_ctrl, has_cmd)
         # === HIDDEN WARP: Shift + (Ctrl or Cmd) + R → ResultState ===
         if e.key == pygame.K_r and has_shift and (has_ctrl or has_cmd):
-            print("[warp] to ResultState (HIDDEN)")
-            # 디버그 로그(원하면 지우세요)
-            print("[warp] to ResultState",
-                {"name": self.player_name, "best_fast_ms": self.best_fast_ms, "best_close_cm": self.best_close_cm})
+            log.info("warp: to ResultState (HIDDEN)")
+            log.debug("warp: %s", {"name": self.player_name, "best_fast_ms": self.best_fast_ms, "best_close_cm": self.best_close_cm})
             self.next = ("result", {
                 "name": self.player_name,
                 "best_fast_ms": 1000,
@@ -504,7 +325,7 @@ class GameState:
             self._serial_reconnect()
 
         elif e.key == pygame.K_p:
-            cands = self._candidate_ports()
+            cands = candidate_ports()
             if cands:
                 if self.serial_port in cands:
                     idx = (cands.index(self.serial_port) + 1) % len(cands)
@@ -513,15 +334,15 @@ class GameState:
                 self._serial_reconnect(cands[idx])
 
         elif e.key == pygame.K_1:
-            print("[GAME] 모드 변경 비활성화됨 (SPEED 모드로 고정)")
+            log.info("모드 변경 비활성화됨 (SPEED 모드로 고정)")
 
         elif e.key == pygame.K_2:
-            print("[GAME] 모드 변경 비활성화됨 (SPEED 모드로 고정)")
+            log.info("모드 변경 비활성화됨 (SPEED 모드로 고정)")
 
         elif e.key == pygame.K_n:
             self._reset_attempt()
             self.in_attempt = True
-            self.t_arm = time.time() if self.mode == "SPEED" else None
+            self.t_arm = clock.now() if self.mode == "SPEED" else None
             self.armed = (self.mode == "SPEED")
 
         elif e.key == pygame.K_c:
@@ -531,63 +352,145 @@ class GameState:
             
         elif e.key == pygame.K_t:
             # 테스트용: 강제로 기록 생성
-            print("[GAME] 테스트 기록 생성")
+            log.info("테스트 기록 생성")
             if self.game_start_time is not None:
-                test_time = int((time.time() - self.game_start_time) * 1000)
+                test_time = int((clock.now() - self.game_start_time) * 1000)
             else:
                 test_time = 1500  # 기본값
             self.best_fast_ms = test_time
             try:
-                save_score(self.player_name, self.best_fast_ms, self.best_close_cm)
+                submit_score(self.player_name, self.best_fast_ms, self.best_close_cm)
                 test_sec = test_time / 1000.0
-                print(f"[GAME] 테스트 기록 저장됨: {self.player_name} - {test_sec:.2f}초 (게임 시작부터)")
+                log.info(f"테스트 기록 저장됨: {self.player_name} - {test_sec:.2f}초 (게임 시작부터)")
             except Exception as e:
-                print(f"[GAME] 테스트 기록 저장 실패: {e}")
+                log.error(f"테스트 기록 저장 실패: {e}")
 
 
     # ---------- 업데이트 ----------
     def update(self, dt: float):
-        # 카메라
-        if self.ok_cam and self.cap:
-            ret, frame = self.cap.read()
-            if ret:
-                if self.mirror:
-                    frame = cv.flip(frame, 1)
-                self.frame = frame
-            else:
-                self.frame = None
-                self.err_cam = "웹캠 프레임을 읽지 못했습니다."
+        # 카메라 (캡처 스레드의 최신 프레임만 가져옴 - 드라이버를 기다리지 않음)
+        if self.camera is None and get_camera_manager().search_done:
+            self._open_camera()  # 백그라운드 탐색이 끝남 - 찾은 장치를 받음
+        if self.ok_cam and self.camera:
+            frame, _, seq = self.camera.latest()
+            self.frame = frame
+            self.frame_seq = seq
+            if self.camera.error:
+                self.err_cam = self.camera.error
 
         # 게임이 완료된 경우 업데이트 중단
         if self.game_completed:
             return
             
-        # 시리얼
-        self._consume_serial_lines()
+        # 시리얼 (샘플은 main.py의 sensors.pump()가 _handle_sample로 이미 전달함 - 여기서는 연결 상태만)
+        self._sync_serial_status()
         
         # 시리얼 상태 주기적 로깅 (5초마다)
-        if hasattr(self, '_last_serial_log') and (time.time() - self._last_serial_log > 5):
-            print(f"[SERIAL] 상태: {'연결됨' if self.ok_ser else '연결안됨'}, 포트: {self.serial_port}, 오류: {self.err_ser}")
-            self._last_serial_log = time.time()
+        if hasattr(self, '_last_serial_log') and (clock.now() - self._last_serial_log > 5):
+            serial_log.debug("상태: %s, 포트: %s, 오류: %s", '연결됨' if self.ok_ser else '연결안됨', self.serial_port, self.err_ser)
+            reader = self.sensors.reader
+            if reader and reader.binary is not None:
+                serial_log.debug("바이너리 프레임: %d, 유실: %d, 체크섬 오류: %d", reader.binary.frames, reader.dropped, reader.binary.bad)
+            self._last_serial_log = clock.now()
         elif not hasattr(self, '_last_serial_log'):
-            self._last_serial_log = time.time()
+            self._last_serial_log = clock.now()
 
         # 시도 종료 판정(타임아웃)
-        if self.in_attempt and (time.time() - self.last_update_ts > cfg.ATTEMPT_GAP_S):
+        if self.in_attempt and (clock.now() - self.last_update_ts > cfg.ATTEMPT_GAP_S):
             # SPEED 모드로 고정된 로직
             # 실패(near 못 받음) → 참고용 최소거리 메시지로 끝
             # 기록은 갱신하지 않음
-            print(f"[GAME] 시도 타임아웃! 최소거리: {self.min_dist_cm:.1f}cm")
+            log.info(f"시도 타임아웃! 최소거리: {self.min_dist_cm:.1f}cm")
             self._reset_attempt()
 
     # ---------- 렌더 ----------
     def render(self, viewport: Viewport, fonts: FontPack):
         S = viewport.S
         canvas = viewport.canvas
+
+        # 정적 레이어 (배경/타이틀/로고/비디오 패널 틀) - 창 크기나 폰트가 바뀔 때만 다시 합성
+        self._ensure_static_layer(viewport, fonts)
+        canvas.blit(self._static_layer, (0, 0))
+
+        video_rect = self._video_rect
+        video_x, video_y, video_width, video_height = video_rect
+        
+        # 웹캠 영상 표시
+        if self.frame is None:
+            # 웹캠이 없을 때 메시지
+            msg = self.err_cam or "웹캠 초기화 중..."
+            text_surface = fonts.render("h2", msg, (100, 100, 100))
+            text_x = video_x + (video_width - text_surface.get_width()) // 2
+            text_y = video_y + (video_height - text_surface.get_height()) // 2
+            canvas.blit(text_surface, (text_x, text_y))
+        else:
+            # 웹캠 영상 표시 (패널 내부에 맞춰서)
+            fh, fw = self.frame.shape[:2]
+            # 패널 내부 여백 고려
+            inner_rect = pygame.Rect(video_x + S(10), video_y, 
+                                   video_width - S(20), video_height )
+            
+            scale = min(inner_rect.w / fw, inner_rect.h / fh)
+            tw, th = int(fw * scale), int(fh * scale)
+            tx = inner_rect.x + (inner_rect.w - tw) // 2
+            ty = inner_rect.y + (inner_rect.h - th) // 2
+            
+            surf = self._presenter.present(self.frame, (tw, th), self.mirror, self.frame_seq)
+            canvas.blit(surf, (tx, ty))
+
+        # 센서 연결 상태 (끊기면 자동 재연결 중임을 표시 - 직원이 R/P를 누르지 않아도 복구됨)
+        link_text = self._link_text()
+        if link_text:
+            link_surf = fonts.render("txt", link_text, cfg.OK if self.ok_ser else cfg.WARN)
+            canvas.blit(link_surf, (video_x + S(20), video_y + video_height - link_surf.get_height() - S(15)))
+
+        viewport.mark_dirty(video_rect)
+
+        # 캐릭터들 (웹캠 패널과 겹치므로 영상 위에 다시 그림 - 스케일은 정적 레이어 합성 때 한 번만)
+        for sprite, pos in self._foreground:
+            canvas.blit(sprite, pos)
+
+        # 게임 완료 메시지 표시
+        if self.game_completed:
+            viewport.invalidate()  # 화면 전체를 덮는 오버레이
+            # 반투명 오버레이
+            if self._overlay is None:
+                self._overlay = pygame.Surface((viewport.scaled_w, viewport.scaled_h))
+                self._overlay.set_alpha(128)
+                self._overlay.fill((0, 0, 0))
+            canvas.blit(self._overlay, (0, 0))
+            
+            # 성공 메시지
+            elapsed_sec = self.best_fast_ms / 1000.0 if self.best_fast_ms is not None else 0
+            success_text = f"성공! 소요시간: {elapsed_sec:.2f}초"
+            text_surface = fonts.render("h1", success_text, cfg.OK)
+            text_x = (viewport.scaled_w - text_surface.get_width()) // 2
+            text_y = (viewport.scaled_h - text_surface.get_height()) // 2
+            canvas.blit(text_surface, (text_x, text_y))
+            
+            # 결과 화면으로 전환 중 메시지
+            transition_text = "결과 화면으로 전환 중..."
+            trans_surface = fonts.render("h3", transition_text, cfg.TEXT)
+            trans_x = (viewport.scaled_w - trans_surface.get_width()) // 2
+            trans_y = text_y + text_surface.get_height() + S(20)
+            canvas.blit(trans_surface, (trans_x, trans_y))
+
+    def _ensure_static_layer(self, viewport: Viewport, fonts: FontPack):
+        key = (viewport.scaled_w, viewport.scaled_h, fonts)
+        if self._static_layer is None or self._static_key != key:
+            self._static_layer = self._build_static_layer(viewport, fonts)
+            self._static_key = key
+            viewport.invalidate()  # 레이어가 바뀌면 전체 화면 출력
+            self._overlay = None
+
+    def _build_static_layer(self, viewport: Viewport, fonts: FontPack) -> pygame.Surface:
+        """웹캠 영상 아래에 깔리는 정적 요소들을 한 장의 Surface로 합성합니다."""
+        S = viewport.S
+        canvas = pygame.Surface((viewport.scaled_w, viewport.scaled_h)).convert()
         
         # 배경 그리기 (화면을 꽉 채우도록)
         if self.bg_image:
-            bg_scaled = pygame.transform.scale(self.bg_image, (viewport.scaled_w, viewport.scaled_h))
+            bg_scaled = get_scaled(self.bg_image, (viewport.scaled_w, viewport.scaled_h))
             canvas.blit(bg_scaled, (0, 0))
         else:
             canvas.fill((135, 206, 235))  # 하늘색 기본 배경
@@ -614,14 +517,14 @@ class GameState:
                 logo_height = max_logo_height
                 logo_width = int(logo_height * orig_ratio)
             
-            logo_scaled = pygame.transform.scale(self.title_image, (logo_width, logo_height))
+            logo_scaled = get_scaled(self.title_image, (logo_width, logo_height))
             logo_x = (viewport.scaled_w - logo_scaled.get_width()) // 2
             logo_y = S(-30)
             canvas.blit(logo_scaled, (logo_x, logo_y))
 
         # 광명x쓸모 이미지 (우상단)
         if self.gwangmyeong_image:
-            gwang_scaled = pygame.transform.scale(self.gwangmyeong_image, (S(240), S(160)))
+            gwang_scaled = get_scaled(self.gwangmyeong_image, (S(240), S(160)))
             gwang_x = viewport.scaled_w - S(280)
             gwang_y = S(0)
             canvas.blit(gwang_scaled, (gwang_x, gwang_y))
@@ -636,72 +539,29 @@ class GameState:
         # 비디오 패널 배경 (흰색)
         pygame.draw.rect(canvas, (255, 255, 255), video_rect)
         pygame.draw.rect(canvas, (200, 200, 200), video_rect, S(3))
-        
-        # 웹캠 영상 표시
-        if self.frame is None:
-            # 웹캠이 없을 때 메시지
-            msg = self.err_cam or "웹캠 초기화 중..."
-            text_surface = fonts.h2.render(msg, True, (100, 100, 100))
-            text_x = video_x + (video_width - text_surface.get_width()) // 2
-            text_y = video_y + (video_height - text_surface.get_height()) // 2
-            canvas.blit(text_surface, (text_x, text_y))
-        else:
-            # 웹캠 영상 표시 (패널 내부에 맞춰서)
-            fh, fw = self.frame.shape[:2]
-            # 패널 내부 여백 고려
-            inner_rect = pygame.Rect(video_x + S(10), video_y, 
-                                   video_width - S(20), video_height )
-            
-            scale = min(inner_rect.w / fw, inner_rect.h / fh)
-            tw, th = int(fw * scale), int(fh * scale)
-            tx = inner_rect.x + (inner_rect.w - tw) // 2
-            ty = inner_rect.y + (inner_rect.h - th) // 2
-            
-            rgb = cv.cvtColor(self.frame, cv.COLOR_BGR2RGB)
-            surf = pygame.image.frombuffer(rgb.tobytes(), (fw, fh), "RGB")
-            if (fw, fh) != (tw, th):
-                surf = pygame.transform.smoothscale(surf, (tw, th))
-            canvas.blit(surf, (tx, ty))
 
-        # 캐릭터들 배치
+        self._video_rect = video_rect
+
+        # 캐릭터 배치 (영상 위에 그려야 하므로 레이어에 굽지 않고 위치만 계산)
+        foreground = []
         if self.character_left:
-            char_left_scaled = pygame.transform.scale(self.character_left, (S(150), S(200)))
+            char_left_scaled = get_scaled(self.character_left, (S(150), S(200)))
             char_left_x = S(50)
             char_left_y = viewport.scaled_h - char_left_scaled.get_height() - S(50)
-            canvas.blit(char_left_scaled, (char_left_x, char_left_y))
+            foreground.append((char_left_scaled, (char_left_x, char_left_y)))
             
         if self.character_right:
-            char_right_scaled = pygame.transform.scale(self.character_right, (S(150), S(200)))
+            char_right_scaled = get_scaled(self.character_right, (S(150), S(200)))
             char_right_x = viewport.scaled_w - char_right_scaled.get_width() - S(50)
             char_right_y = viewport.scaled_h - char_right_scaled.get_height() - S(50)
-            canvas.blit(char_right_scaled, (char_right_x, char_right_y))
+            foreground.append((char_right_scaled, (char_right_x, char_right_y)))
             
         # 상단 우측 캐릭터
         if self.character_top_right:
-            char_top_scaled = pygame.transform.scale(self.character_top_right, (S(120), S(160)))
+            char_top_scaled = get_scaled(self.character_top_right, (S(120), S(160)))
             char_top_x = viewport.scaled_w - char_top_scaled.get_width() - S(50)
             char_top_y = S(50)
-            canvas.blit(char_top_scaled, (char_top_x, char_top_y))
+            foreground.append((char_top_scaled, (char_top_x, char_top_y)))
+        self._foreground = foreground
 
-        # 게임 완료 메시지 표시
-        if self.game_completed:
-            # 반투명 오버레이
-            overlay = pygame.Surface((viewport.scaled_w, viewport.scaled_h))
-            overlay.set_alpha(128)
-            overlay.fill((0, 0, 0))
-            canvas.blit(overlay, (0, 0))
-            
-            # 성공 메시지
-            elapsed_sec = self.best_fast_ms / 1000.0 if self.best_fast_ms is not None else 0
-            success_text = f"성공! 소요시간: {elapsed_sec:.2f}초"
-            text_surface = fonts.h1.render(success_text, True, cfg.OK)
-            text_x = (viewport.scaled_w - text_surface.get_width()) // 2
-            text_y = (viewport.scaled_h - text_surface.get_height()) // 2
-            canvas.blit(text_surface, (text_x, text_y))
-            
-            # 결과 화면으로 전환 중 메시지
-            transition_text = "결과 화면으로 전환 중..."
-            trans_surface = fonts.h3.render(transition_text, True, cfg.TEXT)
-            trans_x = (viewport.scaled_w - trans_surface.get_width()) // 2
-            trans_y = text_y + text_surface.get_height() + S(20)
-            canvas.blit(trans_surface, (trans_x, trans_y))
+        return canvas
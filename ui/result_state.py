@@ -6,9 +6,15 @@ import config as cfg
 from core.viewport import Viewport
 from core.fonts import FontPack
 from ui.components import draw_card
-from core.path_utils import get_asset_path, safe_image_load
+from core.path_utils import get_asset_path
+from core.surface_cache import load_image, get_scaled
+from core.log import get_logger
+
+log = get_logger("game")
 
 class ResultState:
+    reports_dirty = True  # 바뀐 영역을 viewport.mark_dirty로 보고함
+
     def __init__(
         self,
         player_name: str,
@@ -21,6 +27,10 @@ class ResultState:
 
         self.next: Optional[tuple[str, dict]] = None  # ('title', {}) 로 세팅
         self.timer = 0.0
+
+        # 정적 레이어 캐시 (enter/창 크기 변경 시 재합성)
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_key = None
         
         # 이미지 로딩
         self._load_images()
@@ -31,27 +41,27 @@ class ResultState:
         
         try:
             # 배경 이미지
-            self.bg_image = safe_image_load(os.path.join(base_path, "background.jpg"))
+            self.bg_image = load_image(os.path.join(base_path, "background.jpg"))
             
             # 타이틀 로고
-            self.title_logo = safe_image_load(os.path.join(base_path, "title_adventure.png"))
+            self.title_logo = load_image(os.path.join(base_path, "title_adventure.png"))
             
             # 리더보드 배경
-            self.board_background = safe_image_load(os.path.join(base_path, "board_background.png"))
+            self.board_background = load_image(os.path.join(base_path, "board_background.png"))
             
             # 캐릭터 이미지들
-            self.character_left = safe_image_load(os.path.join(base_path, "dntxh.png"))  # 당근
-            self.character_right = safe_image_load(os.path.join(base_path, "dntEKd.png"))  # 양
+            self.character_left = load_image(os.path.join(base_path, "dntxh.png"))  # 당근
+            self.character_right = load_image(os.path.join(base_path, "dntEKd.png"))  # 양
             
             # 말풍선 이미지들
-            self.speech_left = safe_image_load(os.path.join(base_path, "amazing.png"))
-            self.speech_right = safe_image_load(os.path.join(base_path, "wow.png"))
+            self.speech_left = load_image(os.path.join(base_path, "amazing.png"))
+            self.speech_right = load_image(os.path.join(base_path, "wow.png"))
             
             # 기타 이미지들
-            self.gwangmyeong_image = safe_image_load(os.path.join(base_path, "gwangmyeong_x_ssulmo.png"))
+            self.gwangmyeong_image = load_image(os.path.join(base_path, "gwangmyeong_x_ssulmo.png"))
             
         except Exception as e:
-            print(f"결과 화면 이미지 로딩 실패: {e}")
+            log.warning(f"결과 화면 이미지 로딩 실패: {e}")
             # 기본값으로 None 설정
             self.bg_image = None
             self.title_logo = None
@@ -62,8 +72,8 @@ class ResultState:
             self.speech_right = None
             self.gwangmyeong_image = None
 
-    def enter(self):  # 스타일 통일용 훅
-        pass
+    def enter(self):
+        self._static_layer = None
 
     def exit(self):
         pass
@@ -86,8 +96,18 @@ class ResultState:
         self.timer += dt
 
     def render(self, viewport: Viewport, fonts: FontPack):
+        # 결과 화면은 전부 정적 요소 - 창 크기나 폰트가 바뀔 때만 다시 합성
+        key = (viewport.scaled_w, viewport.scaled_h, fonts)
+        if self._static_layer is None or self._static_key != key:
+            self._static_layer = self._build_static_layer(viewport, fonts)
+            self._static_key = key
+            viewport.invalidate()  # 레이어가 바뀔 때만 화면 출력, 그 외 프레임은 더티 영역 없음
+        viewport.canvas.blit(self._static_layer, (0, 0))
+
+    def _build_static_layer(self, viewport: Viewport, fonts: FontPack) -> pygame.Surface:
+        """결과 화면 전체를 한 장의 Surface로 합성합니다."""
         S = viewport.S
-        canvas = viewport.canvas
+        canvas = pygame.Surface((viewport.scaled_w, viewport.scaled_h)).convert()
         
         # 배경 그리기 (화면을 완전히 채우도록 - 이미지 잘림 허용)
         if self.bg_image:
@@ -109,7 +129,7 @@ class ResultState:
             offset_y = (screen_h - scaled_h) // 2
             
             # 배경 이미지 스케일링 및 그리기
-            bg_scaled = pygame.transform.scale(self.bg_image, (scaled_w, scaled_h))
+            bg_scaled = get_scaled(self.bg_image, (scaled_w, scaled_h))
             canvas.blit(bg_scaled, (offset_x, offset_y))
         else:
             canvas.fill((135, 206, 235))  # 하늘색 기본 배경
@@ -136,7 +156,7 @@ class ResultState:
                 logo_height = max_logo_height
                 logo_width = int(logo_height * orig_ratio)
             
-            logo_scaled = pygame.transform.scale(self.title_logo, (logo_width, logo_height))
+            logo_scaled = get_scaled(self.title_logo, (logo_width, logo_height))
             logo_x = (viewport.scaled_w - logo_scaled.get_width()) // 2
             logo_y = S(-30)
             canvas.blit(logo_scaled, (logo_x, logo_y))
@@ -157,7 +177,7 @@ class ResultState:
         
         # 배경 그리기 (크게)
         if self.board_background:
-            board_bg_scaled = pygame.transform.scale(self.board_background, (bg_rect.width, bg_rect.height))
+            board_bg_scaled = get_scaled(self.board_background, (bg_rect.width, bg_rect.height))
             canvas.blit(board_bg_scaled, bg_rect)
         else:
             # 백업용 배경 (이미지 로딩 실패시)
@@ -171,38 +191,40 @@ class ResultState:
 
         # 캐릭터들 (리더보드 배경 양옆에 배치)
         if self.character_left:
-            char_left_scaled = pygame.transform.scale(self.character_left, (S(150), S(200)))
+            char_left_scaled = get_scaled(self.character_left, (S(150), S(200)))
             char_left_x = bg_x - S(10)  # 배경 왼쪽
             char_left_y = bg_y + S(100)
             canvas.blit(char_left_scaled, (char_left_x, char_left_y))
             
             # 말풍선 이미지
             if self.speech_left:
-                speech_scaled = pygame.transform.scale(self.speech_left, (S(120), S(80)))
+                speech_scaled = get_scaled(self.speech_left, (S(120), S(80)))
                 speech_x = char_left_x + S(130)
                 speech_y = char_left_y - S(20)
                 canvas.blit(speech_scaled, (speech_x, speech_y))
             
         if self.character_right:
-            char_right_scaled = pygame.transform.scale(self.character_right, (S(150), S(200)))
+            char_right_scaled = get_scaled(self.character_right, (S(150), S(200)))
             char_right_x = bg_x + bg_width + S(-100)  # 배경 오른쪽
             char_right_y = bg_y + S(100)
             canvas.blit(char_right_scaled, (char_right_x, char_right_y))
             
             # 말풍선 이미지
             if self.speech_right:
-                speech_scaled = pygame.transform.scale(self.speech_right, (S(100), S(80)))
+                speech_scaled = get_scaled(self.speech_right, (S(100), S(80)))
                 speech_x = char_right_x - S(120)
                 speech_y = char_right_y - S(20)
                 canvas.blit(speech_scaled, (speech_x, speech_y))
 
         # 광명x쓸모 이미지 (오른쪽 상단)
         if self.gwangmyeong_image:
-            gwang_scaled = pygame.transform.scale(self.gwangmyeong_image, (S(240), S(160)))
+            gwang_scaled = get_scaled(self.gwangmyeong_image, (S(240), S(160)))
             gwang_x = viewport.scaled_w - S(280)
             gwang_y = S(0)
             canvas.blit(gwang_scaled, (gwang_x, gwang_y))
 
+        return canvas
+
     def _draw_result_content(self, canvas, content_rect, fonts, S):
         """결과 내용을 그립니다."""
         # 세로 중앙 정렬을 위한 계산
@@ -214,7 +236,7 @@ class ResultState:
         
         # 인사말
         greet_text = f"{self.player_name} 님의 결과!"
-        greet_surface = fonts.h1.render(greet_text, True, (50, 50, 50))
+        greet_surface = fonts.render("h1", greet_text, (50, 50, 50))
         text_x = content_rect.x + (content_rect.width - greet_surface.get_width()) // 2
         canvas.blit(greet_surface, (text_x, y))
         y += S(80)
@@ -231,8 +253,8 @@ class ResultState:
             else "" #"최단 거리: 기록 없음"
         )
         
-        fast_surface = fonts.h2.render(fast_text, True, (50, 50, 50))
-        close_surface = fonts.h2.render(close_text, True, (50, 50, 50))
+        fast_surface = fonts.render("h2", fast_text, (50, 50, 50))
+        close_surface = fonts.render("h2", close_text, (50, 50, 50))
         
         # 중앙 정렬
         fast_x = content_rect.x + (content_rect.width - fast_surface.get_width()) // 2
@@ -243,6 +265,6 @@ class ResultState:
         
         # 안내 문구
         instruction = ""
-        instruction_surface = fonts.h3.render(instruction, True, (100, 100, 100))
+        instruction_surface = fonts.render("h3", instruction, (100, 100, 100))
         instruction_x = content_rect.x + (content_rect.width - instruction_surface.get_width()) // 2
         canvas.blit(instruction_surface, (instruction_x, y))
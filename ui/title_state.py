@@ -7,9 +7,13 @@ from typing import Optional, List, Dict
 import config as cfg
 from core.viewport import Viewport
 from core.fonts import FontPack
-from core.leaderboard import load_scores, get_fast_board, get_close_board, save_current_player
+from core.leaderboard import top_fast, top_close, save_current_player
 from ui.components import draw_card, draw_table, draw_input_box
-from core.path_utils import get_asset_path, safe_image_load
+from core.path_utils import get_asset_path
+from core.surface_cache import load_image, get_scaled
+from core.log import get_logger
+
+log = get_logger("game")
 
 @dataclass
 class TitleResult:
@@ -17,10 +21,12 @@ class TitleResult:
     name: Optional[str] = None
 
 class TitleState:
+    reports_dirty = True  # 바뀐 영역을 viewport.mark_dirty로 보고함
+
     def __init__(self) -> None:
-        data: List[Dict] = load_scores()
-        self.fast = get_fast_board(data)
-        self.close = get_close_board(data)
+        # 상위 5개만 저장소에서 바로 조회 (전체 로드/정렬 없음)
+        self.fast: List[Dict] = top_fast(5)
+        self.close: List[Dict] = top_close(5)
 
         self.name = ""
         self.composing = ""      # IME 조합 중 문자열
@@ -35,6 +41,11 @@ class TitleState:
         self.right_rect = (500,150, 460, 360)
 
         self._ime_started = False
+
+        # 정적 레이어 캐시 (enter/창 크기 변경 시 재합성)
+        self._static_layer: Optional[pygame.Surface] = None
+        self._static_key = None
+        self._input_screen_rect = pygame.Rect(0, 0, 0, 0)
         
         # 이미지 로딩
         self._load_images()
@@ -45,27 +56,27 @@ class TitleState:
         
         try:
             # 배경 이미지
-            self.bg_image = safe_image_load(os.path.join(base_path, "background.jpg"))
+            self.bg_image = load_image(os.path.join(base_path, "background.jpg"))
             
             # 타이틀 로고
-            self.title_logo = safe_image_load(os.path.join(base_path, "title_adventure.png"))
+            self.title_logo = load_image(os.path.join(base_path, "title_adventure.png"))
             
             # 순위 아이콘들 (1-5위)
             self.rank_icons = {}
             for i in range(1, 6):
-                self.rank_icons[i] = safe_image_load(os.path.join(base_path, f"rank_{i}.png"))
+                self.rank_icons[i] = load_image(os.path.join(base_path, f"rank_{i}.png"))
             
             # 캐릭터 이미지들
-            self.character_left = safe_image_load(os.path.join(base_path, "carrot_character.png"))  # 당근
-            self.character_right = safe_image_load(os.path.join(base_path, "tomato_character.png"))  # 양
+            self.character_left = load_image(os.path.join(base_path, "carrot_character.png"))  # 당근
+            self.character_right = load_image(os.path.join(base_path, "tomato_character.png"))  # 양
             
             # 점수판 배경
-            self.board_background = safe_image_load(os.path.join(base_path, "board_background.png"))
+            self.board_background = load_image(os.path.join(base_path, "board_background.png"))
 
-            self.gwangmyeong_image = safe_image_load(os.path.join(base_path, "gwangmyeong_x_ssulmo.png"))
+            self.gwangmyeong_image = load_image(os.path.join(base_path, "gwangmyeong_x_ssulmo.png"))
             
         except Exception as e:
-            print(f"이미지 로딩 실패: {e}")
+            log.warning(f"이미지 로딩 실패: {e}")
             # 기본값으로 None 설정
             self.bg_image = None
             self.title_logo = None
@@ -77,6 +88,7 @@ class TitleState:
 
     # --- 라이프사이클 ---
     def enter(self):
+        self._static_layer = None
         if not self._ime_started:
             pygame.key.start_text_input()
             pygame.key.set_text_input_rect(self.input_rect)
@@ -97,7 +109,7 @@ class TitleState:
             has_cmd = bool(mods & (pygame.KMOD_META | pygame.KMOD_LMETA | pygame.KMOD_RMETA))
             
             if e.key == pygame.K_a and has_shift and (has_ctrl or has_cmd):
-                print("[ADMIN] 관리자 페이지로 진입")
+                log.info("관리자 페이지로 진입")
                 self.exit()
                 self.next = ("admin", {})
                 return
@@ -150,6 +162,50 @@ class TitleState:
     def render(self, viewport: Viewport, fonts: FontPack):
         S = viewport.S               # 스케일 헬퍼
         canvas = viewport.canvas
+
+        # 정적 레이어 (배경/로고/리더보드/캐릭터/입력 박스 배경) - 창 크기나 폰트가 바뀔 때만 다시 합성
+        self._ensure_static_layer(viewport, fonts)
+        canvas.blit(self._static_layer, (0, 0))
+        input_rect = self._input_screen_rect
+
+        # IME 좌표 업데이트
+        self.input_rect = pygame.Rect(int(input_rect.x/viewport.scale),
+                                    int(input_rect.y/viewport.scale),
+                                    int(input_rect.w/viewport.scale),
+                                    int(input_rect.h/viewport.scale))
+        
+        # 입력 텍스트
+        display_text = self.name + self.composing
+        if not display_text:
+            # 플레이스홀더
+            placeholder = fonts.render("h3", "닉네임 :", (150, 150, 150))
+            text_rect = canvas.blit(placeholder, (input_rect.x + S(20), input_rect.y + S(15)))
+        else:
+            text_surface = fonts.render("h3", display_text, (50, 50, 50))
+            text_rect = canvas.blit(text_surface, (input_rect.x + S(20), input_rect.y + S(15)))
+            
+            # 커서
+            if self.cursor_on and not self.composing:
+                cursor_x = input_rect.x + S(20) + text_surface.get_width()
+                cursor_y = input_rect.y + S(15)
+                pygame.draw.line(canvas, (50, 50, 50), 
+                               (cursor_x, cursor_y), 
+                               (cursor_x, cursor_y + fonts.h3.get_height()), S(2))
+
+        # 입력 박스(+ 박스를 넘친 긴 이름, 커서 여유분)만 화면에 내보냄
+        viewport.mark_dirty(input_rect.union(text_rect.inflate(S(8), 0)))
+
+    def _ensure_static_layer(self, viewport: Viewport, fonts: FontPack):
+        key = (viewport.scaled_w, viewport.scaled_h, fonts)
+        if self._static_layer is None or self._static_key != key:
+            self._static_layer = self._build_static_layer(viewport, fonts)
+            self._static_key = key
+            viewport.invalidate()  # 레이어가 바뀌면 전체 화면 출력
+
+    def _build_static_layer(self, viewport: Viewport, fonts: FontPack) -> pygame.Surface:
+        """매 프레임 변하지 않는 요소들을 한 장의 Surface로 합성합니다."""
+        S = viewport.S
+        canvas = pygame.Surface((viewport.scaled_w, viewport.scaled_h)).convert()
         
         # 배경 그리기 (화면을 완전히 채우도록 - 이미지 잘림 허용)
         if self.bg_image:
@@ -171,7 +227,7 @@ class TitleState:
             offset_y = (screen_h - scaled_h) // 2
             
             # 배경 이미지 스케일링 및 그리기
-            bg_scaled = pygame.transform.scale(self.bg_image, (scaled_w, scaled_h))
+            bg_scaled = get_scaled(self.bg_image, (scaled_w, scaled_h))
             canvas.blit(bg_scaled, (offset_x, offset_y))
         else:
             canvas.fill((135, 206, 235))  # 하늘색 기본 배경
@@ -198,13 +254,13 @@ class TitleState:
                 logo_height = max_logo_height
                 logo_width = int(logo_height * orig_ratio)
             
-            logo_scaled = pygame.transform.scale(self.title_logo, (logo_width, logo_height))
+            logo_scaled = get_scaled(self.title_logo, (logo_width, logo_height))
             logo_x = (viewport.scaled_w - logo_scaled.get_width()) // 2
             logo_y = S(-30)
             canvas.blit(logo_scaled, (logo_x, logo_y))
         
         if self.gwangmyeong_image:
-            gwang_scaled = pygame.transform.scale(self.gwangmyeong_image, (S(240), S(160)))
+            gwang_scaled = get_scaled(self.gwangmyeong_image, (S(240), S(160)))
             gwang_x = viewport.scaled_w - S(280)
             gwang_y = S(0)
             canvas.blit(gwang_scaled, (gwang_x, gwang_y))
@@ -225,7 +281,7 @@ class TitleState:
         
         # 배경 그리기 (크게)
         if self.board_background:
-            board_bg_scaled = pygame.transform.scale(self.board_background, (bg_rect.width, bg_rect.height))
+            board_bg_scaled = get_scaled(self.board_background, (bg_rect.width, bg_rect.height))
             canvas.blit(board_bg_scaled, bg_rect)
         else:
             # 백업용 배경 (이미지 로딩 실패시)
@@ -239,13 +295,13 @@ class TitleState:
 
         # 캐릭터들 (리더보드 배경 양옆에 배치)
         if self.character_left:
-            char_left_scaled = pygame.transform.scale(self.character_left, (S(150), S(200)))
+            char_left_scaled = get_scaled(self.character_left, (S(150), S(200)))
             char_left_x = bg_x - S(10)  # 배경 왼쪽
             char_left_y = bg_y + S(100)
             canvas.blit(char_left_scaled, (char_left_x, char_left_y))
             
         if self.character_right:
-            char_right_scaled = pygame.transform.scale(self.character_right, (S(150), S(200)))
+            char_right_scaled = get_scaled(self.character_right, (S(150), S(200)))
             char_right_x = bg_x + bg_width + S(-100)  # 배경 오른쪽
             char_right_y = bg_y + S(100)
             canvas.blit(char_right_scaled, (char_right_x, char_right_y))
@@ -260,30 +316,9 @@ class TitleState:
         input_surface = pygame.Surface((input_rect.width, input_rect.height), pygame.SRCALPHA)
         input_surface.fill((255, 255, 255, 200))
         canvas.blit(input_surface, input_rect)
-        
-        # IME 좌표 업데이트
-        self.input_rect = pygame.Rect(int(input_rect.x/viewport.scale),
-                                    int(input_rect.y/viewport.scale),
-                                    int(input_rect.w/viewport.scale),
-                                    int(input_rect.h/viewport.scale))
-        
-        # 입력 텍스트
-        display_text = self.name + self.composing
-        if not display_text:
-            # 플레이스홀더
-            placeholder = fonts.h3.render("닉네임 :", True, (150, 150, 150))
-            canvas.blit(placeholder, (input_rect.x + S(20), input_rect.y + S(15)))
-        else:
-            text_surface = fonts.h3.render(display_text, True, (50, 50, 50))
-            canvas.blit(text_surface, (input_rect.x + S(20), input_rect.y + S(15)))
-            
-            # 커서
-            if self.cursor_on and not self.composing:
-                cursor_x = input_rect.x + S(20) + text_surface.get_width()
-                cursor_y = input_rect.y + S(15)
-                pygame.draw.line(canvas, (50, 50, 50), 
-                               (cursor_x, cursor_y), 
-                               (cursor_x, cursor_y + fonts.h3.get_height()), S(2))
+
+        self._input_screen_rect = input_rect
+        return canvas
 
     def _draw_leaderboard(self, canvas, board_rect, fonts, S):
         """리더보드를 그립니다."""
@@ -315,7 +350,7 @@ class TitleState:
             
             # 순위 아이콘 (가로/세로 중앙 정렬)
             if rank in self.rank_icons and self.rank_icons[rank]:
-                rank_icon = pygame.transform.scale(self.rank_icons[rank], (icon_size, icon_size))
+                rank_icon = get_scaled(self.rank_icons[rank], (icon_size, icon_size))
                 icon_x = start_x
                 icon_y = y_pos + (row_height - icon_size) // 2
                 canvas.blit(rank_icon, (icon_x, icon_y))
@@ -326,7 +361,7 @@ class TitleState:
                 icon_center = (icon_x + icon_size // 2, icon_y + icon_size // 2)
                 pygame.draw.circle(canvas, (100, 100, 100), icon_center, icon_size // 2)
                 # 순위 숫자 그리기
-                rank_text = fonts.h2.render(str(rank), True, (255, 255, 255))
+                rank_text = fonts.render("h2", str(rank), (255, 255, 255))
                 rank_text_x = icon_center[0] - rank_text.get_width() // 2
                 rank_text_y = icon_center[1] - rank_text.get_height() // 2
                 canvas.blit(rank_text, (rank_text_x, rank_text_y))
@@ -348,12 +383,12 @@ class TitleState:
             # 텍스트 (폰트 크기도 조정)
             if player_data:
                 # 박스 크기에 맞는 폰트 선택
-                font_to_use = fonts.txt if box_height < S(35) else fonts.h3
+                font_role = "txt" if box_height < S(35) else "h3"
                 
-                name_text = font_to_use.render(player_data.get('name', ''), True, (50, 50, 50))
+                name_text = fonts.render(font_role, player_data.get('name', ''), (50, 50, 50))
                 fast_ms = player_data.get('best_fast_ms', 0)
                 fast_sec = fast_ms / 1000.0 if fast_ms > 0 else 0
-                score_text = font_to_use.render(f"{fast_sec:.2f}초", True, (50, 50, 50))
+                score_text = fonts.render(font_role, f"{fast_sec:.2f}초", (50, 50, 50))
                 
                 # 중앙 정렬
                 name_x_center = name_rect.x + (name_rect.width - name_text.get_width()) // 2
@@ -9,7 +9,7 @@ const int TRIG_PIN = 9;    // 트리거 핀
 const int ECHO_PIN = 10;   // 에코 핀
 
 // 설정
-const int MEASURE_INTERVAL = 100;  // 측정 간격 (ms)
+int measureInterval = 100;         // 측정 간격 (ms, interval: 명령으로 변경)
 const int MAX_DISTANCE = 400;      // 최대 측정 거리 (cm)
 const int MIN_DISTANCE = 2;        // 최소 측정 거리 (cm)
 const int NEAR_THRESHOLD = 28;      // 근접 감지 임계값 (cm)
@@ -17,6 +17,7 @@ const int NEAR_THRESHOLD = 28;      // 근접 감지 임계값 (cm)
 // 변수
 unsigned long lastMeasureTime = 0;
 int distance = 0;
+unsigned long measuredAt = 0;      // 마지막 측정 완료 시각 (millis, 시계 동기화용 타임스탬프)
 bool isConnected = false;
 bool nearDetected = false;
 
@@ -24,6 +25,13 @@ bool nearDetected = false;
 const bool USE_GAME_FORMAT = true;  // 게임 프로젝트 형식 사용
 const bool USE_JSON_FORMAT = true;  // JSON 형식 사용
 
+// 바이너리 프레임 모드 (호스트가 format:binary 명령으로 전환, core/protocol.py와 같은 형식)
+// [sync 0xA5][seq u16][millis u32][distance_mm u16][flags u8][checksum u8] = 11바이트, 리틀 엔디언
+const uint8_t FRAME_SYNC = 0xA5;
+const uint16_t NO_DISTANCE = 0xFFFF;
+bool binaryMode = false;
+uint16_t frameSeq = 0;
+
 void setup() {
   // 시리얼 통신 초기화
   Serial.begin(9600);
@@ -52,8 +60,9 @@ void loop() {
   unsigned long currentTime = millis();
   
   // 정해진 간격으로 측정
-  if (currentTime - lastMeasureTime >= MEASURE_INTERVAL) {
+  if (currentTime - lastMeasureTime >= (unsigned long)measureInterval) {
     distance = measureDistance();
+    measuredAt = millis();
     
     if (distance > 0) {
       sendData(distance);
@@ -102,7 +111,37 @@ int measureDistance() {
   return distance;
 }
 
+// flags: bit0 = 근접, bit1 = ping 응답
+void sendBinaryFrame(int dist, uint8_t flags, unsigned long ms) {
+  uint8_t frame[11];
+  uint16_t mm = dist > 0 ? (uint16_t)(dist * 10) : NO_DISTANCE;
+
+  frame[0] = FRAME_SYNC;
+  frame[1] = frameSeq & 0xFF;
+  frame[2] = frameSeq >> 8;
+  frame[3] = ms & 0xFF;
+  frame[4] = (ms >> 8) & 0xFF;
+  frame[5] = (ms >> 16) & 0xFF;
+  frame[6] = (ms >> 24) & 0xFF;
+  frame[7] = mm & 0xFF;
+  frame[8] = mm >> 8;
+  frame[9] = flags;
+
+  uint8_t sum = 0;
+  for (int i = 1; i < 10; i++) {
+    sum += frame[i];
+  }
+  frame[10] = sum;
+
+  Serial.write(frame, sizeof(frame));
+  frameSeq++;
+}
+
 void sendData(int distance) {
+  if (binaryMode) {
+    sendBinaryFrame(distance, 0x00, measuredAt);
+    return;
+  }
   if (USE_GAME_FORMAT) {
     // 게임 프로젝트 호환 형식
     if (USE_JSON_FORMAT) {
@@ -131,11 +170,15 @@ void sendData(int distance) {
 }
 
 void sendNearSignal() {
+  if (binaryMode) {
+    sendBinaryFrame(distance, 0x01, measuredAt);
+    return;
+  }
   if (USE_GAME_FORMAT) {
     // 게임 프로젝트 호환 형식
     if (USE_JSON_FORMAT) {
-      // JSON 형식: {"near": true, "cm": 4}
-      String jsonData = "{\"near\": true, \"cm\": " + String(distance) + "}";
+      // JSON 형식: {"near": true, "cm": 4, "ms": 12345} (ms = 측정 시각, 호스트 시계 동기화용)
+      String jsonData = "{\"near\": true, \"cm\": " + String(distance) + ", \"ms\": " + String(measuredAt) + "}";
       Serial.println(jsonData);
       Serial.flush(); // 버퍼 즉시 전송
     } else {
@@ -156,23 +199,36 @@ void sendNearSignal() {
   }
 }
 
+// 명령 응답 (텍스트 한 줄) - 바이너리 모드에서는 보내지 않음
+// (프레임 사이에 JSON 줄이 끼면 호스트 디코더가 건너뛰고 동기를 다시 맞춰야 함)
+void sendReply(String line) {
+  if (binaryMode) {
+    return;
+  }
+  Serial.println(line);
+}
+
 void handleCommand(String command) {
   if (command == "ping") {
-    if (USE_JSON_FORMAT) {
-      Serial.println("{\"status\": \"pong\", \"message\": \"Arduino is alive\"}");
+    // 응답에 현재 millis()를 담아 호스트가 왕복 시간으로 시계를 맞춤 (core/clock_sync.py)
+    if (binaryMode) {
+      sendBinaryFrame(-1, 0x02, millis());
+    } else if (USE_JSON_FORMAT) {
+      Serial.println("{\"status\": \"pong\", \"ms\": " + String(millis()) + ", \"message\": \"Arduino is alive\"}");
     } else {
       Serial.println("pong");
     }
   }
   else if (command == "status") {
     if (USE_JSON_FORMAT) {
-      Serial.println("{\"status\": \"running\", \"sensor\": \"HC-SR04\", \"interval\": " + String(MEASURE_INTERVAL) + ", \"format\": \"game\"}");
+      sendReply("{\"status\": \"running\", \"sensor\": \"HC-SR04\", \"interval\": " + String(measureInterval) + ", \"format\": \"" + String(binaryMode ? "binary" : "game") + "\"}");
     } else {
-      Serial.println("status: running, interval: " + String(MEASURE_INTERVAL) + "ms");
+      sendReply("status: running, interval: " + String(measureInterval) + "ms");
     }
   }
   else if (command == "measure") {
     int dist = measureDistance();
+    measuredAt = millis();
     sendData(dist);
   }
   else if (command == "near") {
@@ -180,42 +236,53 @@ void handleCommand(String command) {
   }
   else if (command.startsWith("interval:")) {
     int newInterval = command.substring(9).toInt();
-    if (newInterval >= 50 && newInterval <= 5000) {
-      
+    if (newInterval >= 20 && newInterval <= 5000) {
+      measureInterval = newInterval;
       if (USE_JSON_FORMAT) {
-        Serial.println("{\"status\": \"updated\", \"interval\": " + String(MEASURE_INTERVAL) + "}");
+        sendReply("{\"status\": \"updated\", \"interval\": " + String(measureInterval) + "}");
       } else {
-        Serial.println("interval updated: " + String(MEASURE_INTERVAL) + "ms");
+        sendReply("interval updated: " + String(measureInterval) + "ms");
       }
     } else {
       if (USE_JSON_FORMAT) {
-        Serial.println("{\"status\": \"error\", \"message\": \"Invalid interval (50-5000ms)\"}");
+        sendReply("{\"status\": \"error\", \"message\": \"Invalid interval (20-5000ms)\"}");
       } else {
-        Serial.println("error: invalid interval");
+        sendReply("error: invalid interval");
       }
     }
   }
+  else if (command == "format:binary") {
+    // 응답은 텍스트 한 줄로 보내고, 그 다음 바이트부터 바이너리 프레임
+    Serial.println("{\"status\": \"updated\", \"format\": \"binary\"}");
+    Serial.flush();
+    frameSeq = 0;
+    binaryMode = true;
+  }
+  else if (command == "format:text") {
+    binaryMode = false;
+    Serial.println("{\"status\": \"updated\", \"format\": \"text\"}");
+  }
   else if (command == "format:game") {
     
     if (USE_JSON_FORMAT) {
-      Serial.println("{\"status\": \"updated\", \"format\": \"game\"}");
+      sendReply("{\"status\": \"updated\", \"format\": \"game\"}");
     } else {
-      Serial.println("format: game");
+      sendReply("format: game");
     }
   }
   else if (command == "format:test") {
     
     if (USE_JSON_FORMAT) {
-      Serial.println("{\"status\": \"updated\", \"format\": \"test\"}");
+      sendReply("{\"status\": \"updated\", \"format\": \"test\"}");
     } else {
-      Serial.println("format: test");
+      sendReply("format: test");
     }
   }
   else {
     if (USE_JSON_FORMAT) {
-      Serial.println("{\"status\": \"error\", \"message\": \"Unknown command: " + command + "\"}");
+      sendReply("{\"status\": \"error\", \"message\": \"Unknown command: " + command + "\"}");
     } else {
-      Serial.println("error: unknown command");
+      sendReply("error: unknown command");
     }
   }
 }